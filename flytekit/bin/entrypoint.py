@@ -1,6 +1,7 @@
 import asyncio
 import contextlib
 import datetime as _datetime
+import functools
 import inspect
 import os
 import pathlib
@@ -19,18 +20,21 @@ from flytekit.configuration import (
     SerializationSettings,
     StatsConfig,
 )
+from flytekit.configuration.internal import LocalSDK
 from flytekit.core import constants as _constants
 from flytekit.core import utils
 from flytekit.core.array_node_map_task import ArrayNodeMapTaskResolver
 from flytekit.core.base_task import IgnoreOutputs, PythonTask
-from flytekit.core.checkpointer import SyncCheckpoint
+from flytekit.core.checkpointer import AsyncCheckpoint, SyncCheckpoint
 from flytekit.core.context_manager import ExecutionParameters, ExecutionState, FlyteContext, FlyteContextManager
 from flytekit.core.data_persistence import FileAccessProvider
 from flytekit.core.map_task import MapTaskResolver
+from flytekit.core.profiler import profile_task
 from flytekit.core.promise import VoidPromise
 from flytekit.deck.deck import _output_deck
 from flytekit.exceptions import scopes as _scoped_exceptions
 from flytekit.exceptions import scopes as _scopes
+from flytekit.interfaces.stats.client import flush as _flush_stats
 from flytekit.interfaces.stats.taggable import get_stats as _get_stats
 from flytekit.loggers import entrypoint_logger as logger
 from flytekit.loggers import user_space_logger
@@ -65,6 +69,28 @@ def _compute_array_job_index():
     return offset
 
 
+def _profiled(dispatch_execute):
+    """
+    Records the spans of the task execution, if profiling is enabled, and exports them once it is done.
+    """
+
+    @functools.wraps(dispatch_execute)
+    def wrapper(ctx: FlyteContext, task_def: PythonTask, inputs_path: str, output_prefix: str):
+        profile = None
+        try:
+            with profile_task(task_def.name) as profile:
+                return dispatch_execute(ctx, task_def, inputs_path, output_prefix)
+        finally:
+            if profile is not None:
+                try:
+                    profile.export(ctx.file_access, output_prefix, ctx.user_space_params.stats)
+                except Exception as e:
+                    logger.error(f"Failed to export the profile of the task with error {e}.")
+
+    return wrapper
+
+
+@_profiled
 def _dispatch_execute(
     ctx: FlyteContext,
     task_def: PythonTask,
@@ -84,10 +110,11 @@ def _dispatch_execute(
     logger.debug(f"Starting _dispatch_execute for {task_def.name}")
     try:
         # Step1
-        local_inputs_file = os.path.join(ctx.execution_state.working_dir, "inputs.pb")
-        ctx.file_access.get_data(inputs_path, local_inputs_file)
-        input_proto = utils.load_proto_from_file(_literals_pb2.LiteralMap, local_inputs_file)
-        idl_input_literals = _literal_models.LiteralMap.from_flyte_idl(input_proto)
+        with utils.timeit("Download inputs"):
+            local_inputs_file = os.path.join(ctx.execution_state.working_dir, "inputs.pb")
+            ctx.file_access.get_data(inputs_path, local_inputs_file)
+            input_proto = utils.load_proto_from_file(_literals_pb2.LiteralMap, local_inputs_file)
+            idl_input_literals = _literal_models.LiteralMap.from_flyte_idl(input_proto)
 
         # Step2
         # Decorate the dispatch execute function before calling it, this wraps all exceptions into one
@@ -163,14 +190,16 @@ def _dispatch_execute(
         logger.error(exc_str)
         logger.error("!! End Error Captured by Flyte !!")
 
-    for k, v in output_file_dict.items():
-        utils.write_proto_to_file(v.to_flyte_idl(), os.path.join(ctx.execution_state.engine_dir, k))
+    with utils.timeit("Upload outputs"):
+        for k, v in output_file_dict.items():
+            utils.write_proto_to_file(v.to_flyte_idl(), os.path.join(ctx.execution_state.engine_dir, k))
 
-    ctx.file_access.put_data(ctx.execution_state.engine_dir, output_prefix, is_multipart=True)
+        ctx.file_access.put_data(ctx.execution_state.engine_dir, output_prefix, is_multipart=True)
     logger.info(f"Engine folder written successfully to the output prefix {output_prefix}")
 
     if not getattr(task_def, "disable_deck", True):
-        _output_deck(task_def.name.split(".")[-1], ctx.user_space_params)
+        with utils.timeit("Write deck"):
+            _output_deck(task_def.name.split(".")[-1], ctx.user_space_params)
 
     logger.debug("Finished _dispatch_execute")
 
@@ -236,7 +265,8 @@ def setup_execution(
 
     checkpointer = None
     if checkpoint_path is not None:
-        checkpointer = SyncCheckpoint(checkpoint_dest=checkpoint_path, checkpoint_src=prev_checkpoint)
+        checkpoint_type = AsyncCheckpoint if LocalSDK.ASYNC_CHECKPOINT.read() else SyncCheckpoint
+        checkpointer = checkpoint_type(checkpoint_dest=checkpoint_path, checkpoint_src=prev_checkpoint)
         logger.debug(f"Checkpointer created with source {prev_checkpoint} and dest {checkpoint_path}")
 
     execution_parameters = ExecutionParameters(
@@ -297,8 +327,18 @@ def setup_execution(
             )
         cb = cb.with_serialization_settings(ssb.build())
 
-    with FlyteContextManager.with_context(cb) as ctx:
-        yield ctx
+    try:
+        with FlyteContextManager.with_context(cb) as ctx:
+            yield ctx
+    finally:
+        # The last checkpoint is uploaded even if the task failed, so that a retry can restore it
+        if isinstance(checkpointer, AsyncCheckpoint):
+            try:
+                checkpointer.wait()
+            except Exception as e:
+                logger.error(f"Failed to upload the last checkpoint with error {e}.")
+    # Send the metrics the task emitted before the process exits
+    _flush_stats()
 
 
 def _handle_annotated_task(
@@ -504,6 +544,16 @@ def execute_task_cmd(
     )
 
 
+def _fast_task_execute_cmd(task_execute_cmd: List[str], additional_distribution: str, dest_dir: str) -> List[str]:
+    # Insert the call to fast before the unbounded resolver args
+    cmd = []
+    for arg in task_execute_cmd:
+        if arg == "--resolver":
+            cmd.extend(["--dynamic-addl-distro", additional_distribution, "--dynamic-dest-dir", dest_dir])
+        cmd.append(arg)
+    return cmd
+
+
 @_pass_through.command("pyflyte-fast-execute")
 @_click.option("--additional-distribution", required=False)
 @_click.option("--dest-dir", required=False)
@@ -518,12 +568,7 @@ def fast_execute_task_cmd(additional_distribution: str, dest_dir: str, task_exec
             dest_dir = os.getcwd()
         _download_distribution(additional_distribution, dest_dir)
 
-    # Insert the call to fast before the unbounded resolver args
-    cmd = []
-    for arg in task_execute_cmd:
-        if arg == "--resolver":
-            cmd.extend(["--dynamic-addl-distro", additional_distribution, "--dynamic-dest-dir", dest_dir])
-        cmd.append(arg)
+    cmd = _fast_task_execute_cmd(task_execute_cmd, additional_distribution, dest_dir)
 
     # Use the commandline to run the task execute command rather than calling it directly in python code
     # since the current runtime bytecode references the older user code, rather than the downloaded distribution.
@@ -0,0 +1,290 @@
+"""
+A long lived worker that runs ``pyflyte-execute``, ``pyflyte-map-execute`` and ``pyflyte-fast-execute`` invocations
+in warm processes, for short tasks where starting the interpreter, importing flytekit and the user's modules and
+downloading the code distribution take longer than the task itself.
+
+``pyflyte-worker --socket /tmp/flyte.sock`` imports flytekit and the ``--preload`` modules once, then forks
+``--concurrency`` processes that accept invocations on the unix socket. Each connection sends one invocation as a
+line of json with the arguments of the command and the environment variables to run it with, e.g.
+``{"args": ["pyflyte-execute", "--inputs", ...], "env": {"FLYTE_INTERNAL_EXECUTION_ID": ...}}``, and receives
+``{"exit_code": 0}`` once the task finished. :py:func:`submit` sends an invocation from python.
+
+Every invocation runs in its own FlyteContext and a new temporary working directory, the code distribution of
+``pyflyte-fast-execute`` invocations is only added to ``sys.path``. Processes are replaced by fresh forks after
+``--max-tasks`` invocations, once their peak resident memory exceeds ``--max-memory``, or when they are sent the code
+distribution of another fast registration than the one they imported.
+"""
+
+import importlib
+import json
+import os
+import resource
+import shutil
+import signal
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+import traceback
+import typing
+
+import click as _click
+
+from flytekit.bin.entrypoint import (
+    _fast_task_execute_cmd,
+    _pass_through,
+    fast_execute_task_cmd,
+    get_version_message,
+)
+from flytekit.interfaces.random import random as flyte_random
+from flytekit.loggers import entrypoint_logger as logger
+from flytekit.tools.fast_registration import download_distribution as _download_distribution
+from flytekit.tools.module_loader import add_sys_path
+
+_TASK_COMMANDS = {"pyflyte-execute", "pyflyte-map-execute"}
+_FAST_COMMAND = "pyflyte-fast-execute"
+# Workers that exit sooner than this after they were forked are forked again with an increasing delay
+_MIN_WORKER_LIFETIME = 1.0
+_MAX_RESPAWN_DELAY = 30.0
+
+
+def _peak_rss() -> int:
+    """
+    Returns the peak resident memory of the current process in bytes.
+    """
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in kilobytes on linux and in bytes on macOS
+    return rss if sys.platform == "darwin" else rss * 1024
+
+
+class TaskWorker(object):
+    """
+    Runs task invocations one after the other in the current process, keeping the modules they import loaded.
+    """
+
+    def __init__(self, max_tasks: typing.Optional[int] = None, max_memory: typing.Optional[int] = None):
+        """
+        :param max_tasks: The number of invocations after which the process should be replaced.
+        :param max_memory: The peak resident memory in bytes after which the process should be replaced.
+        """
+        self._max_tasks = max_tasks
+        self._max_memory = max_memory
+        self._tasks = 0
+        # The fast registration distribution imported by this process and where it was downloaded to
+        self._distribution: typing.Optional[typing.Tuple[str, str]] = None
+        self._code_dir: typing.Optional[str] = None
+        self.recycle = False
+
+    def execute(self, args: typing.List[str], env: typing.Optional[typing.Dict[str, str]] = None) -> int:
+        """
+        Runs one invocation of ``pyflyte-execute``, ``pyflyte-map-execute`` or ``pyflyte-fast-execute`` and returns
+        the exit code the command would have exited with.
+
+        :param args: The command and its arguments, as in the container of the task.
+        :param env: The environment variables to set while the task runs.
+        """
+        if not args or os.path.basename(args[0]) not in _TASK_COMMANDS | {_FAST_COMMAND}:
+            raise ValueError(
+                f"Expected a pyflyte-execute, pyflyte-map-execute or pyflyte-fast-execute command, got {args}"
+            )
+        self._tasks += 1
+        try:
+            if os.path.basename(args[0]) == _FAST_COMMAND:
+                return self._fast_execute(args, env or {})
+            return self._run(args, env or {})
+        finally:
+            if self._max_tasks and self._tasks >= self._max_tasks:
+                self.recycle = True
+            if self._max_memory and _peak_rss() > self._max_memory:
+                logger.info(f"Peak memory {_peak_rss()} exceeds {self._max_memory} bytes, replacing the worker")
+                self.recycle = True
+
+    def _fast_execute(self, args: typing.List[str], env: typing.Dict[str, str]) -> int:
+        try:
+            with fast_execute_task_cmd.make_context(_FAST_COMMAND, list(args[1:])) as ctx:
+                params = ctx.params
+        except _click.ClickException as e:
+            e.show()
+            return e.exit_code
+        additional_distribution = params["additional_distribution"]
+        dest_dir = params["dest_dir"]
+        if dest_dir is None:
+            if self._code_dir is None:
+                self._code_dir = tempfile.mkdtemp(prefix="flyte-worker-code-")
+            dest_dir = self._code_dir
+
+        if additional_distribution is not None:
+            distribution = (additional_distribution, dest_dir)
+            if self._distribution is None:
+                _download_distribution(additional_distribution, dest_dir)
+                self._distribution = distribution
+            elif self._distribution != distribution:
+                # The modules of another distribution are imported already, so run this one in a new process the
+                # way pyflyte-fast-execute does, and let a fresh worker take over afterwards.
+                self.recycle = True
+                return subprocess.run(list(args), env={**os.environ, **env}).returncode
+
+        cmd = _fast_task_execute_cmd(params["task_execute_cmd"], additional_distribution, dest_dir)
+        with add_sys_path(dest_dir):
+            return self._run(cmd, env)
+
+    def _run(self, args: typing.List[str], env: typing.Dict[str, str]) -> int:
+        command = os.path.basename(args[0])
+        if command not in _TASK_COMMANDS:
+            raise ValueError(f"Expected a pyflyte-execute or pyflyte-map-execute command, got {args}")
+        work_dir = tempfile.mkdtemp(prefix="flyte-worker-")
+        saved_env, saved_cwd = os.environ.copy(), os.getcwd()
+        os.environ.update(env)
+        os.chdir(work_dir)
+        try:
+            _pass_through.main(args=[command, *args[1:]], prog_name=command, standalone_mode=False)
+            return 0
+        except SystemExit as e:
+            if e.code is None or isinstance(e.code, int):
+                return e.code or 0
+            return 1
+        except _click.ClickException as e:
+            e.show()
+            return e.exit_code
+        except Exception:
+            logger.error(f"Task invocation {args} failed:\n{traceback.format_exc()}")
+            return 1
+        finally:
+            os.chdir(saved_cwd)
+            os.environ.clear()
+            os.environ.update(saved_env)
+            shutil.rmtree(work_dir, ignore_errors=True)
+
+    def serve(self, sock: socket.socket):
+        """
+        Runs the invocations sent to the listening socket until the process should be replaced.
+        """
+        while not self.recycle:
+            conn, _ = sock.accept()
+            with conn, conn.makefile("rwb") as f:
+                try:
+                    request = json.loads(f.readline())
+                    exit_code = self.execute(request["args"], request.get("env"))
+                except (ValueError, KeyError, TypeError) as e:
+                    logger.error(f"Invalid task invocation: {e}")
+                    exit_code = 2
+                f.write(json.dumps({"exit_code": exit_code}).encode("utf-8") + b"\n")
+                f.flush()
+        logger.info(f"Worker {os.getpid()} ran {self._tasks} tasks, replacing it")
+
+
+def _respawn_delay(lifetime: float, previous_delay: float) -> float:
+    """
+    Returns how long to wait before forking a worker again after one exited, doubling the delay for every worker that
+    exits right after it was forked, e.g. because it fails to start.
+    """
+    if lifetime >= _MIN_WORKER_LIFETIME:
+        return 0.0
+    return min(_MAX_RESPAWN_DELAY, max(0.1, previous_delay * 2))
+
+
+def serve(
+    address: str,
+    concurrency: int = 1,
+    max_tasks: typing.Optional[int] = None,
+    max_memory: typing.Optional[int] = None,
+    preload: typing.Iterable[str] = (),
+):
+    """
+    Listens on the unix socket and keeps ``concurrency`` worker processes forked from the current one running.
+
+    :param address: The path of the unix socket to listen on.
+    :param concurrency: The number of invocations to run at the same time, each in its own process.
+    :param max_tasks: The number of invocations after which a worker process is replaced.
+    :param max_memory: The peak resident memory in bytes after which a worker process is replaced.
+    :param preload: Modules to import before forking, so that the worker processes share them.
+    """
+    # Workers change their working directory for every invocation, so relative paths stop pointing to the same place
+    sys.path[:] = [os.path.abspath(p) for p in sys.path]
+    for module in preload:
+        importlib.import_module(module)
+
+    if os.path.exists(address):
+        os.unlink(address)
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    sock.bind(address)
+    sock.listen(max(16, concurrency))
+    logger.info(f"Listening on {address} with {concurrency} workers")
+
+    # The time every worker process was forked at, by pid
+    workers: typing.Dict[int, float] = {}
+
+    def handle_sigterm(signum, frame):
+        for pid in workers:
+            os.kill(pid, signum)
+        sys.exit(0)
+
+    signal.signal(signal.SIGTERM, handle_sigterm)
+    delay = 0.0
+    try:
+        while True:
+            while len(workers) < concurrency:
+                pid = os.fork()
+                if pid == 0:
+                    signal.signal(signal.SIGTERM, signal.SIG_DFL)
+                    # Forks share the state of flytekit's random generator, which names the local and remote paths
+                    flyte_random.seed()
+                    exit_code = 0
+                    try:
+                        TaskWorker(max_tasks, max_memory).serve(sock)
+                    except BaseException:
+                        logger.error(f"Worker {os.getpid()} failed:\n{traceback.format_exc()}")
+                        exit_code = 1
+                    finally:
+                        os._exit(exit_code)
+                workers[pid] = time.monotonic()
+            pid, _ = os.wait()
+            forked_at = workers.pop(pid, None)
+            if forked_at is not None:
+                delay = _respawn_delay(time.monotonic() - forked_at, delay)
+                if delay:
+                    logger.warning(f"Worker {pid} exited right after it started, forking again in {delay}s")
+                    time.sleep(delay)
+    finally:
+        sock.close()
+        if os.path.exists(address):
+            os.unlink(address)
+
+
+def submit(address: str, args: typing.List[str], env: typing.Optional[typing.Dict[str, str]] = None) -> int:
+    """
+    Sends a task invocation to the worker listening on the unix socket, and returns its exit code once it finished.
+    """
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.connect(address)
+        with sock.makefile("rwb") as f:
+            f.write(json.dumps({"args": list(args), "env": env or {}}).encode("utf-8") + b"\n")
+            f.flush()
+            return json.loads(f.readline())["exit_code"]
+
+
+@_click.command("pyflyte-worker")
+@_click.option("--socket", "address", required=True, help="The path of the unix socket to listen on.")
+@_click.option("--concurrency", type=int, default=1, help="The number of tasks to run at the same time.")
+@_click.option("--max-tasks", type=int, required=False, help="Replace worker processes after this many tasks.")
+@_click.option(
+    "--max-memory",
+    type=int,
+    required=False,
+    help="Replace worker processes once their peak resident memory exceeds this many megabytes.",
+)
+@_click.option("--preload", multiple=True, help="Modules to import once, before the worker processes are forked.")
+def worker_cmd(address, concurrency, max_tasks, max_memory, preload):
+    logger.info(get_version_message())
+    serve(
+        address,
+        concurrency=concurrency,
+        max_tasks=max_tasks,
+        max_memory=max_memory * 1024 * 1024 if max_memory else None,
+        preload=preload,
+    )
+
+
+if __name__ == "__main__":
+    worker_cmd()
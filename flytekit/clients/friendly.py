@@ -15,6 +15,7 @@ from flyteidl.admin import workflow_pb2 as _workflow_pb2
 from flyteidl.service import dataproxy_pb2 as _data_proxy_pb2
 from google.protobuf.duration_pb2 import Duration
 
+from flytekit.clients import helpers as _helpers
 from flytekit.clients.raw import RawSynchronousFlyteClient as _RawSynchronousFlyteClient
 from flytekit.models import common as _common
 from flytekit.models import execution as _execution
@@ -49,6 +50,82 @@ class SynchronousFlyteClient(_RawSynchronousFlyteClient):
         """
         return super(SynchronousFlyteClient, self)
 
+    ####################################################################################################################
+    #
+    #  Pagination Helpers
+    #
+    ####################################################################################################################
+
+    def iterate_paginated(
+        self,
+        list_method: typing.Callable,
+        *args,
+        limit: typing.Optional[int] = None,
+        page_size: int = _helpers.DEFAULT_PAGE_SIZE,
+        prefetch: bool = True,
+        **kwargs,
+    ) -> typing.Iterator:
+        """
+        Iterates over every entry returned by one of the ``*_paginated`` methods of this client, following page tokens
+        until the listing is exhausted or ``limit`` entries have been returned. The next page is prefetched in the
+        background while the current one is being consumed. ::
+
+            for e in client.iterate_paginated(client.list_executions_paginated, "flytesnacks", "development"):
+                ...
+
+        :param list_method: A bound paginated list method of this client, e.g. ``client.list_tasks_paginated``.
+        :param args: Positional arguments passed through to ``list_method``.
+        :param int limit: [Optional] The maximum number of entries to return across all pages.
+        :param int page_size: The number of entries to request per page.
+        :param bool prefetch: Whether to fetch the next page while the current one is consumed.
+        :param kwargs: Keyword arguments passed through to ``list_method``, e.g. ``filters`` or ``sort_by``.
+        """
+
+        def _fetch_page(num_to_fetch, token):
+            return list_method(*args, limit=num_to_fetch, token=token, **kwargs)
+
+        return _helpers.iterate_paginated(_fetch_page, limit=limit, page_size=page_size, prefetch=prefetch)
+
+    def iterate_executions_across(
+        self,
+        project_domains: typing.Iterable[typing.Tuple[str, str]],
+        limit_per_project_domain: typing.Optional[int] = None,
+        page_size: int = _helpers.DEFAULT_PAGE_SIZE,
+        max_workers: int = 8,
+        filters=None,
+        sort_by=None,
+    ) -> typing.Iterator[typing.Tuple[typing.Tuple[str, str], _execution.Execution]]:
+        """
+        Lists the executions of several project and domain pairs concurrently. Entries are yielded as
+        ``((project, domain), execution)`` tuples as their pages arrive, so the order across pairs is not defined.
+
+        :param project_domains: The (project, domain) pairs to list executions for.
+        :param int limit_per_project_domain: [Optional] The maximum number of executions to return per pair.
+        :param int page_size: The number of entries to request per page.
+        :param int max_workers: The maximum number of pairs listed at the same time.
+        :param list[flytekit.models.filters.Filter] filters: [Optional] Filters applied to every listing.
+        :param flytekit.models.admin.common.Sort sort_by: [Optional] If provided, the results within each pair will be
+            sorted.
+        """
+
+        def _fetch_page_for(project_domain):
+            project, domain = project_domain
+
+            def _fetch_page(num_to_fetch, token):
+                return self.list_executions_paginated(
+                    project, domain, limit=num_to_fetch, token=token, filters=filters, sort_by=sort_by
+                )
+
+            return _fetch_page
+
+        return _helpers.iterate_paginated_concurrently(
+            _fetch_page_for,
+            project_domains,
+            limit_per_scope=limit_per_project_domain,
+            page_size=page_size,
+            max_workers=max_workers,
+        )
+
     ####################################################################################################################
     #
     #  Task Endpoints
@@ -1,3 +1,145 @@
+import queue
+import threading
+import typing
+from concurrent.futures import ThreadPoolExecutor
+
+DEFAULT_PAGE_SIZE = 100
+
+T = typing.TypeVar("T")
+S = typing.TypeVar("S")
+
+# A page fetcher takes the page size and the token of the page to fetch, and returns the entries in that page along
+# with the token of the next page (empty if this was the last page).
+PageFetcher = typing.Callable[[int, str], typing.Tuple[typing.List[T], str]]
+
+_SENTINEL = object()
+
+
+def iterate_paginated(
+    fetch_page: PageFetcher,
+    limit: typing.Optional[int] = None,
+    page_size: int = DEFAULT_PAGE_SIZE,
+    prefetch: bool = True,
+) -> typing.Iterator[T]:
+    """
+    This returns a generator over all entries of a paginated list API.
+
+    When ``prefetch`` is set, the request for the next page is issued on a background thread as soon as the token for it
+    is known, so that the next page is in flight while the entries of the current page are being consumed.
+
+    :param fetch_page: Callable taking ``(limit, token)`` and returning ``(entries, next_token)``
+    :param int limit: The maximum number of elements to retrieve
+    :param int page_size: The number of elements to request per page
+    :param bool prefetch: Whether to fetch the next page while the current one is consumed
+    """
+    if page_size <= 0:
+        raise ValueError(f"page_size must be greater than 0, got {page_size}")
+    num_to_fetch = page_size
+    if limit is not None:
+        if limit <= 0:
+            return
+        num_to_fetch = min(limit, page_size)
+
+    executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="flyte-page-prefetch") if prefetch else None
+    try:
+        entries, next_token = fetch_page(num_to_fetch, "")
+        counter = 0
+        while True:
+            next_page = None
+            if next_token and (limit is None or counter + len(entries) < limit):
+                if executor is not None:
+                    next_page = executor.submit(fetch_page, num_to_fetch, next_token)
+            for e in entries:
+                counter += 1
+                if limit is not None and counter > limit:
+                    return
+                yield e
+            if not next_token or (limit is not None and counter >= limit):
+                return
+            if next_page is not None:
+                entries, next_token = next_page.result()
+            else:
+                entries, next_token = fetch_page(num_to_fetch, next_token)
+    finally:
+        if executor is not None:
+            executor.shutdown(wait=False)
+
+
+def iterate_paginated_concurrently(
+    fetch_page_for: typing.Callable[[S], PageFetcher],
+    scopes: typing.Iterable[S],
+    limit_per_scope: typing.Optional[int] = None,
+    page_size: int = DEFAULT_PAGE_SIZE,
+    max_workers: int = 8,
+    max_buffered_pages: int = 64,
+) -> typing.Iterator[typing.Tuple[S, T]]:
+    """
+    This returns a generator that lists several scopes (for instance project/domain pairs) of a paginated API
+    concurrently. Entries are yielded as ``(scope, entry)`` tuples in the order their pages arrive, so entries of the
+    same scope keep their relative order but scopes are interleaved.
+
+    :param fetch_page_for: Callable returning the page fetcher (see :py:func:`iterate_paginated`) for a scope
+    :param scopes: The scopes to list
+    :param int limit_per_scope: The maximum number of elements to retrieve per scope
+    :param int page_size: The number of elements to request per page
+    :param int max_workers: The maximum number of scopes listed at the same time
+    :param int max_buffered_pages: Bounds the number of fetched but not yet consumed pages
+    """
+    scopes = list(scopes)
+    if not scopes:
+        return
+    pages: queue.Queue = queue.Queue(maxsize=max_buffered_pages)
+    stop = threading.Event()
+
+    def _put(item) -> bool:
+        while not stop.is_set():
+            try:
+                pages.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _drain(scope):
+        try:
+            fetch_page = fetch_page_for(scope)
+            counter = 0
+            token = ""
+            while not stop.is_set():
+                num_to_fetch = page_size if limit_per_scope is None else min(page_size, limit_per_scope - counter)
+                if num_to_fetch <= 0:
+                    break
+                entries, token = fetch_page(num_to_fetch, token)
+                entries = entries[:num_to_fetch]
+                counter += len(entries)
+                if entries and not _put((scope, entries, None)):
+                    return
+                if not token:
+                    break
+        except BaseException as e:  # noqa
+            _put((scope, None, e))
+            return
+        _put((scope, _SENTINEL, None))
+
+    executor = ThreadPoolExecutor(max_workers=min(max_workers, len(scopes)), thread_name_prefix="flyte-page-fanout")
+    try:
+        for s in scopes:
+            executor.submit(_drain, s)
+        remaining = len(scopes)
+        while remaining:
+            scope, entries, exc = pages.get()
+            if exc is not None:
+                raise exc
+            if entries is _SENTINEL:
+                remaining -= 1
+                continue
+            for e in entries:
+                yield scope, e
+    finally:
+        stop.set()
+        executor.shutdown(wait=False)
+
+
 def iterate_node_executions(
     client,
     workflow_execution_identifier=None,
@@ -5,6 +147,7 @@ def iterate_node_executions(
     limit=None,
     filters=None,
     unique_parent_id=None,
+    page_size=DEFAULT_PAGE_SIZE,
 ):
     """
     This returns a generator for node executions.
@@ -13,65 +156,46 @@ def iterate_node_executions(
     :param flytekit.models.core.identifier.TaskExecutionIdentifier task_execution_identifier:
     :param int limit: The maximum number of elements to retrieve
     :param list[flytekit.models.filters.Filter] filters:
+    :param int page_size: The number of elements to request per page
     :rtype: Iterator[flytekit.models.node_execution.NodeExecution]
     """
-    token = ""
-    num_to_fetch = 100
-    if limit is not None and limit < num_to_fetch:
-        num_to_fetch = limit
-    counter = 0
-    while True:
+
+    def _fetch_page(num_to_fetch, token):
         if workflow_execution_identifier is not None:
-            node_execs, next_token = client.list_node_executions(
+            return client.list_node_executions(
                 workflow_execution_identifier=workflow_execution_identifier,
                 limit=num_to_fetch,
                 token=token,
                 filters=filters,
                 unique_parent_id=unique_parent_id,
             )
-        else:
-            node_execs, next_token = client.list_node_executions_for_task_paginated(
-                task_execution_identifier=task_execution_identifier,
-                limit=num_to_fetch,
-                token=token,
-                filters=filters,
-            )
-        for n in node_execs:
-            counter += 1
-            if limit is not None and counter > limit:
-                return
-            yield n
-        if not next_token:
-            break
-        token = next_token
+        return client.list_node_executions_for_task_paginated(
+            task_execution_identifier=task_execution_identifier,
+            limit=num_to_fetch,
+            token=token,
+            filters=filters,
+        )
 
+    return iterate_paginated(_fetch_page, limit=limit, page_size=page_size)
 
-def iterate_task_executions(client, node_execution_identifier, limit=None, filters=None):
+
+def iterate_task_executions(client, node_execution_identifier, limit=None, filters=None, page_size=DEFAULT_PAGE_SIZE):
     """
     This returns a generator for task executions, given a node execution identifier
     :param flytekit.clients.friendly.SynchronousFlyteClient client:
     :param flytekit.models.core.identifier.NodeExecutionIdentifier node_execution_identifier:
     :param int limit: The maximum number of elements to retrieve
     :param list[flytekit.models.filters.Filter] filters:
+    :param int page_size: The number of elements to request per page
     :rtype: Iterator[flytekit.models.admin.task_execution.TaskExecution]
     """
-    token = ""
-    num_to_fetch = 100
-    if limit is not None and limit < num_to_fetch:
-        num_to_fetch = limit
-    counter = 0
-    while True:
-        task_execs, next_token = client.list_task_executions_paginated(
+
+    def _fetch_page(num_to_fetch, token):
+        return client.list_task_executions_paginated(
             node_execution_identifier=node_execution_identifier,
             limit=num_to_fetch,
             token=token,
             filters=filters,
         )
-        for t in task_execs:
-            counter += 1
-            if limit is not None and counter > limit:
-                return
-            yield t
-        if not next_token:
-            break
-        token = next_token
+
+    return iterate_paginated(_fetch_page, limit=limit, page_size=page_size)
@@ -0,0 +1,137 @@
+"""
+An on-disk catalog of the launch plans of a Flyte deployment, so that ``pyflyte run remote-launchplan`` can list launch
+plans and build the options of their inputs, e.g. when completing the command line, without asking FlyteAdmin every
+time.
+
+The names of the launch plans of a project and domain are listed again once they are older than
+``FLYTE_SDK_REMOTE_CATALOG_TTL`` seconds. The spec and interface of a launch plan are kept together with its version.
+Once they are older than the TTL, or before the launch plan is executed, only the latest version of the launch plan
+is looked up, and the launch plan is fetched again only if that version changed.
+"""
+
+import base64
+import hashlib
+import os
+import time
+import typing
+
+from flyteidl.admin import launch_plan_pb2
+from flyteidl.core import interface_pb2
+
+from flytekit.configuration.internal import LocalSDK
+from flytekit.models.core.identifier import Identifier, ResourceType
+from flytekit.models.interface import TypedInterface
+from flytekit.models.launch_plan import LaunchPlanSpec
+from flytekit.remote import FlyteLaunchPlan, FlyteRemote
+from flytekit.remote.remote import _get_latest_version
+from flytekit.tools.json_cache import read_json, write_json
+
+# Location on the filesystem where the catalogs are stored
+CATALOG_LOCATION = "~/.flyte/catalog"
+DEFAULT_TTL = 300
+
+
+class LaunchPlanCatalog(object):
+    """
+    The launch plans of one project and domain of a Flyte deployment.
+    """
+
+    def __init__(
+        self,
+        endpoint: str,
+        project: str,
+        domain: str,
+        ttl: typing.Optional[int] = None,
+        location: str = CATALOG_LOCATION,
+    ):
+        if ttl is None:
+            ttl = LocalSDK.REMOTE_CATALOG_TTL.read()
+        self._ttl = DEFAULT_TTL if ttl is None else ttl
+        self._project = project
+        self._domain = domain
+        key = hashlib.sha256(f"{endpoint}/{project}/{domain}".encode("utf-8")).hexdigest()
+        self._path = os.path.join(os.path.expanduser(location), f"{key}.json")
+
+    @property
+    def enabled(self) -> bool:
+        return self._ttl > 0
+
+    def _load(self) -> typing.Dict[str, typing.Any]:
+        if not self.enabled:
+            return {}
+        return read_json(self._path)
+
+    def _update(self, key: str, name: typing.Optional[str], entry: typing.Dict[str, typing.Any]):
+        if not self.enabled:
+            return
+        data = self._load()
+        if name is None:
+            data[key] = entry
+        else:
+            data.setdefault(key, {})[name] = entry
+        write_json(self._path, data)
+
+    def _is_fresh(self, entry: typing.Dict[str, typing.Any]) -> bool:
+        return time.time() - entry["fetched_at"] < self._ttl
+
+    def cached_names(self, limit: int) -> typing.List[str]:
+        """
+        Returns the names of the launch plans listed before, however old they are, without asking FlyteAdmin.
+        """
+        return self._load().get("names", {}).get("names", [])[:limit]
+
+    def list_names(self, remote: FlyteRemote, limit: int) -> typing.List[str]:
+        """
+        Returns the names of the launch plans, up to the limit, from the catalog if they were listed recently enough.
+        """
+        entry = self._load().get("names")
+        if entry and entry["limit"] >= limit and self._is_fresh(entry):
+            return entry["names"][:limit]
+        lps, _ = remote.client.list_launch_plan_ids_paginated(project=self._project, domain=self._domain, limit=limit)
+        names = [lp.name for lp in lps]
+        self._update("names", None, {"names": names, "limit": limit, "fetched_at": time.time()})
+        return names
+
+    def fetch_launch_plan(
+        self, remote: FlyteRemote, name: str, checked_since: typing.Optional[float] = None
+    ) -> FlyteLaunchPlan:
+        """
+        Returns the latest version of the launch plan, from the catalog if it was fetched or checked recently enough.
+
+        :param remote: the remote to fetch the launch plan with
+        :param name: the name of the launch plan
+        :param checked_since: the time since which the launch plan must have been fetched or checked to be used
+          without checking that it is the latest version, defaults to the TTL
+        """
+        if checked_since is None:
+            checked_since = time.time() - self._ttl
+        entry = self._load().get("launch_plans", {}).get(name)
+        if entry and entry["fetched_at"] < checked_since:
+            version = _get_latest_version(remote.client.list_launch_plans_paginated, self._project, self._domain, name)
+            if version == entry["version"]:
+                entry["fetched_at"] = time.time()
+                self._update("launch_plans", name, entry)
+            else:
+                entry = None
+        if entry is None:
+            lp = remote.fetch_launch_plan(self._project, self._domain, name)
+            interface = lp.interface.to_flyte_idl().SerializeToString() if lp.interface else None
+            self._update(
+                "launch_plans",
+                name,
+                {
+                    "version": lp.id.version,
+                    "spec": base64.b64encode(lp.serialize_to_string()).decode("ascii"),
+                    "interface": base64.b64encode(interface).decode("ascii") if interface is not None else None,
+                    "fetched_at": time.time(),
+                },
+            )
+            return lp
+
+        lp_id = Identifier(ResourceType.LAUNCH_PLAN, self._project, self._domain, name, entry["version"])
+        spec = launch_plan_pb2.LaunchPlanSpec.FromString(base64.b64decode(entry["spec"]))
+        lp = FlyteLaunchPlan.promote_from_model(lp_id, LaunchPlanSpec.from_flyte_idl(spec))
+        if entry["interface"] is not None:
+            interface = interface_pb2.TypedInterface.FromString(base64.b64decode(entry["interface"]))
+            lp._interface = TypedInterface.from_flyte_idl(interface)
+        return lp
@@ -11,6 +11,23 @@ from flytekit.remote.remote import FlyteRemote
 FLYTE_REMOTE_INSTANCE_KEY = "flyte_remote"
 
 
+def get_config(cfg_file_location: Optional[str]) -> Config:
+    """
+    Returns the config the remote of pyflyte commands is created with.
+
+    :param cfg_file_location: the config file passed to pyflyte, if any
+    """
+    cfg_file = get_config_file(cfg_file_location)
+    if cfg_file is None:
+        cli_logger.info("No config files found, creating remote with sandbox config")
+        return Config.for_sandbox()
+    cfg_obj = Config.auto(cfg_file_location)
+    cli_logger.info(
+        f"Creating remote with config {cfg_obj}" + (f" with file {cfg_file_location}" if cfg_file_location else "")
+    )
+    return cfg_obj
+
+
 def get_and_save_remote_with_click_context(
     ctx: click.Context, project: str, domain: str, save: bool = True
 ) -> FlyteRemote:
@@ -24,16 +41,7 @@ def get_and_save_remote_with_click_context(
     :param save: If false, will not mutate the context.obj dict
     :return: FlyteRemote instance
     """
-    cfg_file_location = ctx.obj.get(CTX_CONFIG_FILE)
-    cfg_file = get_config_file(cfg_file_location)
-    if cfg_file is None:
-        cfg_obj = Config.for_sandbox()
-        cli_logger.info("No config files found, creating remote with sandbox config")
-    else:
-        cfg_obj = Config.auto(cfg_file_location)
-        cli_logger.info(
-            f"Creating remote with config {cfg_obj}" + (f" with file {cfg_file_location}" if cfg_file_location else "")
-        )
+    cfg_obj = get_config(ctx.obj.get(CTX_CONFIG_FILE))
     r = FlyteRemote(cfg_obj, default_project=project, default_domain=domain)
     if save:
         ctx.obj[FLYTE_REMOTE_INSTANCE_KEY] = r
@@ -83,9 +83,34 @@ from flytekit.tools.repo import NoSerializableEntitiesError, serialize_and_packa
     is_flag=True,
     help="Enables symlink dereferencing when packaging files in fast registration",
 )
+@click.option(
+    "--serialization-workers",
+    required=False,
+    type=int,
+    default=1,
+    help="The number of processes to load and serialize independent module subtrees in.",
+)
+@click.option(
+    "--serialization-cache",
+    required=False,
+    type=click.Path(file_okay=False, writable=True, resolve_path=True),
+    default=None,
+    help="A folder to cache the serialized entities of every module in. Modules whose files did not change since the "
+    "previous run with the same settings are not loaded again.",
+)
 @click.pass_context
 def package(
-    ctx, image_config, source, output, force, fast, in_container_source_path, python_interpreter, deref_symlinks
+    ctx,
+    image_config,
+    source,
+    output,
+    force,
+    fast,
+    in_container_source_path,
+    python_interpreter,
+    deref_symlinks,
+    serialization_workers,
+    serialization_cache,
 ):
     """
     This command produces a Flyte backend registrable package of all entities in Flyte.
@@ -111,6 +136,15 @@ def package(
         display_help_with_error(ctx, "No packages to scan for flyte entities. Aborting!")
 
     try:
-        serialize_and_package(pkgs, serialization_settings, source, output, fast, deref_symlinks)
+        serialize_and_package(
+            pkgs,
+            serialization_settings,
+            source,
+            output,
+            fast,
+            deref_symlinks,
+            workers=serialization_workers,
+            cache_dir=serialization_cache,
+        )
     except NoSerializableEntitiesError:
         click.secho(f"No flyte objects found in packages {pkgs}", fg="yellow")
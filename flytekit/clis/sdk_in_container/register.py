@@ -113,6 +113,21 @@ the root of your project, it finds the first folder that does not have a ``__ini
     is_flag=True,
     help="Execute registration in dry-run mode. Skips actual registration to remote",
 )
+@click.option(
+    "--serialization-workers",
+    required=False,
+    type=int,
+    default=1,
+    help="The number of processes to load and serialize independent module subtrees in.",
+)
+@click.option(
+    "--serialization-cache",
+    required=False,
+    type=click.Path(file_okay=False, writable=True, resolve_path=True),
+    default=None,
+    help="A folder to cache the serialized entities of every module in. Modules whose files did not change since the "
+    "previous run with the same settings are not loaded again.",
+)
 @click.argument("package-or-module", type=click.Path(exists=True, readable=True, resolve_path=True), nargs=-1)
 @click.pass_context
 def register(
@@ -129,6 +144,8 @@ def register(
     non_fast: bool,
     package_or_module: typing.Tuple[str],
     dry_run: bool,
+    serialization_workers: int,
+    serialization_cache: typing.Optional[str],
 ):
     """
     see help
@@ -179,6 +196,8 @@ def register(
             package_or_module=package_or_module,
             remote=remote,
             dry_run=dry_run,
+            workers=serialization_workers,
+            cache_dir=serialization_cache,
         )
     except Exception as e:
         raise e
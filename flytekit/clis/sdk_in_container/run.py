@@ -7,6 +7,7 @@ import json
 import logging
 import os
 import pathlib
+import time
 import typing
 from dataclasses import dataclass
 from typing import cast
@@ -20,6 +21,7 @@ from rich.progress import Progress
 from typing_extensions import get_args
 
 from flytekit import BlobType, Literal, Scalar
+from flytekit.clis.sdk_in_container.catalog import LaunchPlanCatalog
 from flytekit.clis.sdk_in_container.constants import (
     CTX_CONFIG_FILE,
     CTX_COPY_ALL,
@@ -32,6 +34,7 @@ from flytekit.clis.sdk_in_container.constants import (
 from flytekit.clis.sdk_in_container.helpers import (
     FLYTE_REMOTE_INSTANCE_KEY,
     get_and_save_remote_with_click_context,
+    get_config,
     patch_image_config,
 )
 from flytekit.configuration import ImageConfig
@@ -48,7 +51,7 @@ from flytekit.models.literals import Blob, BlobMetadata, LiteralCollection, Lite
 from flytekit.models.types import LiteralType, SimpleType
 from flytekit.remote import FlyteLaunchPlan, FlyteRemote, FlyteTask, FlyteWorkflow
 from flytekit.remote.executions import FlyteWorkflowExecution
-from flytekit.tools import module_loader, script_mode
+from flytekit.tools import entity_discovery, module_loader, script_mode
 from flytekit.tools.script_mode import _find_project_root
 from flytekit.tools.translator import Options
 from flytekit.types.pickle.pickle import FlytePickleTransformer
@@ -647,10 +650,22 @@ class Entities(typing.NamedTuple):
         return e
 
 
-def get_entities_in_file(filename: pathlib.Path, should_delete: bool) -> Entities:
+def get_entities_in_file(filename: pathlib.Path, should_delete: bool, static: bool = False) -> Entities:
     """
     Returns a list of flyte workflow names and list of Flyte tasks in a file.
+
+    If static is set, the entities are first looked for in the source of the file, see
+    :py:func:`flytekit.tools.entity_discovery.find_entities`, which avoids importing it during shell completion. Entities
+    created in other ways, for example by calling a factory function or imported from another module, aren't listed
+    then. The file is still imported if it can't be parsed or no entities are found in it that way.
     """
+    if static:
+        found = entity_discovery.find_entities(str(filename))
+        if found is not None and any(found):
+            if should_delete and os.path.exists(filename):
+                os.remove(filename)
+            return Entities(*found)
+
     flyte_ctx = context_manager.FlyteContextManager.current_context().new_builder()
     module_name = os.path.splitext(os.path.relpath(filename))[0].replace(os.path.sep, ".")
     with context_manager.FlyteContextManager.with_context(flyte_ctx):
@@ -784,14 +799,16 @@ class DynamicLaunchPlanCommand(click.RichCommand):
         super().__init__(name=name, help=h, **kwargs)
         self._lp_name = lp_name
         self._lp = None
+        self._created_at = time.time()
 
-    def _fetch_launch_plan(self, ctx: click.Context) -> FlyteLaunchPlan:
-        if self._lp:
-            return self._lp
+    def _fetch_launch_plan(self, ctx: click.Context, checked_since: typing.Optional[float] = None) -> FlyteLaunchPlan:
         project = ctx.obj[RUN_LEVEL_PARAMS_KEY].get(CTX_PROJECT)
         domain = ctx.obj[RUN_LEVEL_PARAMS_KEY].get(CTX_DOMAIN)
         r = get_and_save_remote_with_click_context(ctx, project, domain)
-        self._lp = r.fetch_launch_plan(project, domain, self._lp_name)
+        catalog = LaunchPlanCatalog(r.config.platform.endpoint, project, domain)
+        if self._lp and (checked_since is None or not catalog.enabled):
+            return self._lp
+        self._lp = catalog.fetch_launch_plan(r, self._lp_name, checked_since=checked_since)
         return self._lp
 
     def _get_params(
@@ -840,7 +857,8 @@ class DynamicLaunchPlanCommand(click.RichCommand):
         project = ctx.obj[RUN_LEVEL_PARAMS_KEY].get(CTX_PROJECT)
         domain = ctx.obj[RUN_LEVEL_PARAMS_KEY].get(CTX_DOMAIN)
         r = get_and_save_remote_with_click_context(ctx, project, domain)
-        lp = self._fetch_launch_plan(ctx)
+        # The options may have been built from an outdated catalog, the latest version of the launch plan is executed
+        lp = self._fetch_launch_plan(ctx, checked_since=self._created_at)
         run_remote(
             ctx,
             r,
@@ -876,17 +894,25 @@ class RemoteLaunchPlanGroup(click.RichGroup):
         if self._lps:
             return self._lps
         if ctx.obj is None:
-            return self._lps
+            # Shell completion doesn't run the callbacks that create the remote, only the catalog is used
+            run_params = ctx.parent.params if ctx.parent else {}
+            project = run_params.get(CTX_PROJECT)
+            domain = run_params.get(CTX_DOMAIN)
+            if not project or not domain:
+                return self._lps
+            cfg = get_config(ctx.find_root().params.get("config"))
+            catalog = LaunchPlanCatalog(cfg.platform.endpoint, project, domain)
+            return catalog.cached_names(run_params.get("limit") or 10)
         project = ctx.obj[RUN_LEVEL_PARAMS_KEY].get(CTX_PROJECT)
         domain = ctx.obj[RUN_LEVEL_PARAMS_KEY].get(CTX_DOMAIN)
         l = ctx.obj[RUN_LEVEL_PARAMS_KEY].get("limit")
         r = get_and_save_remote_with_click_context(ctx, project, domain)
+        catalog = LaunchPlanCatalog(r.config.platform.endpoint, project, domain)
         progress = Progress(transient=True)
         task = progress.add_task(f"[cyan]Gathering [{l}] remote LaunchPlans...", total=None)
         with progress:
             progress.start_task(task)
-            lps = r.client.list_launch_plan_ids_paginated(project=project, domain=domain, limit=l)
-            self._lps = [l.name for l in lps[0]]
+            self._lps = catalog.list_names(r, l)
             return self._lps
 
     def get_command(self, ctx, name):
@@ -915,6 +941,9 @@ class WorkflowCommand(click.RichGroup):
     def list_commands(self, ctx):
         if self._entities:
             return self._entities.all()
+        # Shell completion only needs the names, which are then found without importing the file
+        if ctx.resilient_parsing:
+            return get_entities_in_file(self._filename, self._should_delete, static=True).all()
         entities = get_entities_in_file(self._filename, self._should_delete)
         self._entities = entities
         return entities.all()
@@ -929,9 +958,6 @@ class WorkflowCommand(click.RichGroup):
           function.
         :return:
         """
-        is_workflow = False
-        if self._entities:
-            is_workflow = exe_entity in self._entities.workflows
         rel_path = os.path.relpath(self._filename)
         if rel_path.startswith(".."):
             raise ValueError(
@@ -972,7 +998,7 @@ class WorkflowCommand(click.RichGroup):
                 )
             )
 
-        entity_type = "Workflow" if is_workflow else "Task"
+        entity_type = "Workflow" if isinstance(entity, WorkflowBase) else "Task"
         h = f"{click.style(entity_type, bold=True)} ({module}.{exe_entity})"
         if entity.__doc__:
             h = h + click.style(f"{entity.__doc__}", dim=True)
@@ -451,12 +451,18 @@ class StatsConfig(object):
     :param port: statsd port
     :param disabled: Whether or not to send
     :param disabled_tags: Turn on to reduce cardinality.
+    :param buffered: Aggregate metrics in process and send them in batches from a background thread.
+    :param flush_interval_ms: How often buffered metrics are sent.
+    :param max_buffered: The number of buffered metrics that triggers sending them before the interval is over.
     """
 
     host: str = "localhost"
     port: int = 8125
     disabled: bool = False
     disabled_tags: bool = False
+    buffered: bool = False
+    flush_interval_ms: int = 1000
+    max_buffered: int = 1000
 
     @classmethod
     def auto(cls, config_file: typing.Union[str, ConfigFile] = None) -> StatsConfig:
@@ -471,6 +477,9 @@ class StatsConfig(object):
         kwargs = set_if_exists(kwargs, "port", _internal.StatsD.PORT.read(config_file))
         kwargs = set_if_exists(kwargs, "disabled", _internal.StatsD.DISABLED.read(config_file))
         kwargs = set_if_exists(kwargs, "disabled_tags", _internal.StatsD.DISABLE_TAGS.read(config_file))
+        kwargs = set_if_exists(kwargs, "buffered", _internal.StatsD.BUFFERED.read(config_file))
+        kwargs = set_if_exists(kwargs, "flush_interval_ms", _internal.StatsD.FLUSH_INTERVAL_MS.read(config_file))
+        kwargs = set_if_exists(kwargs, "max_buffered", _internal.StatsD.MAX_BUFFERED.read(config_file))
         return StatsConfig(**kwargs)
 
 
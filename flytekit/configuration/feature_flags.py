@@ -14,3 +14,9 @@ class FeatureFlags:
      "." -> Assuming current directory as the root
      or an actual path -> path to the root, this will be used to locate the root.
     """
+
+    FLYTE_CONTENT_ADDRESSED_UPLOADS = _get("FLYTE_CONTENT_ADDRESSED_UPLOADS", "false")
+    """
+    If true, files and directories returned by tasks are uploaded under a path derived from a digest of their contents,
+    and the upload is skipped when identical contents were uploaded before, e.g. by a previous attempt of the task.
+    """
@@ -137,6 +137,101 @@ class LocalSDK(object):
     TODO delete the one from internal config
     """
 
+    PARQUET_PART_SIZE_BYTES = ConfigEntry(LegacyConfigEntry(SECTION, "parquet_part_size_bytes", int))
+    """
+    The target in-memory size of each part of the Parquet structured datasets flytekit writes. Larger dataframes are
+    split into row-bounded parts that are written concurrently. Defaults to 256MB, can be overridden using
+    FLYTE_SDK_PARQUET_PART_SIZE_BYTES.
+    """
+
+    PARQUET_PART_MAX_ROWS = ConfigEntry(LegacyConfigEntry(SECTION, "parquet_part_max_rows", int))
+    """
+    An upper bound on the number of rows of each part of the Parquet structured datasets flytekit writes. Not set, or
+    0, means unbounded. Can be overridden using FLYTE_SDK_PARQUET_PART_MAX_ROWS.
+    """
+
+    PARQUET_WRITE_CONCURRENCY = ConfigEntry(LegacyConfigEntry(SECTION, "parquet_write_concurrency", int))
+    """
+    The number of Parquet parts written at the same time. Defaults to 8, can be overridden using
+    FLYTE_SDK_PARQUET_WRITE_CONCURRENCY.
+    """
+
+    LOCAL_PARALLELISM = ConfigEntry(LegacyConfigEntry(SECTION, "local_parallelism", int))
+    """
+    The maximum number of workflow nodes that may run at the same time during local workflow executions. Values of 1 or
+    less (the default) keep the sequential behavior. Can be overridden using FLYTE_SDK_LOCAL_PARALLELISM.
+    """
+
+    LOCAL_EXECUTOR = ConfigEntry(LegacyConfigEntry(SECTION, "local_executor"))
+    """
+    The pool used to run workflow nodes concurrently during local executions, either ``thread`` (the default) or
+    ``process``. Only tasks that can be re-imported by module and name run in the process pool, everything else is run
+    on threads. Can be overridden using FLYTE_SDK_LOCAL_EXECUTOR.
+    """
+
+    LOCAL_NATIVE_PASSTHROUGH = ConfigEntry(LegacyConfigEntry(SECTION, "local_native_passthrough", bool))
+    """
+    If enabled, local executions keep files, directories, dataframes and pickled values in memory between tasks instead
+    of writing them to the local sandbox and reading them back. Consumers receive the same object the producer returned,
+    so tasks should not modify their inputs in place. Can be overridden using FLYTE_SDK_LOCAL_NATIVE_PASSTHROUGH.
+    """
+
+    DECK_RENDER_MAX_BYTES = ConfigEntry(LegacyConfigEntry(SECTION, "deck_render_max_bytes", int))
+    """
+    The maximum size of the html a single renderer may add to the input and output decks of a task. Larger html is
+    truncated. Defaults to 10MB, can be overridden using FLYTE_SDK_DECK_RENDER_MAX_BYTES.
+    """
+
+    DECK_RENDER_TIMEOUT = ConfigEntry(LegacyConfigEntry(SECTION, "deck_render_timeout", int))
+    """
+    The number of seconds a single renderer of the input and output decks may take, the value is left out of the deck
+    if it takes longer. Defaults to 60 seconds, can be overridden using FLYTE_SDK_DECK_RENDER_TIMEOUT.
+    """
+
+    PROFILING = ConfigEntry(LegacyConfigEntry(SECTION, "profiling", bool))
+    """
+    If enabled, task executions record the time, memory and transferred bytes of each of their phases, and write them
+    as a trace next to the outputs of the task and as statsd metrics. Can be overridden using FLYTE_SDK_PROFILING.
+    """
+
+    PROFILE_CPU = ConfigEntry(LegacyConfigEntry(SECTION, "profile_cpu", bool))
+    """
+    If enabled together with profiling, the user code of tasks is run under cProfile. Can be overridden using
+    FLYTE_SDK_PROFILE_CPU.
+    """
+
+    ASYNC_CHECKPOINT = ConfigEntry(LegacyConfigEntry(SECTION, "async_checkpoint", bool))
+    """
+    If enabled, task executions use an AsyncCheckpoint, which uploads checkpoints in the background and only uploads
+    the files that changed since the previous checkpoint. Can be overridden using FLYTE_SDK_ASYNC_CHECKPOINT.
+    """
+
+    PYTORCH_SAFETENSORS = ConfigEntry(LegacyConfigEntry(SECTION, "pytorch_safetensors", bool))
+    """
+    If enabled, PyTorch tensors are written in the safetensors format instead of with torch.save, and memory mapped when
+    they are read. Tensors in either format can be read regardless. Can be overridden using FLYTE_SDK_PYTORCH_SAFETENSORS.
+    """
+
+    REMOTE_CATALOG_TTL = ConfigEntry(LegacyConfigEntry(SECTION, "remote_catalog_ttl", int))
+    """
+    The number of seconds ``pyflyte run remote-launchplan`` uses the launch plans it listed and fetched before, without
+    asking FlyteAdmin again. Defaults to 5 minutes, 0 disables the catalog. Can be overridden using
+    FLYTE_SDK_REMOTE_CATALOG_TTL.
+    """
+
+    IMAGE_SPEC_EXIST_TTL = ConfigEntry(LegacyConfigEntry(SECTION, "image_spec_exist_ttl", int))
+    """
+    The number of seconds an ImageSpec image found in its registry is assumed to still exist, without checking the
+    registry again. Defaults to 1 hour, 0 disables the cache. Can be overridden using FLYTE_SDK_IMAGE_SPEC_EXIST_TTL.
+    """
+
+    FAST_REGISTRATION_CACHE = ConfigEntry(LegacyConfigEntry(SECTION, "fast_registration_cache"))
+    """
+    A directory, e.g. a host path shared by the pods on a node, where fast registration distributions are downloaded
+    and extracted once, instead of in every task. Not set by default, can be overridden using
+    FLYTE_SDK_FAST_REGISTRATION_CACHE.
+    """
+
 
 class Secrets(object):
     SECTION = "secrets"
@@ -168,3 +263,6 @@ class StatsD(object):
     PORT = ConfigEntry(LegacyConfigEntry(SECTION, "port", int))
     DISABLED = ConfigEntry(LegacyConfigEntry(SECTION, "disabled", bool))
     DISABLE_TAGS = ConfigEntry(LegacyConfigEntry(SECTION, "disable_tags", bool))
+    BUFFERED = ConfigEntry(LegacyConfigEntry(SECTION, "buffered", bool))
+    FLUSH_INTERVAL_MS = ConfigEntry(LegacyConfigEntry(SECTION, "flush_interval_ms", int))
+    MAX_BUFFERED = ConfigEntry(LegacyConfigEntry(SECTION, "max_buffered", int))
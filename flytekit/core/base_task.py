@@ -35,6 +35,8 @@ from flytekit.core.context_manager import (
 )
 from flytekit.core.interface import Interface, transform_interface_to_typed_interface
 from flytekit.core.local_cache import LocalTaskCache
+from flytekit.core.native_passthrough import NativePassthrough
+from flytekit.core.profiler import profile_cpu
 from flytekit.core.promise import (
     Promise,
     VoidPromise,
@@ -274,6 +276,8 @@ class Task(object):
             if outputs_literal_map is None:
                 logger.info("Cache miss, task will be executed now")
                 outputs_literal_map = self.sandbox_execute(ctx, input_literal_map)
+                # The cache outlives this process, so values kept in memory have to be written out first
+                outputs_literal_map = NativePassthrough.materialize_map(ctx, outputs_literal_map)
                 # TODO: need `native_inputs`
                 LocalTaskCache.set(self.name, self.metadata.cache_version, input_literal_map, outputs_literal_map)
                 logger.info(
@@ -545,18 +549,19 @@ class PythonTask(TrackedInstance, Task, Generic[T]):
 
     def _write_decks(self, native_inputs, native_outputs_as_map, ctx, new_user_params):
         if self._disable_deck is False:
-            from flytekit.deck.deck import Deck, _output_deck
+            from flytekit.deck.deck import Deck, _output_deck, render_html
 
             INPUT = "input"
             OUTPUT = "output"
 
+            # The values are rendered in the background, while the outputs are uploaded
             input_deck = Deck(INPUT)
             for k, v in native_inputs.items():
-                input_deck.append(TypeEngine.to_html(ctx, v, self.get_type_for_input_var(k, v)))
+                input_deck.append_async(render_html, ctx, v, self.get_type_for_input_var(k, v))
 
             output_deck = Deck(OUTPUT)
             for k, v in native_outputs_as_map.items():
-                output_deck.append(TypeEngine.to_html(ctx, v, self.get_type_for_output_var(k, v)))
+                output_deck.append_async(render_html, ctx, v, self.get_type_for_output_var(k, v))
 
             if ctx.execution_state and ctx.execution_state.is_local_execution():
                 # When we run the workflow remotely, flytekit outputs decks at the end of _dispatch_execute
@@ -606,7 +611,7 @@ class PythonTask(TrackedInstance, Task, Generic[T]):
             #   a workflow or a subworkflow etc
             logger.info(f"Invoking {self.name} with inputs: {native_inputs}")
             try:
-                with timeit("Execute user level code"):
+                with timeit("Execute user level code"), profile_cpu():
                     native_outputs = self.execute(**native_inputs)
             except Exception as e:
                 logger.exception(f"Exception when executing {e}")
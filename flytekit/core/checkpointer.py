@@ -1,7 +1,11 @@
+import atexit
 import io
+import os
+import shutil
 import tempfile
 import typing
 from abc import abstractmethod
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
 
 
@@ -66,7 +70,7 @@ class SyncCheckpoint(Checkpoint):
     Sync Checkpoint, will synchronously checkpoint a user given file or folder.
     It will also synchronously download / restore previous checkpoints, when restore is invoked.
 
-    TODO: Implement an async checkpoint system
+    See :py:class:`AsyncCheckpoint` for a checkpoint system that uploads in the background.
     """
 
     SRC_LOCAL_FOLDER = "prev_cp"
@@ -136,7 +140,7 @@ class SyncCheckpoint(Checkpoint):
         p = Path(self._td.name)
         dest_cp = p.joinpath(self.TMP_DST_PATH)
         with dest_cp.open("wb") as f:
-            f.write(cp.read())
+            shutil.copyfileobj(cp, f)
 
         rpath = fa._default_remote.sep.join([str(self._checkpoint_dest), self.TMP_DST_PATH])
         fa.upload(str(dest_cp), rpath)
@@ -157,3 +161,91 @@ class SyncCheckpoint(Checkpoint):
         p = io.BytesIO(b)
         f = typing.cast(io.BufferedReader, p)
         self.save(f)
+
+
+class AsyncCheckpoint(SyncCheckpoint):
+    """
+    This class is NOT THREAD-SAFE!
+    Async Checkpoint, returns from save as soon as the checkpoint is copied to local disk and uploads it in the
+    background. Only the files whose contents changed since the previous save are uploaded.
+
+    At most one upload is in flight, save waits for the previous upload to finish before starting the next one.
+    Use wait to block until the last upload finished, it is also waited for when the process exits. Errors of a
+    background upload are raised by the next call to save or wait.
+    """
+
+    SNAPSHOT_FOLDER = "_snapshot"
+
+    def __init__(self, checkpoint_dest: str, checkpoint_src: typing.Optional[str] = None):
+        super().__init__(checkpoint_dest, checkpoint_src)
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="flyte-checkpoint")
+        self._in_flight: typing.Optional[Future] = None
+        # Digests of the files uploaded so far, by their path relative to the checkpoint destination
+        self._uploaded: typing.Dict[str, str] = {}
+        self._snapshots = 0
+        atexit.register(self.wait)
+
+    def wait(self):
+        """
+        Blocks until the checkpoint being uploaded, if any, is uploaded.
+        """
+        in_flight, self._in_flight = self._in_flight, None
+        if in_flight is not None:
+            in_flight.result()
+
+    def save(self, cp: typing.Union[Path, str, io.BufferedReader]):
+        # We have to lazy load, until we fix the imports
+        from flytekit.core.context_manager import FlyteContextManager
+        from flytekit.core.data_persistence import file_digest
+
+        fa = FlyteContextManager.current_context().file_access
+        self.wait()
+
+        snapshot = Path(self._td.name).joinpath(f"{self.SNAPSHOT_FOLDER}{self._snapshots}")
+        self._snapshots += 1
+        snapshot.mkdir()
+
+        changed: typing.Dict[str, str] = {}
+        if isinstance(cp, (Path, str)):
+            cp = Path(cp)
+            if cp.is_dir():
+                files = {
+                    os.path.relpath(os.path.join(root, f), cp).replace(os.sep, "/"): Path(root).joinpath(f)
+                    for root, _, fs in os.walk(cp)
+                    for f in fs
+                }
+            else:
+                files = {cp.stem + cp.suffix: cp}
+            for rel_path, path in files.items():
+                # The copy is hashed, so that what is uploaded is exactly what was compared
+                copy = snapshot.joinpath(rel_path)
+                copy.parent.mkdir(parents=True, exist_ok=True)
+                shutil.copy2(path, copy)
+                digest = file_digest(copy)
+                if self._uploaded.get(rel_path) != digest:
+                    changed[rel_path] = digest
+                else:
+                    copy.unlink()
+        elif isinstance(cp, io.IOBase):
+            with snapshot.joinpath(self.TMP_DST_PATH).open("wb") as f:
+                shutil.copyfileobj(cp, f)
+            digest = file_digest(snapshot.joinpath(self.TMP_DST_PATH))
+            if self._uploaded.get(self.TMP_DST_PATH) != digest:
+                changed[self.TMP_DST_PATH] = digest
+        else:
+            raise ValueError(f"Only a valid path or IOBase type (reader) should be provided, received {type(cp)}")
+
+        self._uploaded.update(changed)
+        self._in_flight = self._executor.submit(self._upload, fa, snapshot, changed)
+
+    def _upload(self, fa, snapshot: Path, changed: typing.Dict[str, str]):
+        try:
+            for rel_path in changed:
+                rpath = fa._default_remote.sep.join([str(self._checkpoint_dest), rel_path])
+                fa.put_data(str(snapshot.joinpath(rel_path)), rpath)
+        except Exception:
+            # Nothing can be assumed to be uploaded anymore
+            self._uploaded = {}
+            raise
+        finally:
+            shutil.rmtree(snapshot, ignore_errors=True)
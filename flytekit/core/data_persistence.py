@@ -17,9 +17,11 @@ simple implementation that ships with the core.
    FileAccessProvider
 
 """
+import hashlib
 import os
 import pathlib
 import tempfile
+import threading
 import typing
 from typing import Any, Dict, Union, cast
 from uuid import UUID
@@ -29,6 +31,8 @@ from fsspec.utils import get_protocol
 
 from flytekit import configuration
 from flytekit.configuration import DataConfig
+from flytekit.configuration.feature_flags import FeatureFlags
+from flytekit.core.profiler import record_io
 from flytekit.core.utils import timeit
 from flytekit.exceptions.user import FlyteAssertion
 from flytekit.interfaces.random import random
@@ -40,6 +44,23 @@ _FSSPEC_S3_KEY_ID = "key"
 _FSSPEC_S3_SECRET = "secret"
 _ANON = "anon"
 
+# Content addressed uploads are stored under this folder of the raw output prefix
+_CONTENT_ADDRESSED_FOLDER = "content-addressed"
+# Marks a content addressed directory as completely uploaded
+_CONTENT_ADDRESSED_DIR_MARKER = ".complete"
+_HASH_CHUNK_SIZE = 1024 * 1024
+
+
+def file_digest(path: Union[str, os.PathLike]) -> str:
+    """
+    Returns the hex encoded sha256 digest of the contents of a local file, reading it in chunks.
+    """
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(_HASH_CHUNK_SIZE), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
 
 def s3_setup_args(s3_cfg: configuration.S3Config, anonymous: bool = False):
     kwargs: Dict[str, Any] = {
@@ -72,10 +93,14 @@ class FileAccessProvider(object):
         local_sandbox_dir: Union[str, os.PathLike],
         raw_output_prefix: str,
         data_config: typing.Optional[DataConfig] = None,
+        content_addressed_uploads: typing.Optional[bool] = None,
     ):
         """
         Args:
             local_sandbox_dir: A local temporary working directory, that should be used to store data
+            content_addressed_uploads: Upload files and directories returned by tasks under a path derived from
+                their contents, skipping the upload if identical contents were uploaded before. Defaults to the
+                FLYTE_CONTENT_ADDRESSED_UPLOADS feature flag.
         """
         # Local access
         if local_sandbox_dir is None or local_sandbox_dir == "":
@@ -95,6 +120,9 @@ class FileAccessProvider(object):
             if raw_output_prefix.endswith(self.sep(self._default_remote))
             else raw_output_prefix + self.sep(self._default_remote)
         )
+        if content_addressed_uploads is None:
+            content_addressed_uploads = FeatureFlags.FLYTE_CONTENT_ADDRESSED_UPLOADS.lower() in ("1", "true", "yes")
+        self._content_addressed_uploads = content_addressed_uploads
 
     @property
     def raw_output_prefix(self) -> str:
@@ -104,6 +132,10 @@ class FileAccessProvider(object):
     def data_config(self) -> DataConfig:
         return self._data_config
 
+    @property
+    def content_addressed_uploads(self) -> bool:
+        return self._content_addressed_uploads
+
     def get_filesystem(
         self, protocol: typing.Optional[str] = None, anonymous: bool = False, **kwargs
     ) -> typing.Optional[fsspec.AbstractFileSystem]:
@@ -229,10 +261,23 @@ class FileAccessProvider(object):
 
         Use file_path_or_file_name, when you want a random directory, but want to preserve the leaf file name
         """
+        return self._remote_path_for_key(UUID(int=random.getrandbits(128)).hex, file_path_or_file_name)
+
+    def get_content_addressed_remote_path(
+        self, digest: str, file_path_or_file_name: typing.Optional[str] = None
+    ) -> str:
+        """
+        Constructs the path on the configured raw_output_prefix under which contents with the given digest are stored.
+
+        Use file_path_or_file_name, when you want to preserve the leaf file name
+        """
+        sep = self.sep(self._default_remote)
+        return self._remote_path_for_key(f"{_CONTENT_ADDRESSED_FOLDER}{sep}{digest}", file_path_or_file_name)
+
+    def _remote_path_for_key(self, key: str, file_path_or_file_name: typing.Optional[str] = None) -> str:
         default_protocol = self._default_remote.protocol
         if type(default_protocol) == list:
             default_protocol = default_protocol[0]
-        key = UUID(int=random.getrandbits(128)).hex
         tail = ""
         if file_path_or_file_name:
             _, tail = os.path.split(file_path_or_file_name)
@@ -298,14 +343,78 @@ class FileAccessProvider(object):
         """
         try:
             pathlib.Path(local_path).parent.mkdir(parents=True, exist_ok=True)
-            with timeit(f"Download data to local from {remote_path}"):
+            with timeit(f"Download data to local from {remote_path}", metric="download"):
                 self.get(remote_path, to_path=local_path, recursive=is_multipart, **kwargs)
+                record_io(local_path, read=True)
         except Exception as ex:
             raise FlyteAssertion(
                 f"Failed to get data from {remote_path} to {local_path} (recursive={is_multipart}).\n\n"
                 f"Original exception: {str(ex)}"
             )
 
+    # Process local caches, shared by all providers, of the digests of local files keyed by path, size and
+    # modification time, and of the content addressed remote paths known to be fully uploaded.
+    _digest_cache: Dict[typing.Tuple[str, int, int], str] = {}
+    _uploaded_paths: typing.Set[str] = set()
+    _cache_lock = threading.Lock()
+
+    def content_digest(self, local_path: Union[str, os.PathLike], is_multipart: bool = False) -> str:
+        """
+        Returns the sha256 digest of a local file, or for directories a digest over the relative paths and digests of
+        all the files in it. Digests of unchanged files are only computed once per process.
+        """
+        local_path = self.strip_file_header(str(local_path))
+        if not is_multipart:
+            return self._cached_file_digest(local_path)
+
+        h = hashlib.sha256()
+        for root, dirs, files in os.walk(local_path):
+            dirs.sort()
+            for f in sorted(files):
+                p = os.path.join(root, f)
+                rel_path = os.path.relpath(p, local_path).replace(os.sep, "/")
+                h.update(f"{rel_path}\0{self._cached_file_digest(p)}\n".encode())
+        return h.hexdigest()
+
+    def _cached_file_digest(self, path: str) -> str:
+        st = os.stat(path)
+        key = (os.path.abspath(path), st.st_size, st.st_mtime_ns)
+        digest = self._digest_cache.get(key)
+        if digest is None:
+            digest = file_digest(path)
+            with self._cache_lock:
+                self._digest_cache[key] = digest
+        return digest
+
+    def put_content_addressed(
+        self,
+        local_path: Union[str, os.PathLike],
+        is_multipart: bool = False,
+        **kwargs,
+    ) -> str:
+        """
+        Uploads a local file or directory under a path derived from its contents and returns that path. The upload is
+        skipped if the same contents were already uploaded, by this process or any other.
+
+        :param local_path: The local file or directory
+        :param is_multipart: Whether local_path is a directory
+        """
+        local_path = str(local_path)
+        digest = self.content_digest(local_path, is_multipart)
+        remote_path = self.get_content_addressed_remote_path(digest, None if is_multipart else local_path)
+        # Directories are uploaded as many objects, so a marker written after the upload tells them complete.
+        marker = remote_path + _CONTENT_ADDRESSED_DIR_MARKER if is_multipart else remote_path
+
+        if remote_path in self._uploaded_paths or self.exists(marker):
+            logger.debug(f"Contents of {local_path} already uploaded to {remote_path}, skipping upload")
+        else:
+            self.put_data(local_path, remote_path, is_multipart=is_multipart, **kwargs)
+            if is_multipart:
+                self.get_filesystem_for_path(marker).pipe(marker, b"")
+        with self._cache_lock:
+            self._uploaded_paths.add(remote_path)
+        return remote_path
+
     def put_data(self, local_path: Union[str, os.PathLike], remote_path: str, is_multipart: bool = False, **kwargs):
         """
         The implication here is that we're always going to put data to the remote location, so we .remote to ensure
@@ -317,7 +426,8 @@ class FileAccessProvider(object):
         """
         try:
             local_path = str(local_path)
-            with timeit(f"Upload data to {remote_path}"):
+            with timeit(f"Upload data to {remote_path}", metric="upload"):
+                record_io(local_path, read=False)
                 self.put(cast(str, local_path), remote_path, recursive=is_multipart, **kwargs)
         except Exception as ex:
             raise FlyteAssertion(
@@ -0,0 +1,174 @@
+"""
+Local executions convert every value crossing a task boundary into a Literal and back. For offloaded types (files,
+directories, dataframes, pickled objects, ...) that means writing the value into the local sandbox and reading it back
+for every hop. When ``FLYTE_SDK_LOCAL_NATIVE_PASSTHROUGH`` is enabled, local executions instead keep such values in
+memory. The Literal produced for them only points at the in-memory value, and consumers expecting a compatible python
+type receive the very same object.
+
+Type assertions and ``HashMethod`` based hashing still run when the Literal is created, so cache keys are the same as
+without pass-through. A Literal is only really written (materialized) when a consumer expects an incompatible type, or
+when it has to outlive the process, e.g. when it is stored in the local cache.
+"""
+
+import os
+import threading
+import typing
+import uuid
+import weakref
+from typing import Any, Dict, Optional, Tuple, Type
+
+from typing_extensions import Annotated, get_origin
+
+from flytekit.configuration.internal import LocalSDK
+from flytekit.core.context_manager import FlyteContext
+from flytekit.models import literals as _literal_models
+from flytekit.models.types import LiteralType
+
+PASSTHROUGH_SCHEME = "flyte-native://"
+
+
+def _uri_of(lv: _literal_models.Literal) -> Optional[str]:
+    if lv.scalar is None:
+        return None
+    if lv.scalar.blob is not None:
+        return lv.scalar.blob.uri
+    if lv.scalar.structured_dataset is not None:
+        return lv.scalar.structured_dataset.uri
+    return None
+
+
+class NativePassthrough(object):
+    """
+    Holds the native values of the pass-through Literals created in this process. Entries are dropped as soon as the
+    Literal pointing at them is garbage collected.
+    """
+
+    _values: Dict[str, Tuple[Any, Type, LiteralType]] = {}
+    _materialized: Dict[str, _literal_models.Literal] = {}
+    _lock = threading.Lock()
+
+    @staticmethod
+    def enabled(ctx: FlyteContext) -> bool:
+        return bool(
+            ctx.execution_state is not None
+            and ctx.execution_state.is_local_execution()
+            and LocalSDK.LOCAL_NATIVE_PASSTHROUGH.read()
+        )
+
+    @staticmethod
+    def supports(python_val: Any, expected: LiteralType) -> bool:
+        """
+        Only values that are written to storage are passed through, all other literals are cheap to create. Files,
+        directories and StructuredDataset wrappers already point at their data, and how they are read back depends on
+        the literal, so they are not passed through either.
+        """
+        from flytekit.types.structured.structured_dataset import StructuredDataset
+
+        if not isinstance(expected, LiteralType) or (
+            expected.blob is None and expected.structured_dataset_type is None
+        ):
+            return False
+        return not isinstance(python_val, (str, os.PathLike, StructuredDataset))
+
+    @classmethod
+    def is_passthrough(cls, lv: _literal_models.Literal) -> bool:
+        uri = _uri_of(lv)
+        return uri is not None and uri.startswith(PASSTHROUGH_SCHEME)
+
+    @classmethod
+    def to_literal(cls, python_val: Any, python_type: Type, expected: LiteralType) -> _literal_models.Literal:
+        """
+        Creates a Literal of the expected type that only refers to the given python value.
+        """
+        uri = f"{PASSTHROUGH_SCHEME}{uuid.uuid4().hex}"
+        if expected.blob is not None:
+            scalar = _literal_models.Scalar(
+                blob=_literal_models.Blob(metadata=_literal_models.BlobMetadata(type=expected.blob), uri=uri)
+            )
+        else:
+            scalar = _literal_models.Scalar(
+                structured_dataset=_literal_models.StructuredDataset(
+                    uri=uri,
+                    metadata=_literal_models.StructuredDatasetMetadata(
+                        structured_dataset_type=expected.structured_dataset_type
+                    ),
+                )
+            )
+        lv = _literal_models.Literal(scalar=scalar)
+        with cls._lock:
+            cls._values[uri] = (python_val, python_type, expected)
+        weakref.finalize(lv, cls._forget, uri)
+        return lv
+
+    @classmethod
+    def _forget(cls, uri: str):
+        with cls._lock:
+            cls._values.pop(uri, None)
+            cls._materialized.pop(uri, None)
+
+    @classmethod
+    def _entry(cls, lv: _literal_models.Literal) -> Tuple[Any, Type, LiteralType]:
+        uri = typing.cast(str, _uri_of(lv))
+        try:
+            return cls._values[uri]
+        except KeyError:
+            raise ValueError(
+                f"The value of {uri} is no longer available, pass-through literals cannot be used after the"
+                f" literal they were created as has been garbage collected or outside of the process that created it."
+            )
+
+    @staticmethod
+    def _is_compatible(python_val: Any, expected_python_type: Type) -> bool:
+        if get_origin(expected_python_type) is Annotated:
+            # Annotations may change how a value is read, e.g. the columns of a dataframe
+            return False
+        t = get_origin(expected_python_type) or expected_python_type
+        return isinstance(t, type) and isinstance(python_val, t)
+
+    @classmethod
+    def to_python_value(cls, ctx: FlyteContext, lv: _literal_models.Literal, expected_python_type: Type) -> Any:
+        """
+        Returns the native value behind a pass-through literal if the expected type is compatible with it, otherwise
+        the literal is materialized and converted the regular way.
+        """
+        from flytekit.core.type_engine import TypeEngine
+
+        python_val, _, _ = cls._entry(lv)
+        if cls._is_compatible(python_val, expected_python_type):
+            return python_val
+        return TypeEngine.to_python_value(ctx, cls.materialize(ctx, lv), expected_python_type)
+
+    @classmethod
+    def materialize(cls, ctx: FlyteContext, lv: _literal_models.Literal) -> _literal_models.Literal:
+        """
+        Returns the literal with all the pass-through literals in it, if any, replaced by regular literals.
+        """
+        from flytekit.core.type_engine import TypeEngine
+
+        if lv.collection is not None:
+            literals = [cls.materialize(ctx, x) for x in lv.collection.literals]
+            if all(x is y for x, y in zip(literals, lv.collection.literals)):
+                return lv
+            return _literal_models.Literal(collection=_literal_models.LiteralCollection(literals), hash=lv.hash)
+        if lv.map is not None:
+            literal_map = {k: cls.materialize(ctx, v) for k, v in lv.map.literals.items()}
+            if all(literal_map[k] is v for k, v in lv.map.literals.items()):
+                return lv
+            return _literal_models.Literal(map=_literal_models.LiteralMap(literal_map), hash=lv.hash)
+        if not cls.is_passthrough(lv):
+            return lv
+
+        uri = typing.cast(str, _uri_of(lv))
+        materialized = cls._materialized.get(uri)
+        if materialized is None:
+            python_val, python_type, expected = cls._entry(lv)
+            materialized = TypeEngine.get_transformer(python_type).to_literal(ctx, python_val, python_type, expected)
+            if lv.hash is not None:
+                materialized.hash = lv.hash
+            with cls._lock:
+                cls._materialized[uri] = materialized
+        return materialized
+
+    @classmethod
+    def materialize_map(cls, ctx: FlyteContext, lm: _literal_models.LiteralMap) -> _literal_models.LiteralMap:
+        return _literal_models.LiteralMap(literals={k: cls.materialize(ctx, v) for k, v in lm.literals.items()})
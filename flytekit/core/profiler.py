@@ -0,0 +1,233 @@
+"""
+Profiles where the time of a task execution goes. When ``FLYTE_SDK_PROFILING`` is enabled, every
+:py:class:`flytekit.core.utils.timeit` block run during a task execution is recorded as a span, nested under the
+blocks it runs in. Besides the wall and process time, each span records how much the resident memory of the process
+changed and how many bytes the ``FileAccessProvider`` downloaded and uploaded while it was open.
+
+At the end of the execution the spans are written as an OTLP style JSON trace next to the outputs of the task, and
+emitted as statsd timers and gauges. With ``FLYTE_SDK_PROFILE_CPU`` also enabled, the user code is run under cProfile
+and its stats are written next to the trace, so they can be loaded with :py:class:`pstats.Stats`.
+"""
+
+import contextlib
+import cProfile
+import json
+import marshal
+import os
+import re
+import resource
+import sys
+import time
+import uuid
+from contextvars import ContextVar
+from typing import Any, Dict, Iterator, List, Optional
+
+from flytekit.configuration.internal import LocalSDK
+from flytekit.loggers import logger
+
+TRACE_FILE_NAME = "profile.json"
+CPU_PROFILE_FILE_NAME = "profile.pstats"
+
+
+def _rss_bytes() -> int:
+    """
+    Returns the current resident set size of the process, or the peak resident set size where the current one can't
+    be read.
+    """
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # ru_maxrss is in bytes on macOS and in kilobytes everywhere else
+        return max_rss if sys.platform == "darwin" else max_rss * 1024
+
+
+def _path_size(path: str) -> int:
+    if os.path.isdir(path):
+        return sum(os.path.getsize(os.path.join(root, f)) for root, _, files in os.walk(path) for f in files)
+    return os.path.getsize(path) if os.path.exists(path) else 0
+
+
+class Span(object):
+    def __init__(self, name: str, parent: Optional["Span"] = None, metric: Optional[str] = None):
+        self.name = name
+        self.metric = metric or re.sub(r"[^a-z0-9]+", "_", name.lower()).strip("_")
+        self.parent = parent
+        self.span_id = uuid.uuid4().hex[:16]
+        self.start_time_ns = time.time_ns()
+        self.end_time_ns: Optional[int] = None
+        self._start_wall_time = time.perf_counter()
+        self._start_process_time = time.process_time()
+        self._start_rss = _rss_bytes()
+        self.wall_time = 0.0
+        self.process_time = 0.0
+        self.rss_delta = 0
+        self.bytes_read = 0
+        self.bytes_written = 0
+
+    def end(self):
+        self.end_time_ns = time.time_ns()
+        self.wall_time = time.perf_counter() - self._start_wall_time
+        self.process_time = time.process_time() - self._start_process_time
+        self.rss_delta = _rss_bytes() - self._start_rss
+
+    def to_otlp(self, trace_id: str) -> Dict[str, Any]:
+        attributes = {
+            "flyte.wall_time_s": {"doubleValue": self.wall_time},
+            "flyte.process_time_s": {"doubleValue": self.process_time},
+            "flyte.rss_delta_bytes": {"intValue": str(self.rss_delta)},
+            "flyte.bytes_read": {"intValue": str(self.bytes_read)},
+            "flyte.bytes_written": {"intValue": str(self.bytes_written)},
+        }
+        return {
+            "traceId": trace_id,
+            "spanId": self.span_id,
+            "parentSpanId": self.parent.span_id if self.parent else "",
+            "name": self.name,
+            "startTimeUnixNano": str(self.start_time_ns),
+            "endTimeUnixNano": str(self.end_time_ns or self.start_time_ns),
+            "attributes": [{"key": k, "value": v} for k, v in attributes.items()],
+        }
+
+
+class Profile(object):
+    """
+    The spans recorded during one task execution.
+    """
+
+    def __init__(self, task_name: str):
+        self.task_name = task_name
+        self.trace_id = uuid.uuid4().hex
+        self.spans: List[Span] = []
+        self.cpu_stats: Optional[Dict] = None
+
+    def to_otlp(self) -> Dict[str, Any]:
+        return {
+            "resourceSpans": [
+                {
+                    "resource": {
+                        "attributes": [
+                            {"key": "service.name", "value": {"stringValue": "flytekit"}},
+                            {"key": "flyte.task", "value": {"stringValue": self.task_name}},
+                        ]
+                    },
+                    "scopeSpans": [
+                        {
+                            "scope": {"name": "flytekit.profiler"},
+                            "spans": [s.to_otlp(self.trace_id) for s in self.spans],
+                        }
+                    ],
+                }
+            ]
+        }
+
+    def emit_stats(self, stats):
+        """
+        Emits the wall time, resident memory change and transferred bytes of every span, summed per span name.
+        """
+        totals: Dict[str, List[float]] = {}
+        for s in self.spans:
+            t = totals.setdefault(s.metric, [0.0, 0, 0, 0])
+            t[0] += s.wall_time
+            t[1] += s.rss_delta
+            t[2] += s.bytes_read
+            t[3] += s.bytes_written
+        for metric, (wall_time, rss_delta, bytes_read, bytes_written) in totals.items():
+            stats.timing(f"profile.{metric}", wall_time * 1000)
+            stats.gauge(f"profile.{metric}.rss_delta_bytes", rss_delta)
+            stats.gauge(f"profile.{metric}.bytes_read", bytes_read)
+            stats.gauge(f"profile.{metric}.bytes_written", bytes_written)
+
+    def export(self, file_access, output_prefix: str, stats=None):
+        """
+        Writes the trace and the cpu profile, if any, under the output prefix and emits the spans as statsd metrics.
+        """
+        fs = file_access.get_filesystem_for_path(output_prefix)
+        sep = file_access.sep(fs)
+        fs.pipe(f"{output_prefix}{sep}{TRACE_FILE_NAME}", json.dumps(self.to_otlp()).encode("utf-8"))
+        if self.cpu_stats is not None:
+            fs.pipe(f"{output_prefix}{sep}{CPU_PROFILE_FILE_NAME}", marshal.dumps(self.cpu_stats))
+        if stats is not None:
+            self.emit_stats(stats)
+
+
+_active_profile: ContextVar[Optional[Profile]] = ContextVar("flyte_profile", default=None)
+_current_span: ContextVar[Optional[Span]] = ContextVar("flyte_profile_span", default=None)
+
+
+def current_profile() -> Optional[Profile]:
+    return _active_profile.get()
+
+
+@contextlib.contextmanager
+def profile_task(task_name: str) -> Iterator[Optional[Profile]]:
+    """
+    Records the spans opened in this block, if profiling is enabled. The block itself is the root span.
+    """
+    if not LocalSDK.PROFILING.read():
+        yield None
+        return
+    profile = Profile(task_name)
+    token = _active_profile.set(profile)
+    try:
+        span = start_span(task_name, metric="task")
+        try:
+            yield profile
+        finally:
+            end_span(span)
+    finally:
+        _active_profile.reset(token)
+
+
+def start_span(name: str, metric: Optional[str] = None) -> Optional[Span]:
+    profile = _active_profile.get()
+    if profile is None:
+        return None
+    span = Span(name, parent=_current_span.get(), metric=metric)
+    profile.spans.append(span)
+    _current_span.set(span)
+    return span
+
+
+def end_span(span: Optional[Span]):
+    if span is None:
+        return
+    span.end()
+    _current_span.set(span.parent)
+
+
+def record_io(path: str, read: bool):
+    """
+    Adds the size of a downloaded or uploaded local file or directory to the open spans.
+    """
+    span = _current_span.get()
+    if span is None:
+        return
+    size = _path_size(path)
+    while span is not None:
+        if read:
+            span.bytes_read += size
+        else:
+            span.bytes_written += size
+        span = span.parent
+
+
+@contextlib.contextmanager
+def profile_cpu() -> Iterator[None]:
+    """
+    Runs the block under cProfile if profiling and cpu profiling are enabled.
+    """
+    profile = _active_profile.get()
+    if profile is None or not LocalSDK.PROFILE_CPU.read():
+        yield
+        return
+    p = cProfile.Profile()
+    p.enable()
+    try:
+        yield
+    finally:
+        p.disable()
+        p.create_stats()
+        profile.cpu_stats = p.stats  # type: ignore
+        logger.debug(f"Recorded cpu profile of {len(profile.cpu_stats)} functions")
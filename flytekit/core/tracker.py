@@ -3,6 +3,7 @@ import inspect
 import os
 import sys
 import typing
+import weakref
 from pathlib import Path
 from types import ModuleType
 from typing import Callable, Optional, Tuple, Union
@@ -25,6 +26,40 @@ def import_module_from_file(module_name, file):
         raise ModuleNotFoundError(f"Module from file {file} cannot be loaded") from exc
 
 
+class _GlobalsIndex(object):
+    """
+    Maps the ids of the globals of a module to their names, so the variables tracked instances are assigned to can be
+    found without going through all the globals of the module for every instance. The index is built on the first
+    lookup in a module and rebuilt when the module was reloaded or replaced, or a lookup misses.
+    """
+
+    # module name -> (module, id of global -> name of global)
+    _indices: typing.Dict[str, typing.Tuple[weakref.ref, typing.Dict[int, str]]] = {}
+
+    @classmethod
+    def _build(cls, m: ModuleType) -> typing.Dict[int, str]:
+        index: typing.Dict[int, str] = {}
+        # Same order as dir(), so the first name in alphabetical order is used for objects with multiple names
+        for k, v in sorted(vars(m).items(), key=lambda kv: kv[0]):
+            index.setdefault(id(v), k)
+        cls._indices[m.__name__] = (weakref.ref(m), index)
+        return index
+
+    @classmethod
+    def find(cls, m: ModuleType, o: typing.Any) -> Optional[str]:
+        """
+        Returns the name of a global of the module that refers to the object, if any.
+        """
+        g = vars(m)
+        entry = cls._indices.get(m.__name__)
+        index = entry[1] if entry is not None and entry[0]() is m else cls._build(m)
+        k = index.get(id(o))
+        # Ids of collected objects are reused, and globals may be reassigned or added after the index was built
+        if k is None or g.get(k) is not o:
+            k = cls._build(m).get(id(o))
+        return k
+
+
 class InstanceTrackingMeta(type):
     """
     Please see the original class :py:class`flytekit.common.mixins.registerable._InstanceTracker` also and also look
@@ -123,19 +158,11 @@ class TrackedInstance(metaclass=InstanceTrackingMeta):
 
         logger.debug(f"Looking for LHS for {self} from {self._instantiated_in}")
         m = importlib.import_module(self._instantiated_in)
-        for k in dir(m):
-            try:
-                if getattr(m, k) is self:
-                    logger.debug(f"Found LHS for {self}, {k}")
-                    self._lhs = k
-                    return k
-            except ValueError as err:
-                # Empty pandas dataframes behave weirdly here such that calling `m.df` raises:
-                # ValueError: The truth value of a {type(self).__name__} is ambiguous. Use a.empty, a.bool(), a.item(),
-                #   a.any() or a.all()
-                # Since dataframes aren't registrable entities to begin with we swallow any errors they raise and
-                # continue looping through m.
-                logger.warning("Caught ValueError {} while attempting to auto-assign name".format(err))
+        k = _GlobalsIndex.find(m, self)
+        if k is not None:
+            logger.debug(f"Found LHS for {self}, {k}")
+            self._lhs = k
+            return k
 
         # try to find object in module when the tracked instance is defined in the __main__ module
         module = import_module_from_file(self._instantiated_in, self._module_file)
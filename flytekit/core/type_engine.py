@@ -27,6 +27,7 @@ from typing_extensions import Annotated, get_args, get_origin
 from flytekit.core.annotation import FlyteAnnotation
 from flytekit.core.context_manager import FlyteContext
 from flytekit.core.hash import HashMethod
+from flytekit.core.native_passthrough import NativePassthrough
 from flytekit.core.type_helpers import load_type_from_tag
 from flytekit.core.utils import timeit
 from flytekit.exceptions import user as user_exceptions
@@ -912,7 +913,11 @@ class TypeEngine(typing.Generic[T]):
                 hash = annotation.calculate(python_val)
                 break
 
-        lv = transformer.to_literal(ctx, python_val, python_type, expected)
+        if NativePassthrough.supports(python_val, expected) and NativePassthrough.enabled(ctx):
+            # Keep the value in memory instead of writing it to the local sandbox
+            lv = NativePassthrough.to_literal(python_val, python_type, expected)
+        else:
+            lv = transformer.to_literal(ctx, python_val, python_type, expected)
 
         if hash is not None:
             lv.hash = hash
@@ -923,6 +928,8 @@ class TypeEngine(typing.Generic[T]):
         """
         Converts a Literal value with an expected python type into a python value.
         """
+        if NativePassthrough.is_passthrough(lv):
+            return NativePassthrough.to_python_value(ctx, lv, expected_python_type)
         transformer = cls.get_transformer(expected_python_type)
         return transformer.to_python_value(ctx, lv, expected_python_type)
 
@@ -270,7 +270,8 @@ class AutoDeletingTempDir(Directory):
 class timeit:
     """
     A context manager and a decorator that measures the execution time of the wrapped code block or functions.
-    It will append a timing information to TimeLineDeck. For instance:
+    It will append a timing information to TimeLineDeck, and record a span if the task execution is being profiled
+    (see :py:mod:`flytekit.core.profiler`). For instance:
 
     @timeit("Function description")
     def function()
@@ -279,11 +280,14 @@ class timeit:
         # your code
     """
 
-    def __init__(self, name: str = ""):
+    def __init__(self, name: str = "", metric: Optional[str] = None):
         """
         :param name: A string that describes the wrapped code block or function being executed.
+        :param metric: The name the span is emitted as to statsd when profiling, derived from the name by default.
         """
         self._name = name
+        self._metric = metric
+        self._span = None
         self.start_time = None
         self._start_wall_time = None
         self._start_process_time = None
@@ -291,12 +295,16 @@ class timeit:
     def __call__(self, func: Callable):
         @wraps(func)
         def wrapper(*args, **kwargs):
-            with self:
+            # Every call is timed by its own instance, so concurrent calls don't share their spans and start times
+            with timeit(self._name, self._metric):
                 return func(*args, **kwargs)
 
         return wrapper
 
     def __enter__(self):
+        from flytekit.core.profiler import start_span
+
+        self._span = start_span(self._name, self._metric)
         self.start_time = datetime.datetime.utcnow()
         self._start_wall_time = _time.perf_counter()
         self._start_process_time = _time.process_time()
@@ -308,10 +316,12 @@ class timeit:
         is solely to measure the execution time of the wrapped code block.
         """
         from flytekit.core.context_manager import FlyteContextManager
+        from flytekit.core.profiler import end_span
 
         end_time = datetime.datetime.utcnow()
         end_wall_time = _time.perf_counter()
         end_process_time = _time.process_time()
+        end_span(self._span)
 
         timeline_deck = FlyteContextManager.current_context().user_space_params.timeline_deck
         timeline_deck.append_time_info(
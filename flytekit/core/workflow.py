@@ -1,13 +1,20 @@
 from __future__ import annotations
 
 import asyncio
+import contextvars
+import importlib
 import inspect
+import sys
+import time
 import typing
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, ThreadPoolExecutor, wait
 from dataclasses import dataclass
 from enum import Enum
 from functools import update_wrapper
-from typing import Any, Callable, Coroutine, Dict, List, Optional, Tuple, Type, Union, cast, overload
+from typing import Any, Callable, Coroutine, Deque, Dict, List, Optional, Set, Tuple, Type, Union, cast, overload
 
+from flytekit.configuration.internal import LocalSDK
 from flytekit.core import constants as _common_constants
 from flytekit.core.base_task import PythonTask
 from flytekit.core.class_based_resolver import ClassStorageTaskResolver
@@ -18,6 +25,7 @@ from flytekit.core.context_manager import (
     FlyteContext,
     FlyteContextManager,
     FlyteEntities,
+    flyte_context_Var,
 )
 from flytekit.core.docstring import Docstring
 from flytekit.core.interface import (
@@ -27,6 +35,7 @@ from flytekit.core.interface import (
     transform_interface_to_typed_interface,
 )
 from flytekit.core.launch_plan import LaunchPlan
+from flytekit.core.native_passthrough import NativePassthrough
 from flytekit.core.node import Node
 from flytekit.core.promise import (
     NodeOutput,
@@ -174,6 +183,263 @@ def get_promise_map(
     return entity_kwargs
 
 
+def _collect_binding_upstreams(binding_data: _literal_models.BindingData, upstreams: Set[Node]):
+    if binding_data.promise is not None:
+        upstreams.add(binding_data.promise.node)
+    elif binding_data.collection is not None:
+        for bd in binding_data.collection.bindings:
+            _collect_binding_upstreams(bd, upstreams)
+    elif binding_data.map is not None:
+        for bd in binding_data.map.bindings.values():
+            _collect_binding_upstreams(bd, upstreams)
+
+
+def get_node_upstreams(node: Node) -> Set[Node]:
+    """
+    Returns every node the given node has to wait for, that is the nodes whose outputs it consumes through its bindings
+    and the nodes it was explicitly chained after (``>>``).
+    """
+    upstreams = set(node.upstream_nodes)
+    for b in node.bindings:
+        _collect_binding_upstreams(b.binding, upstreams)
+    upstreams.discard(GLOBAL_START_NODE)
+    return upstreams
+
+
+def get_output_map(entity: Any, results: Any) -> Dict[str, Promise]:
+    """
+    Turns what calling an entity returned during local execution into a map of the entity's output names to Promises.
+    """
+    expected_output_names = list(entity.python_interface.outputs.keys())
+
+    if isinstance(results, VoidPromise) or results is None:
+        return {}  # Move along, nothing to assign
+
+    # Because we should've already returned in the above check, we just raise an Exception here.
+    if len(expected_output_names) == 0:
+        raise FlyteValueException(results, "Interface output should've been VoidPromise or None.")
+
+    # if there's only one output,
+    if len(expected_output_names) == 1:
+        if entity.python_interface.output_tuple_name and isinstance(results, tuple):
+            return {expected_output_names[0]: results[0]}
+        return {expected_output_names[0]: results}
+
+    if len(results) != len(expected_output_names):
+        raise FlyteValueException(results, f"Different lengths {results} {expected_output_names}")
+    return {expected_output_names[idx]: r for idx, r in enumerate(results)}
+
+
+def execute_node(node: Node, outputs_cache: Dict[Node, Dict[str, Promise]]) -> Dict[str, Promise]:
+    """
+    Runs a single node locally. The entity of the node is called with the promises its bindings require, looked up in
+    the map of node outputs, and the outputs of the call are returned keyed by output name.
+    """
+    entity = node.flyte_entity
+    entity_kwargs = get_promise_map(node.bindings, outputs_cache)
+    return get_output_map(entity, entity(**entity_kwargs))
+
+
+def _execute_task_in_subprocess(
+    task_module: str, task_name: str, inputs: Dict[str, _literal_models.Literal]
+) -> Dict[str, _literal_models.Literal]:
+    """
+    Entry point of the worker processes of the LocalNodeScheduler. The task is re-imported by module and name, and
+    only literals cross the process boundary.
+    """
+    entity = getattr(importlib.import_module(task_module), task_name)
+    ctx = FlyteContextManager.current_context()
+    with FlyteContextManager.with_context(
+        ctx.with_execution_state(
+            ctx.new_execution_state().with_params(mode=ExecutionState.Mode.LOCAL_WORKFLOW_EXECUTION)
+        )
+    ):
+        results = entity(**{k: Promise(var=k, val=v) for k, v in inputs.items()})
+        return {k: NativePassthrough.materialize(ctx, p.val) for k, p in get_output_map(entity, results).items()}
+
+
+class LocalNodeScheduler(object):
+    """
+    Runs the nodes of a locally executed workflow concurrently. The dependency graph is built from the bindings and
+    upstream nodes of every node, and a node is started as soon as all of its upstream nodes have completed, so
+    independent branches overlap and a workflow takes about as long as its longest path. Once all nodes have run, the
+    critical path, i.e. the chain of dependent nodes that took the longest, is available and logged.
+
+    Nodes run on a thread pool. With the ``process`` executor, tasks that can be re-imported by module and name run in
+    a process pool instead, which avoids contention on the GIL for CPU bound tasks. Sub-workflows, launch plans and
+    tasks that cannot be re-imported still run on threads.
+    """
+
+    THREAD = "thread"
+    PROCESS = "process"
+
+    def __init__(
+        self,
+        max_workers: int,
+        executor: str = THREAD,
+        on_failure: WorkflowFailurePolicy = WorkflowFailurePolicy.FAIL_IMMEDIATELY,
+    ):
+        if max_workers < 1:
+            raise ValueError(f"max_workers must be at least 1, received {max_workers}")
+        if executor not in (self.THREAD, self.PROCESS):
+            raise ValueError(f"Unknown local executor {executor}, expected one of {self.THREAD}, {self.PROCESS}")
+        self._max_workers = max_workers
+        self._executor = executor
+        self._on_failure = on_failure
+        self._node_durations: Dict[Node, float] = {}
+        self._critical_path: List[Node] = []
+
+    @classmethod
+    def from_config(cls, on_failure: WorkflowFailurePolicy) -> Optional[LocalNodeScheduler]:
+        """
+        Returns a scheduler configured through ``FLYTE_SDK_LOCAL_PARALLELISM`` and ``FLYTE_SDK_LOCAL_EXECUTOR``, or None
+        if local executions should run nodes one after the other.
+        """
+        parallelism = LocalSDK.LOCAL_PARALLELISM.read() or 1
+        if parallelism <= 1:
+            return None
+        return cls(parallelism, LocalSDK.LOCAL_EXECUTOR.read() or cls.THREAD, on_failure)
+
+    @staticmethod
+    def can_schedule(nodes: List[Node]) -> bool:
+        """
+        Only tasks, workflows and launch plans are run by the scheduler. Conditionals and other node types are only
+        evaluated correctly by running the workflow function itself.
+        """
+        return all(isinstance(n.flyte_entity, (PythonTask, WorkflowBase, LaunchPlan)) for n in nodes)
+
+    @property
+    def node_durations(self) -> Dict[Node, float]:
+        return self._node_durations
+
+    @property
+    def critical_path(self) -> List[Node]:
+        return self._critical_path
+
+    @property
+    def critical_path_duration(self) -> float:
+        return sum(self._node_durations[n] for n in self._critical_path)
+
+    def run(self, nodes: List[Node], outputs_cache: Dict[Node, Dict[str, Promise]]) -> Dict[Node, Dict[str, Promise]]:
+        """
+        Runs all the given nodes, filling in their outputs in the given map which should already hold the outputs of
+        the global input node.
+        """
+        node_set = set(nodes)
+        upstreams = {n: get_node_upstreams(n) & node_set for n in nodes}
+        downstreams: Dict[Node, List[Node]] = {n: [] for n in nodes}
+        for n in nodes:
+            for u in upstreams[n]:
+                downstreams[u].append(n)
+        pending = {n: len(upstreams[n]) for n in nodes}
+        # Ready nodes are started in declaration order
+        ready: Deque[Node] = deque(n for n in nodes if pending[n] == 0)
+        running: Dict[Future, Node] = {}
+        completed: List[Node] = []
+        error: Optional[BaseException] = None
+
+        context_stack = list(flyte_context_Var.get())
+        thread_pool = ThreadPoolExecutor(max_workers=self._max_workers, thread_name_prefix="flyte-local-node")
+        process_pool = None
+        if self._executor == self.PROCESS and any(self._subprocess_target(n) for n in nodes):
+            process_pool = ProcessPoolExecutor(max_workers=self._max_workers)
+        try:
+            while ready or running:
+                while ready and len(running) < self._max_workers:
+                    node = ready.popleft()
+                    entity_kwargs = get_promise_map(node.bindings, outputs_cache)
+                    running[thread_pool.submit(self._run_node, context_stack, process_pool, node, entity_kwargs)] = node
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for f in done:
+                    node = running.pop(f)
+                    try:
+                        outputs_cache[node], self._node_durations[node] = f.result()
+                    except BaseException as e:
+                        logger.error(f"Node {node.id} failed during local execution: {e}")
+                        error = error or e
+                        if self._on_failure == WorkflowFailurePolicy.FAIL_IMMEDIATELY:
+                            ready.clear()
+                        # Nodes downstream of a failed node never become ready
+                        continue
+                    completed.append(node)
+                    for d in downstreams[node]:
+                        pending[d] -= 1
+                        if pending[d] == 0 and (
+                            error is None or self._on_failure != WorkflowFailurePolicy.FAIL_IMMEDIATELY
+                        ):
+                            ready.append(d)
+        finally:
+            thread_pool.shutdown(wait=True)
+            if process_pool is not None:
+                process_pool.shutdown(wait=True)
+
+        if error is not None:
+            raise error
+
+        self._critical_path = self._find_critical_path(completed, upstreams)
+        if self._critical_path:
+            logger.info(
+                f"Critical path of the local execution ({self.critical_path_duration:.3f}s): "
+                + " -> ".join(f"{n.id} ({self._node_durations[n]:.3f}s)" for n in self._critical_path)
+            )
+        return outputs_cache
+
+    @staticmethod
+    def _subprocess_target(node: Node) -> Optional[Tuple[str, str]]:
+        entity = node.flyte_entity
+        if not isinstance(entity, PythonAutoContainerTask):
+            return None
+        try:
+            task_module, task_name = entity.instantiated_in, entity.lhs
+        except Exception:
+            return None
+        if getattr(sys.modules.get(task_module), task_name, None) is not entity:
+            return None
+        return task_module, task_name
+
+    def _run_node(
+        self,
+        context_stack: List[FlyteContext],
+        process_pool: Optional[ProcessPoolExecutor],
+        node: Node,
+        entity_kwargs: Dict[str, Promise],
+    ) -> Tuple[Dict[str, Promise], float]:
+        def _run() -> Tuple[Dict[str, Promise], float]:
+            # Each node gets its own copy of the context stack, so that contexts pushed by concurrently running nodes
+            # do not interleave.
+            flyte_context_Var.set(list(context_stack))
+            start = time.perf_counter()
+            target = self._subprocess_target(node) if process_pool is not None else None
+            if target is not None:
+                # Values kept in memory by this process have to be written out for the worker process to read them
+                ctx = FlyteContextManager.current_context()
+                inputs = {k: NativePassthrough.materialize(ctx, p.val) for k, p in entity_kwargs.items()}
+                literals = process_pool.submit(_execute_task_in_subprocess, *target, inputs).result()  # type: ignore
+                outputs = {k: Promise(var=k, val=v) for k, v in literals.items()}
+            else:
+                outputs = get_output_map(node.flyte_entity, node.flyte_entity(**entity_kwargs))
+            return outputs, time.perf_counter() - start
+
+        return contextvars.Context().run(_run)
+
+    def _find_critical_path(self, completed: List[Node], upstreams: Dict[Node, Set[Node]]) -> List[Node]:
+        # Nodes complete in a topological order, so the longest path ending at every node can be found in one pass.
+        finish: Dict[Node, float] = {}
+        previous: Dict[Node, Optional[Node]] = {}
+        for n in completed:
+            slowest = max(upstreams[n], key=lambda u: finish[u], default=None)
+            finish[n] = self._node_durations[n] + (finish[slowest] if slowest is not None else 0.0)
+            previous[n] = slowest
+        if not finish:
+            return []
+        path: List[Node] = []
+        node: Optional[Node] = max(finish, key=lambda n: finish[n])
+        while node is not None:
+            path.append(node)
+            node = previous[node]
+        return list(reversed(path))
+
+
 class WorkflowBase(object):
     def __init__(
         self,
@@ -351,6 +617,27 @@ class WorkflowBase(object):
         """ """
         return ExecutionState.Mode.LOCAL_WORKFLOW_EXECUTION
 
+    def _outputs_from_bindings(
+        self, intermediate_node_outputs: Dict[Node, Dict[str, Promise]]
+    ) -> Union[Tuple[Promise, ...], Promise, VoidPromise]:
+        if len(self.python_interface.outputs) == 0:
+            return VoidPromise(self.name)
+
+        # The values that we return below from the output have to be pulled by fulfilling all of the
+        # workflow's output bindings.
+        # The return style here has to match what 1) what the workflow would've returned had it been declared
+        # functionally, and 2) what a user would return in mock function. That is, if it's a tuple, then it
+        # should be a tuple here, if it's a one element named tuple, then we do a one-element non-named tuple,
+        # if it's a single element then we return a single element
+        if len(self.output_bindings) == 1:
+            # Again use presence of output_tuple_name to understand that we're dealing with a one-element
+            # named tuple
+            if self.python_interface.output_tuple_name:
+                return (get_promise(self.output_bindings[0].binding, intermediate_node_outputs),)
+            # Just a normal single element
+            return get_promise(self.output_bindings[0].binding, intermediate_node_outputs)
+        return tuple([get_promise(b.binding, intermediate_node_outputs) for b in self.output_bindings])
+
 
 class ImperativeWorkflow(WorkflowBase):
     """
@@ -452,59 +739,18 @@ class ImperativeWorkflow(WorkflowBase):
         for k, v in kwargs.items():
             intermediate_node_outputs[GLOBAL_START_NODE][k] = v
 
-        # Next iterate through the nodes in order.
-        for node in self.compilation_state.nodes:
-            if node not in intermediate_node_outputs.keys():
-                intermediate_node_outputs[node] = {}
-
-            # Retrieve the entity from the node, and call it by looking up the promises the node's bindings require,
-            # and then fill them in using the node output tracker map we have.
-            entity = node.flyte_entity
-            entity_kwargs = get_promise_map(node.bindings, intermediate_node_outputs)
-
-            # Handle the calling and outputs of each node's entity
-            results = entity(**entity_kwargs)
-            expected_output_names = list(entity.python_interface.outputs.keys())
-
-            if isinstance(results, VoidPromise) or results is None:
-                continue  # pragma: no cover # Move along, nothing to assign
-
-            # Because we should've already returned in the above check, we just raise an Exception here.
-            if len(entity.python_interface.outputs) == 0:
-                raise FlyteValueException(results, "Interface output should've been VoidPromise or None.")
-
-            # if there's only one output,
-            if len(expected_output_names) == 1:
-                if entity.python_interface.output_tuple_name and isinstance(results, tuple):
-                    intermediate_node_outputs[node][expected_output_names[0]] = results[0]
-                else:
-                    intermediate_node_outputs[node][expected_output_names[0]] = results
-
-            else:
-                if len(results) != len(expected_output_names):
-                    raise FlyteValueException(results, f"Different lengths {results} {expected_output_names}")
-                for idx, r in enumerate(results):
-                    intermediate_node_outputs[node][expected_output_names[idx]] = r
+        scheduler = LocalNodeScheduler.from_config(self.workflow_metadata.on_failure)
+        if scheduler is not None and LocalNodeScheduler.can_schedule(self.compilation_state.nodes):
+            # Independent nodes run concurrently, as soon as the nodes they depend on have completed.
+            scheduler.run(self.compilation_state.nodes, intermediate_node_outputs)
+        else:
+            # Next iterate through the nodes in order.
+            for node in self.compilation_state.nodes:
+                intermediate_node_outputs[node] = execute_node(node, intermediate_node_outputs)
 
         # The rest of this function looks like the above but now we're doing it for the workflow as a whole rather
         # than just one node at a time.
-        if len(self.python_interface.outputs) == 0:
-            return VoidPromise(self.name)
-
-        # The values that we return below from the output have to be pulled by fulfilling all of the
-        # workflow's output bindings.
-        # The return style here has to match what 1) what the workflow would've returned had it been declared
-        # functionally, and 2) what a user would return in mock function. That is, if it's a tuple, then it
-        # should be a tuple here, if it's a one element named tuple, then we do a one-element non-named tuple,
-        # if it's a single element then we return a single element
-        if len(self.output_bindings) == 1:
-            # Again use presence of output_tuple_name to understand that we're dealing with a one-element
-            # named tuple
-            if self.python_interface.output_tuple_name:
-                return (get_promise(self.output_bindings[0].binding, intermediate_node_outputs),)
-            # Just a normal single element
-            return get_promise(self.output_bindings[0].binding, intermediate_node_outputs)
-        return tuple([get_promise(b.binding, intermediate_node_outputs) for b in self.output_bindings])
+        return self._outputs_from_bindings(intermediate_node_outputs)
 
     def add_entity(self, entity: Union[PythonTask, LaunchPlan, WorkflowBase], **kwargs) -> Node:
         """
@@ -742,7 +988,15 @@ class PythonFunctionWorkflow(WorkflowBase, ClassStorageTaskResolver):
         This function is here only to try to streamline the pattern between workflows and tasks. Since tasks
         call execute from dispatch_execute which is in local_execute, workflows should also call an execute inside
         local_execute. This makes mocking cleaner.
+
+        When concurrent local execution is enabled (see ``LocalNodeScheduler``), the compiled nodes are run instead of
+        the workflow function, so that independent nodes can run at the same time.
         """
+        scheduler = LocalNodeScheduler.from_config(self.workflow_metadata.on_failure)
+        if scheduler is not None and LocalNodeScheduler.can_schedule(self.nodes):
+            intermediate_node_outputs: Dict[Node, Dict[str, Promise]] = {GLOBAL_START_NODE: dict(kwargs)}
+            scheduler.run(self.nodes, intermediate_node_outputs)
+            return self._outputs_from_bindings(intermediate_node_outputs)
         return exception_scopes.user_entry_point(self._workflow_function)(**kwargs)
 
 
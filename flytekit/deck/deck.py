@@ -1,13 +1,30 @@
+import contextvars
 import os
+import queue
+import threading
+import time
 import typing
-from typing import Optional
-
-from flytekit.core.context_manager import ExecutionParameters, ExecutionState, FlyteContext, FlyteContextManager
+from concurrent.futures import Future
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from typing import Any, Callable, Dict, List, Optional, Union
+
+from flytekit.configuration.internal import LocalSDK
+from flytekit.core.context_manager import (
+    ExecutionParameters,
+    ExecutionState,
+    FlyteContext,
+    FlyteContextManager,
+    flyte_context_Var,
+)
 from flytekit.loggers import logger
 from flytekit.tools.interactive import ipython_check
 
 OUTPUT_DIR_JUPYTER_PREFIX = "jupyter"
 DECK_FILE_NAME = "deck.html"
+DEFAULT_RENDER_MAX_BYTES = 10 * 1024 * 1024
+DEFAULT_RENDER_TIMEOUT = 60
+# Number of threads that render decks in the background
+RENDER_WORKERS = 4
 
 
 class Deck:
@@ -56,11 +73,24 @@ class Deck:
     def __init__(self, name: str, html: Optional[str] = ""):
         self._name = name
         self._html = html
+        self._pending: List[Union[str, _PendingHtml]] = []
         FlyteContextManager.current_context().user_space_params.decks.append(self)
 
     def append(self, html: str) -> "Deck":
         assert isinstance(html, str)
-        self._html = self._html + "\n" + html
+        if self._pending:
+            # Keep the order with the html that is still being rendered
+            self._pending.append(html)
+        else:
+            self._html = self._html + "\n" + html
+        return self
+
+    def append_async(self, render: Callable[..., str], *args: Any) -> "Deck":
+        """
+        Renders the html in the background and appends it once it is done. The html is waited for when the deck is
+        read, for at most the configured render timeout.
+        """
+        self._pending.append(_PendingHtml(render, *args))
         return self
 
     @property
@@ -69,6 +99,10 @@ class Deck:
 
     @property
     def html(self) -> str:
+        if self._pending:
+            pending, self._pending = self._pending, []
+            for p in pending:
+                self._html = self._html + "\n" + (p if isinstance(p, str) else p.result())
         return self._html
 
 
@@ -122,6 +156,120 @@ class TimeLineDeck(Deck):
         return gantt_chart_html + time_table_html + note
 
 
+_render_queue: "queue.SimpleQueue[Callable[[], None]]" = queue.SimpleQueue()
+_render_workers: List[threading.Thread] = []
+# Deadlines of the renders the workers are running
+_render_deadlines: Dict[threading.Thread, float] = {}
+_render_workers_lock = threading.Lock()
+
+
+def _start_render_worker():
+    t = threading.Thread(target=_render_worker, name="flyte-deck-renderer", daemon=True)
+    t.start()
+    _render_workers.append(t)
+
+
+def _render_worker():
+    me = threading.current_thread()
+    while True:
+        _render_queue.get()()
+        with _render_workers_lock:
+            # The worker was replaced while its render ran past its deadline
+            if me not in _render_workers:
+                return
+
+
+def _submit_render(fn: Callable[[], None]):
+    """
+    Runs the function on one of a bounded number of daemon threads, so that a renderer running past its time budget
+    does not keep the process alive.
+    """
+    with _render_workers_lock:
+        if len(_render_workers) < RENDER_WORKERS:
+            _start_render_worker()
+    _render_queue.put(fn)
+
+
+def _replace_stuck_workers():
+    """
+    Stops counting the workers whose render ran past its deadline, and starts new ones in their place, so that hung
+    renderers don't hold up the renders queued after them.
+    """
+    now = time.monotonic()
+    with _render_workers_lock:
+        for t, deadline in list(_render_deadlines.items()):
+            if deadline <= now and t in _render_workers:
+                _render_workers.remove(t)
+                _start_render_worker()
+
+
+class _PendingHtml(object):
+    """
+    Html that is being rendered in the background.
+    """
+
+    def __init__(self, render: Callable[..., str], *args: Any):
+        self._future: Future = Future()
+        self._started = threading.Event()
+        self._deadline = 0.0
+        # Renderers may look up the current flyte context, which is a stack that has to be copied for every thread
+        context = contextvars.Context()
+        context.run(flyte_context_Var.set, list(flyte_context_Var.get()))
+        _submit_render(lambda: context.run(self._run, render, *args))
+
+    def _run(self, render: Callable[..., str], *args: Any):
+        # The time budget starts when the render does, not while it waits for a worker
+        timeout = LocalSDK.DECK_RENDER_TIMEOUT.read()
+        self._deadline = time.monotonic() + (DEFAULT_RENDER_TIMEOUT if timeout is None else timeout)
+        me = threading.current_thread()
+        with _render_workers_lock:
+            _render_deadlines[me] = self._deadline
+        self._started.set()
+        try:
+            self._future.set_result(render(*args))
+        except BaseException as e:
+            self._future.set_exception(e)
+        finally:
+            with _render_workers_lock:
+                _render_deadlines.pop(me, None)
+
+    def result(self) -> str:
+        # Every render ahead of this one either finishes or is given up on at its deadline
+        while not self._started.wait(timeout=0.1):
+            _replace_stuck_workers()
+        try:
+            return self._future.result(timeout=max(0.0, self._deadline - time.monotonic()))
+        except FutureTimeoutError:
+            _replace_stuck_workers()
+            logger.warning("Rendering the deck took longer than the render timeout, leaving the value out.")
+            return "<p>Rendering timed out.</p>"
+        except Exception as e:
+            logger.warning(f"Failed to render deck with error {e}.")
+            return f"<p>Rendering failed: {type(e).__name__}.</p>"
+
+
+def _truncate_html(html: str) -> str:
+    max_bytes = LocalSDK.DECK_RENDER_MAX_BYTES.read()
+    if max_bytes is None:
+        max_bytes = DEFAULT_RENDER_MAX_BYTES
+    data = html.encode("utf-8")
+    if len(data) <= max_bytes:
+        return html
+    return (
+        data[:max_bytes].decode("utf-8", errors="ignore")
+        + f"\n<p><strong>Truncated {len(data) - max_bytes} bytes of html.</strong></p>"
+    )
+
+
+def render_html(ctx: FlyteContext, python_val: Any, python_type: typing.Type) -> str:
+    """
+    Renders the value with TypeEngine.to_html, truncated to the configured byte budget.
+    """
+    from flytekit.core.type_engine import TypeEngine
+
+    return _truncate_html(TypeEngine.to_html(ctx, python_val, python_type))
+
+
 def _get_deck(
     new_user_params: ExecutionParameters, ignore_jupyter: bool = False
 ) -> typing.Union[str, "IPython.core.display.HTML"]:  # type:ignore
@@ -140,22 +288,37 @@ def _get_deck(
     return raw_html
 
 
+def _write_deck(f: typing.IO, new_user_params: ExecutionParameters):
+    deck_map = {deck.name: deck.html for deck in new_user_params.decks}
+    for chunk in get_deck_template().generate(metadata=deck_map):
+        f.write(chunk)
+
+
+def _content_type_kwargs(fs) -> Dict[str, str]:
+    protocol = fs.protocol if isinstance(fs.protocol, str) else fs.protocol[0]
+    if protocol in ("s3", "s3a"):
+        return {"ContentType": "text/html"}
+    if protocol in ("gs", "gcs"):
+        return {"content_type": "text/html"}
+    return {}
+
+
 def _output_deck(task_name: str, new_user_params: ExecutionParameters):
     ctx = FlyteContext.current_context()
-    local_dir = ctx.file_access.get_random_local_directory()
-    local_path = f"{local_dir}{os.sep}{DECK_FILE_NAME}"
     try:
-        with open(local_path, "w", encoding="utf-8") as f:
-            f.write(_get_deck(new_user_params, ignore_jupyter=True))
-        logger.info(f"{task_name} task creates flyte deck html to file://{local_path}")
         if ctx.execution_state.mode == ExecutionState.Mode.TASK_EXECUTION:
+            # Stream the deck straight to the remote store instead of staging it in a local file
             fs = ctx.file_access.get_filesystem_for_path(new_user_params.output_metadata_prefix)
             remote_path = f"{new_user_params.output_metadata_prefix}{ctx.file_access.sep(fs)}{DECK_FILE_NAME}"
-            kwargs: typing.Dict[str, str] = {
-                "ContentType": "text/html",  # For s3
-                "content_type": "text/html",  # For gcs
-            }
-            ctx.file_access.put_data(local_path, remote_path, **kwargs)
+            with fs.open(remote_path, "w", encoding="utf-8", **_content_type_kwargs(fs)) as f:
+                _write_deck(f, new_user_params)
+            logger.info(f"{task_name} task creates flyte deck html to {remote_path}")
+        else:
+            local_dir = ctx.file_access.get_random_local_directory()
+            local_path = f"{local_dir}{os.sep}{DECK_FILE_NAME}"
+            with open(local_path, "w", encoding="utf-8") as f:
+                _write_deck(f, new_user_params)
+            logger.info(f"{task_name} task creates flyte deck html to file://{local_path}")
     except Exception as e:
         logger.error(f"Failed to write flyte deck html with error {e}.")
 
@@ -48,3 +48,13 @@ class ArrowRenderer:
     def to_html(self, df: "pyarrow.Table") -> str:
         assert isinstance(df, pyarrow.Table)
         return df.to_string()
+
+
+class ArrowDatasetRenderer:
+    """
+    Render the schema of an Arrow dataset as an HTML table, without scanning the dataset.
+    """
+
+    def to_html(self, dataset: "pyarrow.dataset.Dataset") -> str:
+        schema = dataset.schema
+        return pandas.DataFrame({"column": schema.names, "type": [str(t) for t in schema.types]}).to_html(index=False)
@@ -1,4 +1,3 @@
-import pathlib
 import typing
 from dataclasses import asdict, dataclass, fields, is_dataclass
 from typing import Any, Callable, Dict, NamedTuple, Optional, Type, Union
@@ -9,6 +8,7 @@ from typing_extensions import Protocol
 
 from flytekit.core.context_manager import FlyteContext
 from flytekit.core.type_engine import TypeEngine, TypeTransformer, TypeTransformerFailedError
+from flytekit.extras.pytorch.native import local_path_for, torch_load, write_to_remote
 from flytekit.models.core import types as _core_types
 from flytekit.models.literals import Blob, BlobMetadata, Literal, Scalar
 from flytekit.models.types import LiteralType
@@ -75,9 +75,6 @@ class PyTorchCheckpointTransformer(TypeTransformer[PyTorchCheckpoint]):
             )
         )
 
-        local_path = ctx.file_access.get_random_local_path() + ".pt"
-        pathlib.Path(local_path).parent.mkdir(parents=True, exist_ok=True)
-
         to_save = {}
         for field in fields(python_val):
             value = getattr(python_val, field.name)
@@ -95,11 +92,8 @@ class PyTorchCheckpointTransformer(TypeTransformer[PyTorchCheckpoint]):
         if not to_save:
             raise TypeTransformerFailedError(f"Cannot save empty {python_val}")
 
-        # save checkpoint to a file
-        torch.save(to_save, local_path)
-
-        remote_path = ctx.file_access.get_random_remote_path(local_path)
-        ctx.file_access.put_data(local_path, remote_path, is_multipart=False)
+        # save checkpoint to the remote file directly
+        remote_path = write_to_remote(ctx, "checkpoint.pt", lambda f: torch.save(to_save, f))
         return Literal(scalar=Scalar(blob=Blob(metadata=meta, uri=remote_path)))
 
     def to_python_value(
@@ -110,17 +104,8 @@ class PyTorchCheckpointTransformer(TypeTransformer[PyTorchCheckpoint]):
         except AttributeError:
             TypeTransformerFailedError(f"Cannot convert from {lv} to {expected_python_type}")
 
-        local_path = ctx.file_access.get_random_local_path()
-        ctx.file_access.get_data(uri, local_path, is_multipart=False)
-
-        # cpu <-> gpu conversion
-        if torch.cuda.is_available():
-            map_location = "cuda:0"
-        else:
-            map_location = torch.device("cpu")
-
         # load checkpoint from a file
-        return typing.cast(PyTorchCheckpoint, torch.load(local_path, map_location=map_location))
+        return typing.cast(PyTorchCheckpoint, torch_load(local_path_for(ctx, uri)))
 
     def guess_python_type(self, literal_type: LiteralType) -> Type[PyTorchCheckpoint]:
         if (
@@ -1,8 +1,15 @@
-import pathlib
-from typing import Type, TypeVar
+import json
+import math
+import mmap
+import os
+import struct
+import typing
+import zipfile
+from typing import IO, Callable, Dict, Optional, Type, TypeVar
 
 import torch
 
+from flytekit.configuration.internal import LocalSDK
 from flytekit.core.context_manager import FlyteContext
 from flytekit.core.type_engine import TypeEngine, TypeTransformer, TypeTransformerFailedError
 from flytekit.models.core import types as _core_types
@@ -11,6 +18,137 @@ from flytekit.models.types import LiteralType
 
 T = TypeVar("T")
 
+# Names of the dtypes in the safetensors format
+_SAFETENSORS_DTYPES = {
+    torch.float64: "F64",
+    torch.float32: "F32",
+    torch.float16: "F16",
+    torch.bfloat16: "BF16",
+    torch.int64: "I64",
+    torch.int32: "I32",
+    torch.int16: "I16",
+    torch.int8: "I8",
+    torch.uint8: "U8",
+    torch.bool: "BOOL",
+}
+_TORCH_DTYPES = {v: k for k, v in _SAFETENSORS_DTYPES.items()}
+SAFETENSORS_KEY = "tensor"
+
+
+def supports_safetensors(t: torch.Tensor) -> bool:
+    """
+    Returns whether the tensor can be written in the safetensors format, which only holds dense tensors of the dtypes
+    it names.
+    """
+    return t.layout == torch.strided and t.dtype in _SAFETENSORS_DTYPES and t.device.type != "meta"
+
+
+def save_tensors(tensors: Dict[str, torch.Tensor], f: IO[bytes], metadata: Optional[Dict[str, str]] = None):
+    """
+    Writes tensors in the safetensors format: the length of a json header, the header, which has the dtype, shape and
+    byte range of each tensor, and then the raw bytes of the tensors. The bytes are written straight from the memory of
+    the tensors, which only need to be copied if they are not contiguous or not on the cpu.
+    """
+    unsupported = [n for n, t in tensors.items() if not supports_safetensors(t)]
+    if unsupported:
+        raise ValueError(f"Tensors {unsupported} can't be written in the safetensors format")
+    # Larger dtypes first, so that every tensor is aligned to its element size
+    names = sorted(tensors, key=lambda n: -tensors[n].element_size())
+    header: Dict[str, typing.Any] = {"__metadata__": metadata} if metadata else {}
+    offset = 0
+    for name in names:
+        t = tensors[name]
+        nbytes = t.numel() * t.element_size()
+        header[name] = {
+            "dtype": _SAFETENSORS_DTYPES[t.dtype],
+            "shape": list(t.shape),
+            "data_offsets": [offset, offset + nbytes],
+        }
+        offset += nbytes
+    header_bytes = json.dumps(header, separators=(",", ":")).encode("utf-8")
+    # Pad the header so that the data starts 8 byte aligned
+    header_bytes += b" " * (-len(header_bytes) % 8)
+    f.write(struct.pack("<Q", len(header_bytes)))
+    f.write(header_bytes)
+    for name in names:
+        t = tensors[name].detach().cpu().contiguous()
+        if t.numel() > 0:
+            f.write(memoryview(t.reshape(-1).view(torch.uint8).numpy()))
+
+
+def is_safetensors_file(path: str) -> bool:
+    with open(path, "rb") as f:
+        head = f.read(9)
+    return len(head) == 9 and head[8:9] == b"{"
+
+
+def load_tensors(path: str) -> Dict[str, torch.Tensor]:
+    """
+    Memory maps the tensors of a file written by save_tensors, or by safetensors. The contents of the tensors are only
+    read from disk when they are used. Writes to the tensors are not written back to the file.
+    """
+    with open(path, "rb") as f:
+        (n,) = struct.unpack("<Q", f.read(8))
+        header = json.loads(f.read(n))
+        has_data = os.fstat(f.fileno()).st_size > 8 + n
+        buf = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_COPY) if has_data else None
+
+    tensors = {}
+    for name, info in header.items():
+        if name == "__metadata__":
+            continue
+        dtype = _TORCH_DTYPES[info["dtype"]]
+        start, _ = info["data_offsets"]
+        numel = math.prod(info["shape"])
+        if numel == 0 or buf is None:
+            tensors[name] = torch.empty(info["shape"], dtype=dtype)
+        else:
+            tensors[name] = torch.frombuffer(buf, dtype=dtype, count=numel, offset=8 + n + start).reshape(info["shape"])
+    return tensors
+
+
+def write_to_remote(ctx: FlyteContext, file_name: str, write: Callable[[IO[bytes]], None]) -> str:
+    """
+    Streams what write writes to a new remote file, without staging it in a local file first.
+    """
+    remote_path = ctx.file_access.get_random_remote_path(file_name)
+    fs = ctx.file_access.get_filesystem_for_path(remote_path)
+    fs.makedirs(fs._parent(remote_path), exist_ok=True)
+    with fs.open(remote_path, "wb") as f:
+        write(f)
+    return remote_path
+
+
+def local_path_for(ctx: FlyteContext, uri: str) -> str:
+    """
+    Returns a local path with the contents of uri, which is only downloaded if it is not a local file already.
+    """
+    if not ctx.file_access.is_remote(uri):
+        return ctx.file_access.strip_file_header(uri)
+    local_path = ctx.file_access.get_random_local_path()
+    ctx.file_access.get_data(uri, local_path, is_multipart=False)
+    return local_path
+
+
+def torch_load(path: str) -> typing.Any:
+    """
+    Loads a file written by torch.save. The tensors are memory mapped, if the file and the installed torch version
+    support it, so that they are only read when they are used.
+    """
+    # cpu <-> gpu conversion
+    if torch.cuda.is_available():
+        map_location = "cuda:0"
+    else:
+        map_location = torch.device("cpu")
+
+    if zipfile.is_zipfile(path):
+        try:
+            return torch.load(path, map_location=map_location, mmap=True)
+        except TypeError:
+            # torch < 2.1 can't memory map
+            pass
+    return torch.load(path, map_location=map_location)
+
 
 class PyTorchTypeTransformer(TypeTransformer[T]):
     def get_literal_type(self, t: Type[T]) -> LiteralType:
@@ -35,14 +173,18 @@ class PyTorchTypeTransformer(TypeTransformer[T]):
             )
         )
 
-        local_path = ctx.file_access.get_random_local_path() + ".pt"
-        pathlib.Path(local_path).parent.mkdir(parents=True, exist_ok=True)
-
-        # save pytorch tensor/module to a file
-        torch.save(python_val, local_path)
-
-        remote_path = ctx.file_access.get_random_remote_path(local_path)
-        ctx.file_access.put_data(local_path, remote_path, is_multipart=False)
+        # save pytorch tensor/module to the remote file directly, other tensors than dense ones of the dtypes
+        # safetensors supports are saved with torch.save
+        if (
+            isinstance(python_val, torch.Tensor)
+            and LocalSDK.PYTORCH_SAFETENSORS.read()
+            and supports_safetensors(python_val)
+        ):
+            remote_path = write_to_remote(
+                ctx, "tensor.safetensors", lambda f: save_tensors({SAFETENSORS_KEY: python_val}, f)
+            )
+        else:
+            remote_path = write_to_remote(ctx, "model.pt", lambda f: torch.save(python_val, f))
         return Literal(scalar=Scalar(blob=Blob(metadata=meta, uri=remote_path)))
 
     def to_python_value(self, ctx: FlyteContext, lv: Literal, expected_python_type: Type[T]) -> T:
@@ -51,17 +193,13 @@ class PyTorchTypeTransformer(TypeTransformer[T]):
         except AttributeError:
             TypeTransformerFailedError(f"Cannot convert from {lv} to {expected_python_type}")
 
-        local_path = ctx.file_access.get_random_local_path()
-        ctx.file_access.get_data(uri, local_path, is_multipart=False)
-
-        # cpu <-> gpu conversion
-        if torch.cuda.is_available():
-            map_location = "cuda:0"
-        else:
-            map_location = torch.device("cpu")
+        local_path = local_path_for(ctx, uri)
+        if is_safetensors_file(local_path):
+            tensor = load_tensors(local_path)[SAFETENSORS_KEY]
+            return typing.cast(T, tensor.to("cuda:0") if torch.cuda.is_available() else tensor)
 
         # load pytorch tensor/module from a file
-        return torch.load(local_path, map_location=map_location)
+        return torch_load(local_path)
 
 
 class PyTorchTensorTransformer(PyTorchTypeTransformer[torch.Tensor]):
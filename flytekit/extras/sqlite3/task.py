@@ -3,6 +3,7 @@ import os
 import shutil
 import sqlite3
 import tempfile
+import threading
 import typing
 from dataclasses import dataclass
 
@@ -44,10 +45,14 @@ class SQLite3Config(object):
         uri: default FlyteFile that will be downloaded on execute
         compressed: Boolean that indicates if the given file is a compressed archive. Supported file types are
                     [zip, tar, gztar, bztar, xztar]
+        chunksize: If set, query results are read ``chunksize`` rows at a time and each chunk is written as a part of a
+                   multi-part Parquet StructuredDataset as it arrives, instead of loading the whole result in memory.
+                   Requires a StructuredDataset ``output_schema_type``.
     """
 
     uri: str
     compressed: bool = False
+    chunksize: typing.Optional[int] = None
 
 
 class SQLite3Task(PythonCustomizedContainerTask[SQLite3Config], SQLTask[SQLite3Config]):
@@ -84,7 +89,12 @@ class SQLite3Task(PythonCustomizedContainerTask[SQLite3Config], SQLTask[SQLite3C
         if task_config is None or task_config.uri is None:
             raise ValueError("SQLite DB uri is required.")
         from flytekit.types.schema import FlyteSchema
+        from flytekit.types.structured.structured_dataset import StructuredDataset, extract_cols_and_format
 
+        if task_config.chunksize and not (
+            output_schema_type and issubclass(extract_cols_and_format(output_schema_type)[0], StructuredDataset)
+        ):
+            raise ValueError("Streaming results with a chunksize requires a StructuredDataset output_schema_type")
         outputs = kwtypes(results=output_schema_type if output_schema_type else FlyteSchema)
         super().__init__(
             name=name,
@@ -111,22 +121,50 @@ class SQLite3Task(PythonCustomizedContainerTask[SQLite3Config], SQLTask[SQLite3C
             "query_template": self.query_template,
             "uri": self.task_config.uri,
             "compressed": self.task_config.compressed,
+            "chunksize": self.task_config.chunksize,
         }
 
 
-class SQLite3TaskExecutor(ShimTaskExecutor[SQLite3Task]):
-    def execute_from_model(self, tt: task_models.TaskTemplate, **kwargs) -> typing.Any:
-        with tempfile.TemporaryDirectory() as temp_dir:
-            ctx = FlyteContext.current_context()
-            file_ext = os.path.basename(tt.custom["uri"])
-            local_path = os.path.join(temp_dir, file_ext)
-            ctx.file_access.get_data(tt.custom["uri"], local_path)
-            if tt.custom["compressed"]:
+_local_dbs: typing.Dict[typing.Tuple[str, bool], str] = {}
+_local_dbs_lock = threading.Lock()
+
+
+def _get_local_db(uri: str, compressed: bool) -> str:
+    """
+    Downloads (and unarchives) the database once per process, so that every execution of the process, e.g. the
+    instances of a map task running in the same container, reuses the same local copy.
+    """
+    with _local_dbs_lock:
+        local_path = _local_dbs.get((uri, compressed))
+        if local_path is None or not os.path.exists(local_path):
+            temp_dir = tempfile.mkdtemp(prefix="flyte-sqlite3-")
+            local_path = os.path.join(temp_dir, os.path.basename(uri))
+            FlyteContext.current_context().file_access.get_data(uri, local_path)
+            if compressed:
                 local_path = unarchive_file(local_path, temp_dir)
+            _local_dbs[(uri, compressed)] = local_path
+        return local_path
+
 
-            print(f"Connecting to db {local_path}")
-            interpolated_query = SQLite3Task.interpolate_query(tt.custom["query_template"], **kwargs)
-            print(f"Interpolated query {interpolated_query}")
-            with contextlib.closing(sqlite3.connect(local_path)) as con:
-                df = pd.read_sql_query(interpolated_query, con)
-                return df
+class SQLite3TaskExecutor(ShimTaskExecutor[SQLite3Task]):
+    def execute_from_model(self, tt: task_models.TaskTemplate, **kwargs) -> typing.Any:
+        local_path = _get_local_db(tt.custom["uri"], tt.custom["compressed"])
+
+        print(f"Connecting to db {local_path}")
+        interpolated_query = SQLite3Task.interpolate_query(tt.custom["query_template"], **kwargs)
+        print(f"Interpolated query {interpolated_query}")
+        chunksize = tt.custom.get("chunksize")
+        with contextlib.closing(sqlite3.connect(local_path)) as con:
+            if chunksize:
+                import pyarrow as pa
+
+                from flytekit.types.structured.basic_dfs import write_parquet_chunks
+                from flytekit.types.structured.structured_dataset import StructuredDataset
+
+                ctx = FlyteContext.current_context()
+                uri = ctx.file_access.get_random_remote_directory()
+                chunks = pd.read_sql_query(interpolated_query, con, chunksize=chunksize)
+                write_parquet_chunks(ctx, (pa.Table.from_pandas(c, preserve_index=False) for c in chunks), uri)
+                return StructuredDataset(uri=uri)
+            df = pd.read_sql_query(interpolated_query, con)
+            return df
@@ -1,9 +1,11 @@
 import os
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from typing import Optional, Tuple, Type, Union
+from typing import List, Optional, Tuple, Type, Union
 
 import tensorflow as tf
 from dataclasses_json import DataClassJsonMixin
+from fsspec.utils import get_protocol
 from tensorflow.python.data.ops.readers import TFRecordDatasetV2
 from typing_extensions import Annotated, get_args, get_origin
 
@@ -27,12 +29,19 @@ class TFRecordDatasetConfig(DataClassJsonMixin):
       buffer_size: The number of bytes in the read buffer. If None, a sensible default for both local and remote file systems is used.
       num_parallel_reads: The number of files to read in parallel. If greater than one, the record of files read in parallel are outputted in an interleaved order.
       name: A name for the operation.
+      sharded: Read the files straight from the remote directory, interleaving the reads of num_parallel_reads files
+        (tf.data.AUTOTUNE by default), instead of downloading the whole directory first. When writing, the files are
+        written concurrently and straight to the remote directory where possible. Only applies to TFRecordsDirectory.
+      num_shards: The number of files the records are split into when writing in sharded mode. Defaults to one file
+        per record.
     """
 
     compression_type: Optional[str] = None
     buffer_size: Optional[int] = None
     num_parallel_reads: Optional[int] = None
     name: Optional[str] = None
+    sharded: bool = False
+    num_shards: Optional[int] = None
 
 
 def extract_metadata_and_uri(
@@ -42,14 +51,28 @@ def extract_metadata_and_uri(
         uri = lv.scalar.blob.uri
     except AttributeError:
         TypeTransformerFailedError(f"Cannot convert from {lv} to {t}")
-    metadata = TFRecordDatasetConfig()
+    return uri, get_dataset_config(t)
+
+
+def get_dataset_config(t: Type[Union[TFRecordFile, TFRecordsDirectory]]) -> TFRecordDatasetConfig:
     if get_origin(t) is Annotated:
         _, metadata = get_args(t)
         if isinstance(metadata, TFRecordDatasetConfig):
-            return uri, metadata
+            return metadata
         else:
             raise TypeTransformerFailedError(f"{t}'s metadata needs to be of type TFRecordDatasetConfig")
-    return uri, metadata
+    return TFRecordDatasetConfig()
+
+
+def tf_supports_path(path: str) -> bool:
+    """
+    Whether tf.io can read and write the path itself, e.g. gs:// paths, or s3:// paths with tensorflow-io installed.
+    """
+    protocol = get_protocol(path)
+    if protocol == "file":
+        return True
+    get_registered_schemes = getattr(tf.io.gfile, "get_registered_schemes", None)
+    return get_registered_schemes is not None and protocol in get_registered_schemes()
 
 
 class TensorFlowRecordFileTransformer(TypeTransformer[TFRecordFile]):
@@ -148,6 +171,20 @@ class TensorFlowRecordsDirTransformer(TypeTransformer[TFRecordsDirectory]):
         )
         local_dir = ctx.file_access.get_random_local_directory()
         remote_path = ctx.file_access.get_random_remote_directory()
+        metadata = get_dataset_config(python_type)
+        if metadata.sharded:
+            records = list(python_val)
+            # An empty shard is written for no records, so that the directory exists and reads back as empty
+            num_shards = max(1, min(metadata.num_shards or len(records), len(records)))
+            shards = [records[i::num_shards] for i in range(num_shards)]
+            with ThreadPoolExecutor(max_workers=max(1, min(num_shards, 32))) as executor:
+                for _ in executor.map(
+                    lambda i: self._write_shard(ctx, local_dir, remote_path, f"part_{i}.tfrecord", shards[i]),
+                    range(num_shards),
+                ):
+                    pass
+            return Literal(scalar=Scalar(blob=Blob(metadata=meta, uri=remote_path)))
+
         for i, val in enumerate(python_val):
             local_path = f"{local_dir}/part_{i}.tfrecord"
             with tf.io.TFRecordWriter(local_path) as writer:
@@ -155,10 +192,46 @@ class TensorFlowRecordsDirTransformer(TypeTransformer[TFRecordsDirectory]):
         ctx.file_access.upload_directory(local_dir, remote_path)
         return Literal(scalar=Scalar(blob=Blob(metadata=meta, uri=remote_path)))
 
+    @staticmethod
+    def _write_shard(ctx: FlyteContext, local_dir: str, remote_dir: str, name: str, records: List[tf.train.Example]):
+        fs = ctx.file_access.get_filesystem_for_path(remote_dir)
+        remote_path = f"{remote_dir}{ctx.file_access.sep(fs)}{name}"
+        write_directly = tf_supports_path(remote_dir)
+        if write_directly:
+            remote_path = ctx.file_access.strip_file_header(remote_path)
+            tf.io.gfile.makedirs(os.path.dirname(remote_path))
+        path = remote_path if write_directly else os.path.join(local_dir, name)
+
+        with tf.io.TFRecordWriter(path) as writer:
+            for record in records:
+                writer.write(record.SerializeToString())
+        if not write_directly:
+            # tf.io can't write to the remote directory, upload the shard as soon as it is written
+            ctx.file_access.put_data(path, remote_path)
+
+    def _sharded_dataset(self, ctx: FlyteContext, uri: str, metadata: TFRecordDatasetConfig) -> TFRecordDatasetV2:
+        fs = ctx.file_access.get_filesystem_for_path(uri)
+        filenames = sorted(fs.find(uri))
+        if get_protocol(uri) == "file":
+            filenames = [ctx.file_access.strip_file_header(f) for f in filenames]
+        else:
+            filenames = [fs.unstrip_protocol(f) for f in filenames]
+        return tf.data.TFRecordDataset(
+            filenames=filenames,
+            compression_type=metadata.compression_type,
+            buffer_size=metadata.buffer_size,
+            num_parallel_reads=metadata.num_parallel_reads or tf.data.AUTOTUNE,
+            name=metadata.name,
+        )
+
     def to_python_value(
         self, ctx: FlyteContext, lv: Literal, expected_python_type: Type[TFRecordsDirectory]
     ) -> TFRecordDatasetV2:
         uri, metadata = extract_metadata_and_uri(lv, expected_python_type)
+        if metadata.sharded and tf_supports_path(uri):
+            # Stream the records from the remote directory, instead of waiting for the whole directory to download
+            return self._sharded_dataset(ctx, uri, metadata)
+
         local_dir = ctx.file_access.get_random_local_directory()
         ctx.file_access.get_data(uri, local_dir, is_multipart=True)
         files = os.scandir(local_dir)
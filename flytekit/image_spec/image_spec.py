@@ -2,8 +2,11 @@ import base64
 import hashlib
 import os
 import pathlib
+import threading
+import time
 import typing
 from abc import abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 from copy import copy
 from dataclasses import asdict, dataclass
 from functools import lru_cache
@@ -12,8 +15,13 @@ from typing import List, Optional
 import click
 import requests
 
+from flytekit.tools.json_cache import read_json, write_json
+
 DOCKER_HUB = "docker.io"
 _F_IMG_ID = "_F_IMG_ID"
+# Location on the filesystem where the hashes of source files and the images found in registries are cached
+IMAGE_SPEC_CACHE_LOCATION = "~/.flyte/image_spec"
+DEFAULT_EXIST_TTL = 3600
 
 
 @dataclass
@@ -76,7 +84,23 @@ class ImageSpec:
     @lru_cache
     def exist(self) -> bool:
         """
-        Check if the image exists in the registry.
+        Check if the image exists in the registry. Images found are remembered across processes for
+        ``FLYTE_SDK_IMAGE_SPEC_EXIST_TTL`` seconds.
+        """
+        image_name = self.image_name()
+        cache = _ImageExistenceCache()
+        if cache.exists(image_name):
+            return True
+        exists = self._exist()
+        if exists is None:
+            return True
+        if exists:
+            cache.add(image_name)
+        return exists
+
+    def _exist(self) -> typing.Optional[bool]:
+        """
+        Check if the image exists in the registry, returns None if it can't be checked.
         """
         import docker
         from docker.errors import APIError, ImageNotFound
@@ -88,10 +112,7 @@ class ImageSpec:
             else:
                 client.images.get(self.image_name())
             return True
-        except APIError as e:
-            if e.response.status_code == 404:
-                return False
-        except ImageNotFound:
+        except (APIError, ImageNotFound):
             return False
         except Exception as e:
             tag = calculate_hash_from_image_spec(self)
@@ -110,7 +131,7 @@ class ImageSpec:
 
             click.secho(f"Failed to check if the image exists with error : {e}", fg="red")
             click.secho("Flytekit assumes that the image already exists.", fg="blue")
-            return True
+            return None
 
     def __hash__(self):
         return hash(asdict(self).__str__())
@@ -152,6 +173,24 @@ class ImageBuildEngine:
             cls._REGISTRY[image_spec.builder].build_image(image_spec)
             cls._BUILT_IMAGES.add(img_name)
 
+    @classmethod
+    def build_all(cls, image_specs: typing.Iterable[ImageSpec], max_workers: typing.Optional[int] = None):
+        """
+        Builds the images of all the image specs that don't exist yet. The images are looked up in their registries
+        and built in parallel, each of them only once.
+        """
+        image_specs = list(dict.fromkeys(image_specs))
+        for image_spec in image_specs:
+            if image_spec.builder not in cls._REGISTRY:
+                raise Exception(f"Builder {image_spec.builder} is not registered.")
+        if len(image_specs) <= 1:
+            for image_spec in image_specs:
+                cls.build(image_spec)
+            return
+        with ThreadPoolExecutor(max_workers=max_workers or len(image_specs)) as pool:
+            for f in [pool.submit(cls.build, image_spec) for image_spec in image_specs]:
+                f.result()
+
 
 @lru_cache
 def calculate_hash_from_image_spec(image_spec: ImageSpec):
@@ -173,16 +212,85 @@ def calculate_hash_from_image_spec(image_spec: ImageSpec):
 
 def hash_directory(path):
     """
-    Return the SHA-256 hash of the directory at the given path.
+    Return the SHA-256 hash of the paths and contents of all the files in the directory at the given path, which are
+    the files the builders copy into the image. The hashes of the files are cached, and used again while their size
+    and modification time don't change.
     """
+    cache = _FileHashCache(path)
     hasher = hashlib.sha256()
-    for root, dirs, files in os.walk(path):
-        for file in files:
-            with open(os.path.join(root, file), "rb") as f:
-                while True:
-                    # Read file in small chunks to avoid loading large files into memory all at once
-                    chunk = f.read(4096)
-                    if not chunk:
-                        break
-                    hasher.update(chunk)
+    # Symlinks to directories are followed, the way builders copy them
+    for root, dirs, files in os.walk(path, followlinks=True):
+        dirs.sort()
+        for file in sorted(files):
+            abs_path = os.path.join(root, file)
+            rel_path = os.path.relpath(abs_path, path)
+            hasher.update(pathlib.PurePath(rel_path).as_posix().encode("utf-8"))
+            hasher.update(b"\0")
+            hasher.update(cache.digest(abs_path, rel_path).encode("ascii"))
+    cache.save()
     return bytes(hasher.hexdigest(), "utf-8")
+
+
+class _FileHashCache(object):
+    """
+    The SHA-256 hashes of the files in a directory, with the size and modification time they were hashed at.
+    """
+
+    # Files modified this recently may be modified again without changing their modification time, so their hashes
+    # are not cached
+    _RACY_NS = 2 * 10**9
+
+    def __init__(self, directory: str):
+        key = hashlib.sha256(os.path.abspath(directory).encode("utf-8")).hexdigest()
+        self._path = os.path.join(os.path.expanduser(IMAGE_SPEC_CACHE_LOCATION), "files", f"{key}.json")
+        self._entries = read_json(self._path)
+        self._seen: typing.Dict[str, typing.List] = {}
+        self._started_at = time.time_ns()
+
+    def digest(self, abs_path: str, rel_path: str) -> str:
+        from flytekit.core.data_persistence import file_digest
+
+        stat = os.stat(abs_path)
+        entry = self._entries.get(rel_path)
+        if entry and entry[0] == stat.st_size and entry[1] == stat.st_mtime_ns:
+            self._seen[rel_path] = entry
+            return entry[2]
+        digest = file_digest(abs_path)
+        if stat.st_mtime_ns < self._started_at - self._RACY_NS:
+            self._seen[rel_path] = [stat.st_size, stat.st_mtime_ns, digest]
+        return digest
+
+    def save(self):
+        # Only the files still in the directory are kept
+        if self._seen != self._entries:
+            write_json(self._path, self._seen)
+
+
+class _ImageExistenceCache(object):
+    """
+    The names of the images found in their registries, with the time they were found at.
+    """
+
+    _lock = threading.Lock()
+
+    def __init__(self):
+        from flytekit.configuration.internal import LocalSDK
+
+        ttl = LocalSDK.IMAGE_SPEC_EXIST_TTL.read()
+        self._ttl = DEFAULT_EXIST_TTL if ttl is None else ttl
+        self._path = os.path.join(os.path.expanduser(IMAGE_SPEC_CACHE_LOCATION), "images.json")
+
+    def exists(self, image_name: str) -> bool:
+        if self._ttl <= 0:
+            return False
+        found_at = read_json(self._path).get(image_name)
+        return found_at is not None and time.time() - found_at < self._ttl
+
+    def add(self, image_name: str):
+        if self._ttl <= 0:
+            return
+        with self._lock:
+            now = time.time()
+            images = {k: v for k, v in read_json(self._path).items() if now - v < self._ttl}
+            images[image_name] = now
+            write_json(self._path, images)
@@ -1,7 +1,10 @@
 # -*- coding: utf-8 -*-
 #
+import atexit
 import re
 import sys
+import threading
+from collections import defaultdict
 
 import statsd
 
@@ -16,6 +19,9 @@ FORBIDDEN_TAG_VALUE_CHARACTERS = re.compile("[|.:]")
 
 _stats_client = None
 
+# Serialized tags by tag values, tags are usually the same for every call
+_TAG_SUFFIX_CACHE_SIZE = 1024
+
 
 class ScopeableStatsProxy(object):
     """
@@ -49,7 +55,7 @@ class ScopeableStatsProxy(object):
                     tags["_f"] = "i"
 
                 if bool(tags):
-                    stat = self._serialize_tags(stat, tags)
+                    stat = stat + self._tag_suffix(tags)
                 return base_func(self._p_with_prefix(stat), *args, **kwargs)
 
         else:
@@ -60,7 +66,7 @@ class ScopeableStatsProxy(object):
                     tags["_f"] = "i"
 
                 if bool(tags):
-                    stat = self._serialize_tags(stat, tags)
+                    stat = stat + self._tag_suffix(tags)
                 return base_func(stat, *args, **kwargs)
 
         return name_wrap
@@ -110,6 +116,24 @@ class ScopeableStatsProxy(object):
 
         return metric
 
+    _tag_suffixes: dict = {}
+
+    def _tag_suffix(self, tags):
+        """
+        Returns what _serialize_tags appends to a metric for the given tags, cached by the tag values.
+        """
+        try:
+            key = tuple(sorted(tags.items()))
+            suffix = self._tag_suffixes.get(key)
+        except TypeError:
+            return self._serialize_tags("", tags)
+        if suffix is None:
+            suffix = self._serialize_tags("", tags)
+            if len(self._tag_suffixes) >= _TAG_SUFFIX_CACHE_SIZE:
+                self._tag_suffixes.clear()
+            self._tag_suffixes[key] = suffix
+        return suffix
+
     def __hasattr__(self, name):
         return hasattr(self._client, name)
 
@@ -134,10 +158,23 @@ def _get_stats_client(cfg: StatsConfig):
     if cfg.disabled is True:
         _stats_client = DummyStatsClient()
     if _stats_client is None:
-        _stats_client = statsd.StatsClient(cfg.host, cfg.port)
+        if cfg.buffered:
+            _stats_client = BufferedStatsClient(
+                cfg.host, cfg.port, flush_interval=cfg.flush_interval_ms / 1000.0, max_buffered=cfg.max_buffered
+            )
+        else:
+            _stats_client = statsd.StatsClient(cfg.host, cfg.port)
     return _stats_client
 
 
+def flush():
+    """
+    Sends the metrics buffered by the stats client, if it buffers any.
+    """
+    if isinstance(_stats_client, BufferedStatsClient):
+        _stats_client.flush()
+
+
 def get_base_stats(cfg: StatsConfig, prefix: str):
     return StatsClientProxy(_get_stats_client(cfg), prefix=prefix)
 
@@ -154,3 +191,86 @@ class DummyStatsClient(statsd.StatsClient):
 
     def _send(self, data):
         pass
+
+
+class BufferedStatsClient(statsd.StatsClient):
+    """
+    A statsd client that does not send a packet for every metric. Counters are summed and gauges keep their last value
+    until they are sent, all other metrics are queued as is. A background thread sends everything every
+    ``flush_interval`` seconds, or as soon as ``max_buffered`` metrics are waiting, packing as many metrics as fit into
+    each packet. Whatever is left is sent when the process exits.
+    """
+
+    def __init__(
+        self,
+        host="localhost",
+        port=8125,
+        prefix=None,
+        maxudpsize=512,
+        ipv6=False,
+        flush_interval=1.0,
+        max_buffered=1000,
+    ):
+        super().__init__(host, port, prefix, maxudpsize, ipv6)
+        self._flush_interval = flush_interval
+        self._max_buffered = max_buffered
+        self._lock = threading.Lock()
+        self._counters = defaultdict(int)
+        self._gauges = {}
+        self._buffer = []
+        self._flush_requested = threading.Event()
+        self._flusher = threading.Thread(target=self._flush_periodically, name="flyte-statsd-flusher", daemon=True)
+        self._flusher.start()
+        atexit.register(self.flush)
+
+    def incr(self, stat, count=1, rate=1):
+        if rate < 1:
+            return super().incr(stat, count, rate)
+        with self._lock:
+            self._counters[stat] += count
+            self._check_size()
+
+    def gauge(self, stat, value, rate=1, delta=False):
+        if rate < 1 or delta:
+            return super().gauge(stat, value, rate, delta)
+        with self._lock:
+            self._gauges[stat] = value
+            self._check_size()
+
+    def _after(self, data):
+        if data:
+            with self._lock:
+                self._buffer.append(data)
+                self._check_size()
+
+    def _check_size(self):
+        if len(self._buffer) + len(self._counters) + len(self._gauges) >= self._max_buffered:
+            self._flush_requested.set()
+
+    def _flush_periodically(self):
+        while True:
+            self._flush_requested.wait(self._flush_interval)
+            self._flush_requested.clear()
+            self.flush()
+
+    def flush(self):
+        with self._lock:
+            counters, self._counters = self._counters, defaultdict(int)
+            gauges, self._gauges = self._gauges, {}
+            lines, self._buffer = self._buffer, []
+        lines.extend(self._prepare(stat, "%s|c" % count, 1) for stat, count in counters.items() if count)
+        for stat, value in gauges.items():
+            if value < 0:
+                # Negative values are read as a delta unless the gauge is reset to 0 first
+                lines.append(self._prepare(stat, "0|g", 1))
+            lines.append(self._prepare(stat, "%s|g" % value, 1))
+
+        data = ""
+        for line in lines:
+            if data and len(data) + len(line) + 1 >= self._maxudpsize:
+                self._send(data)
+                data = line
+            else:
+                data = data + "\n" + line if data else line
+        if data:
+            self._send(data)
@@ -24,7 +24,7 @@ class TaggableStats(_stats_client.ScopeableStatsProxy):
                     tags["_f"] = "i"
 
                 if bool(tags) and not self._cfg.disabled_tags:
-                    stat = self._serialize_tags(stat, tags)
+                    stat = stat + self._tag_suffix(tags)
                 return base_func(self._p_with_prefix(stat), *args, **kwargs)
 
         else:
@@ -36,7 +36,7 @@ class TaggableStats(_stats_client.ScopeableStatsProxy):
                     tags["_f"] = "i"
 
                 if bool(tags) and not self._cfg.disabled_tags:
-                    stat = self._serialize_tags(stat, tags)
+                    stat = stat + self._tag_suffix(tags)
                 return base_func(stat, *args, **kwargs)
 
         return name_wrap
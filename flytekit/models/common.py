@@ -1,7 +1,9 @@
 import abc as _abc
+import functools
 import json as _json
 import re
-from typing import Dict
+import threading
+from typing import Any, Dict, List, Optional, Tuple
 
 from flyteidl.admin import common_pb2 as _common_pb2
 from flyteidl.core import literals_pb2 as _literals_pb2
@@ -81,6 +83,261 @@ class FlyteIdlEntity(object, metaclass=FlyteType):
         pass
 
 
+_CACHE_ATTR = "_idl_cache_entry"
+_SOURCE_ATTR = "_idl_source"
+# Stored instead of a cache for models that can't be cached
+_NOT_CACHEABLE = object()
+# Stored instead of a cache for models that were converted once
+_CONVERTED = object()
+# Incremented whenever a model that was cached is changed, so the caches of the models containing it are checked again
+_mutations = 0
+
+
+def _mutated():
+    global _mutations
+    _mutations += 1
+
+
+class _Unloaded(object):
+    """
+    The value of the attributes of lazily converted models that were not converted yet.
+    """
+
+    def __repr__(self):
+        return "UNLOADED"
+
+    def __reduce__(self):
+        return "UNLOADED"
+
+
+UNLOADED = _Unloaded()
+
+
+class _IdlCache(object):
+    __slots__ = ("idl", "serialized", "models", "mutations", "container", "members", "volatile")
+
+    def __init__(self, idl, models: List[Tuple["CachedFlyteIdlEntity", "_IdlCache"]]):
+        self.idl = idl
+        self.serialized: Optional[bytes] = None
+        self.models = models
+        self.mutations = _mutations
+        # A list or dict of models that can be changed in place, with the ids of its members when the cache was built
+        self.container: Optional[Any] = None
+        self.members: Optional[Tuple] = None
+        # Changes of lists or dicts in place aren't counted as mutations, so volatile caches are checked every time
+        self.volatile = False
+        for _, c in models:
+            if c.volatile:
+                self.volatile = True
+                break
+
+    def is_valid(self) -> bool:
+        if self.mutations == _mutations and not self.volatile:
+            return True
+        if self.container is not None and _container_members(self.container) != self.members:
+            return False
+        for m, c in self.models:
+            if m._idl_cache() is not c:
+                return False
+            self.volatile = self.volatile or c.volatile
+        self.mutations = _mutations
+        return True
+
+
+def _container_members(container) -> Tuple:
+    if isinstance(container, dict):
+        return tuple((k, id(v)) for k, v in container.items())
+    return tuple(map(id, container))
+
+
+class _Conversion(threading.local):
+    # The number of models being converted by the current thread
+    depth = 0
+
+
+_conversion = _Conversion()
+
+
+def _cached_idl(idl):
+    # Models containing this one copy the message into their own, other callers get a copy so they can't change it
+    if _conversion.depth:
+        return idl
+    copy = type(idl)()
+    copy.CopyFrom(idl)
+    return copy
+
+
+def _cached_to_flyte_idl(to_flyte_idl):
+    @functools.wraps(to_flyte_idl)
+    def wrapper(self):
+        d = self.__dict__
+        cache = d.get(_CACHE_ATTR)
+        if type(cache) is _IdlCache:
+            if cache.is_valid():
+                return _cached_idl(cache.idl)
+            cache = None
+        _conversion.depth += 1
+        try:
+            idl = to_flyte_idl(self)
+        finally:
+            _conversion.depth -= 1
+        if cache is None:
+            # Most models are only converted once, they are cached the second time they are converted
+            d[_CACHE_ATTR] = _CONVERTED
+        elif cache is _CONVERTED and self._new_idl_cache(idl) is not None:
+            return _cached_idl(idl)
+        return idl
+
+    wrapper._cached = True  # type: ignore
+    return wrapper
+
+
+_PLAIN_TYPES = frozenset([type(None), str, int, float, bool, bytes, _Unloaded])
+
+
+def _is_model(v, model_type: type) -> bool:
+    # Faster than isinstance, which goes through FlyteABCMeta
+    return model_type in type(v).__mro__
+
+
+class CachedFlyteIdlEntity(FlyteIdlEntity):
+    """
+    A model that keeps the protobuf it was converted to, and its serialized form, once it was converted twice, so that
+    hashing, comparing and converting it, or a model containing it, doesn't convert the whole tree of models again.
+    Later conversions return a copy of the kept protobuf. Models can also be converted from a protobuf lazily, see
+    _lazily_from_flyte_idl.
+
+    The cache of a model is dropped when any of its attributes is assigned, through a property setter or directly, and
+    the caches of the models containing it are not used anymore. Models holding lists or dicts of models, which can be
+    changed in place, and models containing other kinds of models are not cached, unless they were lazily converted
+    from a protobuf. Other values held by models, like the metadata of a LiteralType or the generic Struct of a Scalar,
+    must not be changed in place once the model was converted.
+    """
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        to_flyte_idl = cls.__dict__.get("to_flyte_idl")
+        if to_flyte_idl is not None and not getattr(to_flyte_idl, "_cached", False):
+            cls.to_flyte_idl = _cached_to_flyte_idl(to_flyte_idl)
+
+    def __setattr__(self, name, value):
+        if type(self.__dict__.pop(_CACHE_ATTR, None)) is _IdlCache:
+            _mutated()
+        object.__setattr__(self, name, value)
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state.pop(_CACHE_ATTR, None)
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+
+    def _idl_cache(self) -> Optional[_IdlCache]:
+        cache = self.__dict__.get(_CACHE_ATTR)
+        if type(cache) is not _IdlCache:
+            return None
+        if not cache.is_valid():
+            del self.__dict__[_CACHE_ATTR]
+            return None
+        return cache
+
+    def _new_idl_cache(self, idl) -> Optional[_IdlCache]:
+        models = []
+        for v in self.__dict__.values():
+            if type(v) in _PLAIN_TYPES:
+                continue
+            if _is_model(v, CachedFlyteIdlEntity):
+                # Models are converted together with the models they contain, so this is only None if the model
+                # can't be cached, or isn't part of the protobuf
+                c = v._idl_cache()
+                if c is None:
+                    break
+                models.append((v, c))
+            elif _is_model(v, FlyteIdlEntity):
+                break
+            elif isinstance(v, (list, dict)) and any(
+                _is_model(m, FlyteIdlEntity) for m in (v.values() if isinstance(v, dict) else v)
+            ):
+                break
+        else:
+            cache = self.__dict__[_CACHE_ATTR] = _IdlCache(idl, models)
+            return cache
+        self.__dict__[_CACHE_ATTR] = _NOT_CACHEABLE
+        return None
+
+    @classmethod
+    def _lazily_from_flyte_idl(cls, idl_object, **attributes):
+        """
+        Creates a model converted from the protobuf, with the given attributes, without calling __init__. Attributes
+        that are UNLOADED are converted from the protobuf when they are loaded with _load. Until it is changed, or
+        models it contains that are not lazily converted are loaded, to_flyte_idl returns copies of the protobuf, which
+        must not be changed in place.
+        """
+        model = cls.__new__(cls)
+        d = model.__dict__
+        d.update(attributes)
+        d[_SOURCE_ATTR] = idl_object
+        d[_CACHE_ATTR] = _IdlCache(idl_object, [])
+        return model
+
+    def _load(self, name: str, convert):
+        """
+        Returns the attribute, after converting it from the protobuf this model was converted from if it is UNLOADED.
+        """
+        value = self.__dict__[name]
+        if value is not UNLOADED:
+            return value
+        value = convert(self.__dict__[_SOURCE_ATTR])
+        self.__dict__[name] = value
+        cache = self.__dict__.get(_CACHE_ATTR)
+        if type(cache) is not _IdlCache:
+            return value
+        members = value.values() if isinstance(value, dict) else value if isinstance(value, list) else [value]
+        models = []
+        for m in members:
+            c = m._idl_cache() if _is_model(m, CachedFlyteIdlEntity) else None
+            if c is None and _is_model(m, FlyteIdlEntity):
+                # Changes to it couldn't be noticed
+                self.__dict__.pop(_CACHE_ATTR)
+                _mutated()
+                return value
+            if c is not None:
+                models.append((m, c))
+        cache.models.extend(models)
+        if isinstance(value, (list, dict)):
+            cache.container, cache.members, cache.volatile = value, _container_members(value), True
+            # The models containing this one have to check it every time from now on
+            _mutated()
+        return value
+
+    def _serialized(self) -> Tuple[Any, bytes]:
+        """
+        Returns the protobuf type and the deterministic serialized form of this model.
+        """
+        d = self.__dict__
+        cache = d.get(_CACHE_ATTR)
+        if type(cache) is not _IdlCache or not cache.is_valid():
+            idl = self.to_flyte_idl()
+            cache = d.get(_CACHE_ATTR)
+            if type(cache) is not _IdlCache:
+                return type(idl), idl.SerializeToString(deterministic=True)
+        if cache.serialized is None:
+            cache.serialized = cache.idl.SerializeToString(deterministic=True)
+        return type(cache.idl), cache.serialized
+
+    def __eq__(self, other):
+        if isinstance(other, CachedFlyteIdlEntity):
+            return self is other or self._serialized() == other._serialized()
+        return super().__eq__(other)
+
+    def __hash__(self):
+        return hash(self._serialized()[1])
+
+    def serialize_to_string(self) -> bytes:
+        return self._serialized()[1]
+
+
 class FlyteCustomIdlEntity(FlyteIdlEntity):
     @classmethod
     def from_flyte_idl(cls, idl_object):
@@ -10,7 +10,7 @@ class ResourceType(object):
     LAUNCH_PLAN = identifier_pb2.LAUNCH_PLAN
 
 
-class Identifier(_common_models.FlyteIdlEntity):
+class Identifier(_common_models.CachedFlyteIdlEntity):
     def __init__(self, resource_type, project, domain, name, version):
         """
         :param int resource_type: enum value from ResourceType
@@ -97,7 +97,7 @@ class Identifier(_common_models.FlyteIdlEntity):
         return f"{self.resource_type_name()}:{self.project}:{self.domain}:{self.name}:{self.version}"
 
 
-class WorkflowExecutionIdentifier(_common_models.FlyteIdlEntity):
+class WorkflowExecutionIdentifier(_common_models.CachedFlyteIdlEntity):
     def __init__(self, project, domain, name):
         """
         :param Text project:
@@ -152,7 +152,7 @@ class WorkflowExecutionIdentifier(_common_models.FlyteIdlEntity):
         )
 
 
-class NodeExecutionIdentifier(_common_models.FlyteIdlEntity):
+class NodeExecutionIdentifier(_common_models.CachedFlyteIdlEntity):
     def __init__(self, node_id, execution_id):
         """
         :param Text node_id:
@@ -196,7 +196,7 @@ class NodeExecutionIdentifier(_common_models.FlyteIdlEntity):
         )
 
 
-class TaskExecutionIdentifier(_common_models.FlyteIdlEntity):
+class TaskExecutionIdentifier(_common_models.CachedFlyteIdlEntity):
     def __init__(self, task_id, node_execution_id, retry_attempt):
         """
         :param Identifier task_id: The identifier for the task that is executing
@@ -251,7 +251,7 @@ class TaskExecutionIdentifier(_common_models.FlyteIdlEntity):
         )
 
 
-class SignalIdentifier(_common_models.FlyteIdlEntity):
+class SignalIdentifier(_common_models.CachedFlyteIdlEntity):
     def __init__(self, signal_id: str, execution_id: WorkflowExecutionIdentifier):
         """
         :param signal_id: User provided name for the gate node.
@@ -7,7 +7,7 @@ from flyteidl.core import types_pb2 as _types_pb2
 from flytekit.models import common as _common
 
 
-class EnumType(_common.FlyteIdlEntity):
+class EnumType(_common.CachedFlyteIdlEntity):
     """
     Models _types_pb2.EnumType
     """
@@ -29,7 +29,7 @@ class EnumType(_common.FlyteIdlEntity):
         return cls(values=proto.values)
 
 
-class BlobType(_common.FlyteIdlEntity):
+class BlobType(_common.CachedFlyteIdlEntity):
     """
     This type represents offloaded data and is typically used for things like files.
     """
@@ -14,7 +14,7 @@ from flytekit.models.types import SchemaType as _SchemaType
 from flytekit.models.types import StructuredDatasetType
 
 
-class RetryStrategy(_common.FlyteIdlEntity):
+class RetryStrategy(_common.CachedFlyteIdlEntity):
     def __init__(self, retries):
         """
         :param int retries: Number of retries to attempt on recoverable failures.  If retries is 0, then
@@ -45,7 +45,7 @@ class RetryStrategy(_common.FlyteIdlEntity):
         return cls(retries=pb2_object.retries)
 
 
-class Primitive(_common.FlyteIdlEntity):
+class Primitive(_common.CachedFlyteIdlEntity):
     def __init__(
         self,
         integer=None,
@@ -170,7 +170,7 @@ class Primitive(_common.FlyteIdlEntity):
         )
 
 
-class Binary(_common.FlyteIdlEntity):
+class Binary(_common.CachedFlyteIdlEntity):
     def __init__(self, value, tag):
         """
         :param bytes value:
@@ -208,7 +208,7 @@ class Binary(_common.FlyteIdlEntity):
         return cls(value=pb2_object.value, tag=pb2_object.tag)
 
 
-class BlobMetadata(_common.FlyteIdlEntity):
+class BlobMetadata(_common.CachedFlyteIdlEntity):
     """
     This is metadata for the Blob literal.
     """
@@ -241,7 +241,7 @@ class BlobMetadata(_common.FlyteIdlEntity):
         return cls(type=_core_types.BlobType.from_flyte_idl(proto.type))
 
 
-class Blob(_common.FlyteIdlEntity):
+class Blob(_common.CachedFlyteIdlEntity):
     def __init__(self, metadata, uri):
         """
         This literal model is used to represent binary data offloaded to some storage location which is
@@ -282,7 +282,7 @@ class Blob(_common.FlyteIdlEntity):
         return cls(metadata=BlobMetadata.from_flyte_idl(proto.metadata), uri=proto.uri)
 
 
-class Void(_common.FlyteIdlEntity):
+class Void(_common.CachedFlyteIdlEntity):
     def to_flyte_idl(self):
         """
         :rtype: flyteidl.core.literals_pb2.Void
@@ -298,7 +298,7 @@ class Void(_common.FlyteIdlEntity):
         return cls()
 
 
-class BindingDataMap(_common.FlyteIdlEntity):
+class BindingDataMap(_common.CachedFlyteIdlEntity):
     def __init__(self, bindings):
         """
         A map of BindingData items.  Can be a recursive structure
@@ -331,7 +331,7 @@ class BindingDataMap(_common.FlyteIdlEntity):
         return cls({k: BindingData.from_flyte_idl(v) for (k, v) in pb2_object.bindings.items()})
 
 
-class BindingDataCollection(_common.FlyteIdlEntity):
+class BindingDataCollection(_common.CachedFlyteIdlEntity):
     def __init__(self, bindings):
         """
         A list of BindingData items.
@@ -362,7 +362,7 @@ class BindingDataCollection(_common.FlyteIdlEntity):
         return cls([BindingData.from_flyte_idl(b) for b in pb2_object.bindings])
 
 
-class BindingData(_common.FlyteIdlEntity):
+class BindingData(_common.CachedFlyteIdlEntity):
     def __init__(self, scalar=None, collection=None, promise=None, map=None):
         """
         Specifies either a simple value or a reference to another output. Only one of the input arguments may be
@@ -469,7 +469,7 @@ class BindingData(_common.FlyteIdlEntity):
             )
 
 
-class Binding(_common.FlyteIdlEntity):
+class Binding(_common.CachedFlyteIdlEntity):
     def __init__(self, var, binding):
         """
         An input/output binding of a variable to either static value or a node output.
@@ -511,7 +511,7 @@ class Binding(_common.FlyteIdlEntity):
         return cls(pb2_object.var, BindingData.from_flyte_idl(pb2_object.binding))
 
 
-class Schema(_common.FlyteIdlEntity):
+class Schema(_common.CachedFlyteIdlEntity):
     def __init__(self, uri, type):
         """
         A strongly typed schema that defines the interface of data retrieved from the underlying storage medium.
@@ -551,7 +551,7 @@ class Schema(_common.FlyteIdlEntity):
         return cls(uri=pb2_object.uri, type=_SchemaType.from_flyte_idl(pb2_object.type))
 
 
-class Union(_common.FlyteIdlEntity):
+class Union(_common.CachedFlyteIdlEntity):
     def __init__(self, value, stored_type):
         """
         The runtime representation of a tagged union value. See `UnionType` for more details.
@@ -593,7 +593,7 @@ class Union(_common.FlyteIdlEntity):
         )
 
 
-class StructuredDatasetMetadata(_common.FlyteIdlEntity):
+class StructuredDatasetMetadata(_common.CachedFlyteIdlEntity):
     def __init__(self, structured_dataset_type: Optional[StructuredDatasetType] = None):
         self._structured_dataset_type = structured_dataset_type
 
@@ -615,7 +615,7 @@ class StructuredDatasetMetadata(_common.FlyteIdlEntity):
         )
 
 
-class StructuredDataset(_common.FlyteIdlEntity):
+class StructuredDataset(_common.CachedFlyteIdlEntity):
     def __init__(self, uri: str, metadata: Optional[StructuredDatasetMetadata] = None):
         """
         A strongly typed schema that defines the interface of data retrieved from the underlying storage medium.
@@ -641,7 +641,7 @@ class StructuredDataset(_common.FlyteIdlEntity):
         return cls(uri=pb2_object.uri, metadata=StructuredDatasetMetadata.from_flyte_idl(pb2_object.metadata))
 
 
-class LiteralCollection(_common.FlyteIdlEntity):
+class LiteralCollection(_common.CachedFlyteIdlEntity):
     def __init__(self, literals):
         """
         :param list[Literal] literals: underlying list of literals in this collection.
@@ -653,7 +653,7 @@ class LiteralCollection(_common.FlyteIdlEntity):
         """
         :rtype: list[Literal]
         """
-        return self._literals
+        return self._load("_literals", lambda pb: [Literal.from_flyte_idl(l) for l in pb.literals])
 
     def to_flyte_idl(self):
         """
@@ -667,10 +667,11 @@ class LiteralCollection(_common.FlyteIdlEntity):
         :param flyteidl.core.literals_pb2.LiteralCollection pb2_object:
         :rtype: LiteralCollection
         """
-        return cls([Literal.from_flyte_idl(l) for l in pb2_object.literals])
+        # The literals are only converted when they are accessed
+        return cls._lazily_from_flyte_idl(pb2_object, _literals=_common.UNLOADED)
 
 
-class LiteralMap(_common.FlyteIdlEntity):
+class LiteralMap(_common.CachedFlyteIdlEntity):
     def __init__(self, literals):
         """
         :param dict[Text, Literal] literals: A dictionary mapping Text key names to Literal objects.
@@ -683,7 +684,7 @@ class LiteralMap(_common.FlyteIdlEntity):
         A dictionary mapping Text key names to Literal objects.
         :rtype: dict[Text, Literal]
         """
-        return self._literals
+        return self._load("_literals", lambda pb: {k: Literal.from_flyte_idl(v) for k, v in pb.literals.items()})
 
     def to_flyte_idl(self):
         """
@@ -697,10 +698,11 @@ class LiteralMap(_common.FlyteIdlEntity):
         :param flyteidl.core.literals_pb2.LiteralMap pb2_object:
         :rtype: LiteralMap
         """
-        return cls({k: Literal.from_flyte_idl(v) for k, v in pb2_object.literals.items()})
+        # The literals are only converted when they are accessed
+        return cls._lazily_from_flyte_idl(pb2_object, _literals=_common.UNLOADED)
 
 
-class Scalar(_common.FlyteIdlEntity):
+class Scalar(_common.CachedFlyteIdlEntity):
     def __init__(
         self,
         primitive: Primitive = None,
@@ -852,7 +854,7 @@ class Scalar(_common.FlyteIdlEntity):
         )
 
 
-class Literal(_common.FlyteIdlEntity):
+class Literal(_common.CachedFlyteIdlEntity):
     def __init__(
         self, scalar: Scalar = None, collection: LiteralCollection = None, map: LiteralMap = None, hash: str = None
     ):
@@ -882,7 +884,10 @@ class Literal(_common.FlyteIdlEntity):
         If not None, this value holds a collection of Literal values which can be further unpacked.
         :rtype: LiteralCollection
         """
-        return self._collection
+        return self._load(
+            "_collection",
+            lambda pb: LiteralCollection.from_flyte_idl(pb.collection) if pb.HasField("collection") else None,
+        )
 
     @property
     def map(self):
@@ -890,7 +895,7 @@ class Literal(_common.FlyteIdlEntity):
         If not None, this value holds a map of Literal values which can be further unpacked.
         :rtype: LiteralMap
         """
-        return self._map
+        return self._load("_map", lambda pb: LiteralMap.from_flyte_idl(pb.map) if pb.HasField("map") else None)
 
     @property
     def value(self):
@@ -929,13 +934,10 @@ class Literal(_common.FlyteIdlEntity):
         :param flyteidl.core.literals_pb2.Literal pb2_object:
         :rtype: Literal
         """
-        collection = None
-        if pb2_object.HasField("collection"):
-            collection = LiteralCollection.from_flyte_idl(pb2_object.collection)
-
-        return cls(
-            scalar=Scalar.from_flyte_idl(pb2_object.scalar) if pb2_object.HasField("scalar") else None,
-            collection=collection,
-            map=LiteralMap.from_flyte_idl(pb2_object.map) if pb2_object.HasField("map") else None,
-            hash=pb2_object.hash if pb2_object.hash else None,
+        hash = pb2_object.hash if pb2_object.hash else None
+        if pb2_object.HasField("scalar"):
+            return cls(scalar=Scalar.from_flyte_idl(pb2_object.scalar), hash=hash)
+        # Collections and maps are only converted when they are accessed
+        return cls._lazily_from_flyte_idl(
+            pb2_object, _scalar=None, _collection=_common.UNLOADED, _map=_common.UNLOADED, _hash=hash
         )
@@ -23,8 +23,8 @@ class SimpleType(object):
     STRUCT = _types_pb2.STRUCT
 
 
-class SchemaType(_common.FlyteIdlEntity):
-    class SchemaColumn(_common.FlyteIdlEntity):
+class SchemaType(_common.CachedFlyteIdlEntity):
+    class SchemaColumn(_common.CachedFlyteIdlEntity):
         class SchemaColumnType(object):
             INTEGER = _types_pb2.SchemaType.SchemaColumn.INTEGER
             FLOAT = _types_pb2.SchemaType.SchemaColumn.FLOAT
@@ -100,7 +100,7 @@ class SchemaType(_common.FlyteIdlEntity):
         return cls(columns=[SchemaType.SchemaColumn.from_flyte_idl(c) for c in proto.columns])
 
 
-class UnionType(_common.FlyteIdlEntity):
+class UnionType(_common.CachedFlyteIdlEntity):
     """
     Models _types_pb2.UnionType
     """
@@ -122,7 +122,7 @@ class UnionType(_common.FlyteIdlEntity):
         return cls(variants=[LiteralType.from_flyte_idl(v) for v in proto.variants])
 
 
-class TypeStructure(_common.FlyteIdlEntity):
+class TypeStructure(_common.CachedFlyteIdlEntity):
     """
     Models _types_pb2.TypeStructure
     """
@@ -144,8 +144,8 @@ class TypeStructure(_common.FlyteIdlEntity):
         return cls(tag=proto.tag)
 
 
-class StructuredDatasetType(_common.FlyteIdlEntity):
-    class DatasetColumn(_common.FlyteIdlEntity):
+class StructuredDatasetType(_common.CachedFlyteIdlEntity):
+    class DatasetColumn(_common.CachedFlyteIdlEntity):
         def __init__(self, name: str, literal_type: "LiteralType"):
             self._name = name
             self._literal_type = literal_type
@@ -229,7 +229,7 @@ class StructuredDatasetType(_common.FlyteIdlEntity):
         )
 
 
-class LiteralType(_common.FlyteIdlEntity):
+class LiteralType(_common.CachedFlyteIdlEntity):
     def __init__(
         self,
         simple=None,
@@ -395,7 +395,7 @@ class LiteralType(_common.FlyteIdlEntity):
         )
 
 
-class OutputReference(_common.FlyteIdlEntity):
+class OutputReference(_common.CachedFlyteIdlEntity):
     def __init__(self, node_id, var):
         """
         A reference to an output produced by a node. The type can be retrieved -and validated- from
@@ -442,7 +442,7 @@ class OutputReference(_common.FlyteIdlEntity):
         return cls(node_id=pb2_object.node_id, var=pb2_object.var)
 
 
-class Error(_common.FlyteIdlEntity):
+class Error(_common.CachedFlyteIdlEntity):
     def __init__(self, failed_node_id: str, message: str):
         self._message = message
         self._failed_node_id = failed_node_id
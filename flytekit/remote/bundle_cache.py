@@ -0,0 +1,44 @@
+"""
+Remembers where the code bundles ``FlyteRemote.register_script`` uploaded were stored, by the digest of the sources
+they were built from, so that registering the same sources again neither builds nor uploads them again. A bundle is
+only reused once the data proxy confirms that it still exists.
+"""
+
+import base64
+import hashlib
+import os
+import time
+import typing
+
+from flytekit.tools.json_cache import read_json, write_json
+
+# Location on the filesystem where the uploaded bundles are recorded
+BUNDLE_CACHE_LOCATION = "~/.flyte/bundles"
+
+
+class BundleCache(object):
+    """
+    The code bundles uploaded to one project and domain of a Flyte deployment.
+    """
+
+    def __init__(self, endpoint: str, project: str, domain: str, location: str = BUNDLE_CACHE_LOCATION):
+        key = hashlib.sha256(f"{endpoint}/{project}/{domain}".encode("utf-8")).hexdigest()
+        self._path = os.path.join(os.path.expanduser(location), f"{key}.json")
+
+    def get(self, digest: str) -> typing.Optional[typing.Tuple[bytes, str]]:
+        """
+        Returns the md5 digest and the native url of the bundle uploaded for the sources, if there is one.
+        """
+        entry = read_json(self._path).get(digest)
+        if entry is None:
+            return None
+        return base64.b64decode(entry["md5"]), entry["native_url"]
+
+    def put(self, digest: str, md5_bytes: bytes, native_url: str):
+        data = read_json(self._path)
+        data[digest] = {
+            "md5": base64.b64encode(md5_bytes).decode("ascii"),
+            "native_url": native_url,
+            "uploaded_at": time.time(),
+        }
+        write_json(self._path, data)
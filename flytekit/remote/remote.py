@@ -62,14 +62,16 @@ from flytekit.models.execution import (
 )
 from flytekit.models.literals import Literal, LiteralMap
 from flytekit.remote.backfill import create_backfill_workflow
+from flytekit.remote.bundle_cache import BundleCache
 from flytekit.remote.entities import FlyteLaunchPlan, FlyteNode, FlyteTask, FlyteTaskNode, FlyteWorkflow
 from flytekit.remote.executions import FlyteNodeExecution, FlyteTaskExecution, FlyteWorkflowExecution
 from flytekit.remote.interface import TypedInterface
 from flytekit.remote.lazy_entity import LazyEntity
 from flytekit.remote.remote_callable import RemoteEntity
-from flytekit.tools.fast_registration import fast_package
+from flytekit.tools.fast_registration import compute_digest, fast_package
+from flytekit.tools.ignore import DockerIgnore, GitIgnore, IgnoreGroup, StandardIgnore
 from flytekit.tools.interactive import ipython_check
-from flytekit.tools.script_mode import compress_scripts, hash_file
+from flytekit.tools.script_mode import compress_directory, copy_module_to_destination, hash_file
 from flytekit.tools.translator import (
     FlyteControlPlaneEntity,
     FlyteLocalEntity,
@@ -499,11 +501,11 @@ class FlyteRemote(object):
         domain: typing.Optional[str] = None,
         limit: typing.Optional[int] = 100,
     ) -> typing.List[FlyteWorkflowExecution]:
-        # Ignore token for now
-        exec_models, _ = self.client.list_executions_paginated(
+        exec_models = self.client.iterate_paginated(
+            self.client.list_executions_paginated,
             project or self.default_project,
             domain or self.default_domain,
-            limit,
+            limit=limit,
             sort_by=MOST_RECENT_FIRST,
         )
         return [FlyteWorkflowExecution.promote_from_model(e) for e in exec_models]
@@ -522,8 +524,8 @@ class FlyteRemote(object):
             project=project or self.default_project,
             domain=domain or self.default_domain,
         )
-        # Ignore token for now
-        t_models, _ = self.client.list_tasks_paginated(
+        t_models = self.client.iterate_paginated(
+            self.client.list_tasks_paginated,
             named_entity_id,
             filters=[filter_models.Filter.from_python_std(f"eq(version,{version})")],
             limit=limit,
@@ -762,7 +764,6 @@ class FlyteRemote(object):
         """
         # Create a zip file containing all the entries.
         zip_file = fast_package(root, output, deref_symlinks)
-        md5_bytes, _ = hash_file(pathlib.Path(zip_file))
 
         # Upload zip file to Admin using FlyteRemote.
         return self.upload_file(pathlib.Path(zip_file))
@@ -819,6 +820,44 @@ class FlyteRemote(object):
 
         return md5_bytes, upload_location.native_url
 
+    def _upload_bundle(
+        self, digest: str, build: typing.Callable[[], pathlib.Path], project: str, domain: str
+    ) -> typing.Tuple[bytes, str]:
+        """
+        Returns the md5 digest and the native url of the code bundle built from the sources with the given digest,
+        building and uploading it only if it wasn't uploaded before.
+        """
+        cache = BundleCache(self.config.platform.endpoint, project, domain)
+        cached = cache.get(digest)
+        if cached is not None:
+            md5_bytes, native_url = cached
+            if self._remote_file_exists(native_url):
+                remote_logger.debug(f"Reusing the code bundle uploaded to {native_url}")
+                return md5_bytes, native_url
+        md5_bytes, native_url = self.upload_file(build(), project, domain)
+        cache.put(digest, md5_bytes, native_url)
+        return md5_bytes, native_url
+
+    def _remote_file_exists(self, native_url: str) -> bool:
+        """
+        Asks the data proxy for a download url of the remote file and checks that the file can be downloaded.
+        """
+        try:
+            download_location = self.client.get_download_signed_url(native_url)
+            # Signed urls are only valid for GET requests, so fetch the first byte only
+            with requests.get(
+                download_location.signed_url,
+                headers={"Range": "bytes=0-0"},
+                stream=True,
+                verify=False
+                if self._config.platform.insecure_skip_verify is True
+                else self._config.platform.ca_cert_file_path,
+            ) as rsp:
+                return rsp.status_code in (requests.codes["OK"], requests.codes["partial_content"])
+        except Exception as e:
+            remote_logger.debug(f"Failed to check that {native_url} exists: {e}")
+            return False
+
     @staticmethod
     def _version_from_hash(
         md5_bytes: bytes,
@@ -882,14 +921,29 @@ class FlyteRemote(object):
             image_config = ImageConfig.auto_default_image()
 
         with tempfile.TemporaryDirectory() as tmp_dir:
+            # Digest the sources first, so that a bundle uploaded for the same sources before is neither built nor
+            # uploaded again
             if copy_all:
-                md5_bytes, upload_native_url = self.fast_package(pathlib.Path(source_path), False, tmp_dir)
+                source = pathlib.Path(source_path)
+                ignore = IgnoreGroup(source, [GitIgnore, DockerIgnore, StandardIgnore])
+                digest = f"fast:{compute_digest(source, ignore.is_ignored)}"
+
+                def build() -> pathlib.Path:
+                    return pathlib.Path(fast_package(source, tmp_dir, False))
+
             else:
-                archive_fname = pathlib.Path(os.path.join(tmp_dir, "script_mode.tar.gz"))
-                compress_scripts(source_path, str(archive_fname), module_name)
-                md5_bytes, upload_native_url = self.upload_file(
-                    archive_fname, project or self.default_project, domain or self.default_domain
-                )
+                code_dir = os.path.join(tmp_dir, "code")
+                copy_module_to_destination(source_path, code_dir, module_name, [])
+                digest = f"script:{compute_digest(code_dir)}"
+
+                def build() -> pathlib.Path:
+                    archive_fname = pathlib.Path(os.path.join(tmp_dir, "script_mode.tar.gz"))
+                    compress_directory(code_dir, archive_fname)
+                    return archive_fname
+
+            md5_bytes, upload_native_url = self._upload_bundle(
+                digest, build, project or self.default_project, domain or self.default_domain
+            )
 
         serialization_settings = SerializationSettings(
             project=project,
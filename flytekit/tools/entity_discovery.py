@@ -0,0 +1,143 @@
+"""
+Finds the workflows and tasks a python file declares by reading its syntax tree, without importing it. Importing a
+file runs all of its module level code and imports everything it depends on, which is too slow to, for example,
+complete the names of the entities in a file on the command line.
+
+Only entities declared the usual ways are found: functions decorated with flytekit's decorators, and the results of
+calling them or instantiating task and workflow classes assigned to module level names. Names imported from other
+local files are looked up in those files the same way.
+"""
+
+import ast
+import os
+import typing
+
+# The flytekit functions and classes that create workflows and tasks. Classes whose name ends with Task, in flytekit
+# or its plugins, create tasks as well.
+_WORKFLOW_FACTORIES = {"workflow", "reference_workflow", "Workflow", "ImperativeWorkflow"}
+_TASK_FACTORIES = {"task", "dynamic", "eager", "reference_task", "map_task"}
+
+WORKFLOW = "workflow"
+TASK = "task"
+
+
+def _is_flytekit_module(name: str) -> bool:
+    root = name.split(".")[0]
+    return root == "flytekit" or root == "flytekitplugins"
+
+
+def _resolve_module(module: typing.Optional[str], level: int, filename: str) -> typing.Optional[str]:
+    """
+    Returns the file of an imported module, if it is a local python file.
+    """
+    parts = module.split(".") if module else []
+    if level > 0:
+        base = os.path.dirname(filename)
+        for _ in range(level - 1):
+            base = os.path.dirname(base)
+        search_paths = [base]
+    else:
+        search_paths = list(dict.fromkeys([os.path.dirname(filename), os.getcwd()]))
+    for base in search_paths:
+        path = os.path.join(base, *parts)
+        for candidate in (f"{path}.py", os.path.join(path, "__init__.py")):
+            if parts and os.path.isfile(candidate):
+                return candidate
+    return None
+
+
+class _Scanner(object):
+    def __init__(self):
+        self._files: typing.Dict[str, typing.Optional[typing.Dict[str, str]]] = {}
+
+    def scan(self, filename: str) -> typing.Optional[typing.Dict[str, str]]:
+        """
+        Returns the kind of every entity declared in the file, by name, or None if the file can't be parsed.
+        """
+        filename = os.path.abspath(filename)
+        if filename in self._files:
+            # Import cycles only find the entities declared before the cycle
+            return self._files[filename] or {}
+        self._files[filename] = None
+        try:
+            with open(filename, "rb") as f:
+                tree = ast.parse(f.read(), filename=filename)
+        except (OSError, SyntaxError, ValueError):
+            return None
+        entities = self._scan_tree(tree, filename)
+        self._files[filename] = entities
+        return entities
+
+    def _scan_tree(self, tree: ast.Module, filename: str) -> typing.Dict[str, str]:
+        # Local names of the flytekit functions and classes, and of the flytekit modules
+        names: typing.Dict[str, str] = {}
+        modules: typing.Set[str] = set()
+        entities: typing.Dict[str, str] = {}
+
+        def kind_of(node: ast.AST) -> typing.Optional[str]:
+            while isinstance(node, ast.Call):
+                node = node.func
+            if isinstance(node, ast.Name):
+                name = names.get(node.id)
+            elif isinstance(node, ast.Attribute):
+                root = node.value
+                while isinstance(root, ast.Attribute):
+                    root = root.value
+                name = node.attr if isinstance(root, ast.Name) and root.id in modules else None
+            else:
+                name = None
+            if name is None:
+                return None
+            if name in _WORKFLOW_FACTORIES:
+                return WORKFLOW
+            if name in _TASK_FACTORIES or name.endswith("Task"):
+                return TASK
+            return None
+
+        for node in tree.body:
+            if isinstance(node, ast.Import):
+                for alias in node.names:
+                    if _is_flytekit_module(alias.name):
+                        modules.add(alias.asname or alias.name.split(".")[0])
+            elif isinstance(node, ast.ImportFrom):
+                if node.level == 0 and node.module and _is_flytekit_module(node.module):
+                    for alias in node.names:
+                        names[alias.asname or alias.name] = alias.name
+                    continue
+                path = _resolve_module(node.module, node.level, filename)
+                imported = self.scan(path) if path else None
+                if not imported:
+                    continue
+                for alias in node.names:
+                    if alias.name == "*":
+                        entities.update(imported)
+                    elif alias.name in imported:
+                        entities[alias.asname or alias.name] = imported[alias.name]
+            elif isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                kinds = [k for k in map(kind_of, node.decorator_list) if k]
+                if kinds:
+                    entities[node.name] = kinds[0]
+                else:
+                    entities.pop(node.name, None)
+            elif isinstance(node, (ast.Assign, ast.AnnAssign)) and node.value is not None:
+                targets = node.targets if isinstance(node, ast.Assign) else [node.target]
+                kind = kind_of(node.value) if isinstance(node.value, ast.Call) else None
+                for target in targets:
+                    if isinstance(target, ast.Name):
+                        if kind:
+                            entities[target.id] = kind
+                        else:
+                            entities.pop(target.id, None)
+        return entities
+
+
+def find_entities(filename: str) -> typing.Optional[typing.Tuple[typing.List[str], typing.List[str]]]:
+    """
+    Returns the sorted names of the workflows and of the tasks in the python file, or None if it can't be parsed.
+    """
+    entities = _Scanner().scan(filename)
+    if entities is None:
+        return None
+    workflows = sorted(n for n, k in entities.items() if k == WORKFLOW)
+    tasks = sorted(n for n, k in entities.items() if k == TASK)
+    return workflows, tasks
@@ -1,20 +1,22 @@
 from __future__ import annotations
 
-import gzip
+import contextlib
 import hashlib
 import os
 import posixpath
-import subprocess as _subprocess
+import shutil
 import tarfile
 import tempfile
 from typing import Optional
 
 import click
 
+from flytekit.configuration.internal import LocalSDK
 from flytekit.core.context_manager import FlyteContextManager
 from flytekit.core.utils import timeit
+from flytekit.loggers import logger
 from flytekit.tools.ignore import DockerIgnore, GitIgnore, IgnoreGroup, StandardIgnore
-from flytekit.tools.script_mode import tar_strip_file_attributes
+from flytekit.tools.script_mode import compress_directory
 
 FAST_PREFIX = "fast"
 FAST_FILEENDING = ".tar.gz"
@@ -39,13 +41,7 @@ def fast_package(source: os.PathLike, output_dir: os.PathLike, deref_symlinks: b
 
     archive_fname = os.path.join(output_dir, archive_fname)
 
-    with tempfile.TemporaryDirectory() as tmp_dir:
-        tar_path = os.path.join(tmp_dir, "tmp.tar")
-        with tarfile.open(tar_path, "w", dereference=deref_symlinks) as tar:
-            tar.add(source, arcname="", filter=lambda x: ignore.tar_filter(tar_strip_file_attributes(x)))
-        with gzip.GzipFile(filename=archive_fname, mode="wb", mtime=0) as gzipped:
-            with open(tar_path, "rb") as tar_file:
-                gzipped.write(tar_file.read())
+    compress_directory(source, archive_fname, filter=ignore.tar_filter, deref_symlinks=deref_symlinks)
 
     return archive_fname
 
@@ -58,9 +54,13 @@ def compute_digest(source: os.PathLike, filter: Optional[callable] = None) -> st
     :return Text:
     """
     hasher = hashlib.md5()
-    for root, _, files in os.walk(source, topdown=True):
+    for root, dirs, files in os.walk(source, topdown=True):
 
         files.sort()
+        # Visit the directories in a fixed order, and don't descend into ignored ones
+        dirs.sort()
+        if filter:
+            dirs[:] = [d for d in dirs if not filter(os.path.relpath(os.path.join(root, d), source))]
 
         for fname in files:
             abspath = os.path.join(root, fname)
@@ -101,23 +101,77 @@ def get_additional_distribution_loc(remote_location: str, identifier: str) -> st
 @timeit("Download distribution")
 def download_distribution(additional_distribution: str, destination: str):
     """
-    Downloads a remote code distribution and overwrites any local files.
+    Downloads a remote code distribution and overwrites any local files. The archive is extracted while it is streamed,
+    without writing it to disk first.
+
+    If ``FLYTE_SDK_FAST_REGISTRATION_CACHE`` names a directory, for example one shared by all the pods on a node, every
+    distribution is downloaded and extracted there only once and copied from there afterwards.
     :param Text additional_distribution:
     :param os.PathLike destination:
     """
     if not os.path.isdir(destination):
         raise ValueError("Destination path is required to download distribution and it should be a directory")
-    # NOTE the os.path.join(destination, ''). This is to ensure that the given path is infact a directory and all
-    # downloaded data should be copied into this directory. We do this to account for a difference in behavior in
-    # fsspec, which requires a trailing slash in case of pre-existing directory.
-    FlyteContextManager.current_context().file_access.get_data(additional_distribution, os.path.join(destination, ""))
     tarfile_name = os.path.basename(additional_distribution)
     if not tarfile_name.endswith(".tar.gz"):
         raise RuntimeError("Unrecognized additional distribution format for {}".format(additional_distribution))
 
-    # This will overwrite the existing user flyte workflow code in the current working code dir.
-    result = _subprocess.run(
-        ["tar", "-xvf", os.path.join(destination, tarfile_name), "-C", destination],
-        stdout=_subprocess.PIPE,
-    )
-    result.check_returncode()
+    cache_dir = LocalSDK.FAST_REGISTRATION_CACHE.read()
+    if not cache_dir:
+        # This will overwrite the existing user flyte workflow code in the current working code dir.
+        _extract_distribution(additional_distribution, destination)
+        return
+
+    # Distributions are content addressed, so their location identifies their contents
+    key = hashlib.sha256(additional_distribution.encode("utf-8")).hexdigest()
+    cached = os.path.join(cache_dir, key)
+    if not os.path.isdir(cached):
+        os.makedirs(cache_dir, exist_ok=True)
+        with _file_lock(f"{cached}.lock"):
+            # Another process may have extracted it while this one waited for the lock
+            if not os.path.isdir(cached):
+                tmp_dir = tempfile.mkdtemp(prefix=f"{key}.", dir=cache_dir)
+                try:
+                    _extract_distribution(additional_distribution, tmp_dir)
+                    # mkdtemp creates the directory with mode 0700, which other users sharing the cache can't read
+                    os.chmod(tmp_dir, 0o755)
+                    os.rename(tmp_dir, cached)
+                except BaseException:
+                    shutil.rmtree(tmp_dir, ignore_errors=True)
+                    raise
+    else:
+        logger.info(f"Using the distribution {additional_distribution} cached in {cached}")
+    # The entries are copied one by one, so the mode of the destination itself is left as it is
+    for entry in os.scandir(cached):
+        target = os.path.join(destination, entry.name)
+        if entry.is_dir(follow_symlinks=False):
+            shutil.copytree(entry.path, target, symlinks=True, dirs_exist_ok=True)
+        else:
+            if os.path.islink(target):
+                os.unlink(target)
+            shutil.copy2(entry.path, target, follow_symlinks=False)
+
+
+def _extract_distribution(additional_distribution: str, destination: str):
+    file_access = FlyteContextManager.current_context().file_access
+    fs = file_access.get_filesystem_for_path(additional_distribution)
+    with fs.open(additional_distribution, "rb") as f, tarfile.open(fileobj=f, mode="r|gz") as tar:
+        if hasattr(tarfile, "tar_filter"):
+            # The same members are refused and the same permissions dropped as when extracting with the tar cli
+            tar.extractall(destination, filter="tar")
+        else:
+            tar.extractall(destination)
+
+
+@contextlib.contextmanager
+def _file_lock(path: str):
+    """
+    Holds an exclusive lock on the file, which is shared by all the processes on the host.
+    """
+    import fcntl
+
+    with open(path, "a") as f:
+        fcntl.flock(f, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(f, fcntl.LOCK_UN)
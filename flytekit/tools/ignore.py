@@ -1,11 +1,13 @@
 import os
+import posixpath
+import re
 import subprocess
 import tarfile as _tarfile
 from abc import ABC, abstractmethod
-from fnmatch import fnmatch
+from fnmatch import translate
 from pathlib import Path
 from shutil import which
-from typing import Dict, List, Optional, Type
+from typing import Dict, List, Optional, Set, Type
 
 from docker.utils.build import PatternMatcher
 
@@ -42,10 +44,15 @@ class GitIgnore(Ignore):
         super().__init__(root)
         self.has_git = which("git") is not None
         self.ignored = self._list_ignored()
+        # git lists ignored directories once, with a trailing slash, instead of every file in them
+        self._ignored_trees: Set[str] = {path[:-1] for path in self.ignored if path.endswith("/")}
+        self._ignored_dirs: Dict[str, bool] = {}
 
     def _list_ignored(self) -> Dict:
         if self.has_git:
-            out = subprocess.run(["git", "ls-files", "-io", "--exclude-standard"], cwd=self.root, capture_output=True)
+            out = subprocess.run(
+                ["git", "ls-files", "-io", "--exclude-standard", "--directory"], cwd=self.root, capture_output=True
+            )
             if out.returncode == 0:
                 return dict.fromkeys(out.stdout.decode("utf-8").split("\n")[:-1])
             cli_logger.warning(f"Could not determine ignored files due to:\n{out.stderr}\nNot applying any filters")
@@ -56,15 +63,29 @@ class GitIgnore(Ignore):
     def _is_ignored(self, path: str) -> bool:
         if self.ignored:
             # git-ls-files uses POSIX paths
-            if Path(path).as_posix() in self.ignored:
+            posix_path = path.replace(os.sep, "/") if os.sep != "/" else path
+            if posix_path in self.ignored:
                 return True
+            if self._ignored_trees:
+                parent = posix_path
+                while parent:
+                    if parent in self._ignored_trees:
+                        return True
+                    parent = posixpath.dirname(parent)
             # Ignore empty directories
-            if os.path.isdir(os.path.join(self.root, path)) and all(
-                [self.is_ignored(os.path.join(path, f)) for f in os.listdir(os.path.join(self.root, path))]
-            ):
-                return True
+            return self._is_ignored_dir(path, posix_path)
         return False
 
+    def _is_ignored_dir(self, path: str, posix_path: str) -> bool:
+        # Directories are looked at once, instead of again for each of their parents
+        if posix_path not in self._ignored_dirs:
+            abs_path = os.path.join(self.root, path)
+            ignored = os.path.isdir(abs_path) and all(
+                self.is_ignored(os.path.join(path, f)) for f in os.listdir(abs_path)
+            )
+            self._ignored_dirs[posix_path] = ignored
+        return self._ignored_dirs[posix_path]
+
 
 class DockerIgnore(Ignore):
     """Uses docker-py's PatternMatcher to check whether a path is ignored."""
@@ -93,12 +114,11 @@ class StandardIgnore(Ignore):
     def __init__(self, root: Path, patterns: Optional[List[str]] = None):
         super().__init__(root)
         self.patterns = patterns if patterns else STANDARD_IGNORE_PATTERNS
+        # All the patterns compiled into one expression, matched the same way fnmatch matches them one by one
+        self._regex = re.compile("|".join(translate(os.path.normcase(p)) for p in self.patterns))
 
     def _is_ignored(self, path: str) -> bool:
-        for pattern in self.patterns:
-            if fnmatch(path, pattern):
-                return True
-        return False
+        return self._regex.match(os.path.normcase(path)) is not None
 
 
 class IgnoreGroup(Ignore):
@@ -108,12 +128,25 @@ class IgnoreGroup(Ignore):
     def __init__(self, root: str, ignores: List[Type[Ignore]]):
         super().__init__(root)
         self.ignores = [ignore(root) for ignore in ignores]
+        # Packaging checks the same paths for the digest and again for the archive
+        self._ignored: Dict[str, bool] = {}
 
     def _is_ignored(self, path: str) -> bool:
-        for ignore in self.ignores:
-            if ignore.is_ignored(path):
-                return True
-        return False
+        if path not in self._ignored:
+            self._ignored[path] = any(ignore.is_ignored(path) for ignore in self.ignores)
+        return self._ignored[path]
+
+    def walk(self):
+        """
+        Walks the files under the root like ``os.walk``, leaving out the ignored files and not descending into the
+        ignored directories. The directories and files are listed in sorted order.
+        """
+        for root, dirs, files in os.walk(self.root, topdown=True):
+            rel_root = os.path.relpath(root, self.root)
+            dirs[:] = sorted(d for d in dirs if not self.is_ignored(os.path.normpath(os.path.join(rel_root, d))))
+            yield root, dirs, sorted(
+                f for f in files if not self.is_ignored(os.path.normpath(os.path.join(rel_root, f)))
+            )
 
     def list_ignored(self) -> List[str]:
         ignored = []
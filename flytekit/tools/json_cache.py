@@ -0,0 +1,41 @@
+"""
+Helpers for the caches that flytekit keeps on disk as json files, which may be read and written by several processes
+at the same time.
+"""
+
+import json
+import os
+import threading
+import typing
+
+from flytekit.loggers import logger
+
+
+def read_json(path: str) -> typing.Dict[str, typing.Any]:
+    """
+    Returns the contents of the json file, or an empty dict if it doesn't exist or can't be read.
+    """
+    try:
+        with open(path) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def write_json(path: str, data: typing.Any):
+    """
+    Replaces the json file atomically, creating its directory if needed. The data is written to a temporary file
+    first, so concurrent readers never read partial files. Failures are only logged, as the cache is then only missed.
+    """
+    tmp = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(tmp, "w") as f:
+            json.dump(data, f)
+        os.replace(tmp, path)
+    except OSError as e:
+        logger.debug(f"Failed to write the cache file {path}: {e}")
+        try:
+            os.remove(tmp)
+        except OSError:
+            pass
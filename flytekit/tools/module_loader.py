@@ -3,7 +3,7 @@ import importlib
 import os
 import pkgutil
 import sys
-from typing import Any, Iterator, List, Union
+from typing import Any, Iterator, List, Tuple, Union
 
 
 @contextlib.contextmanager
@@ -33,6 +33,57 @@ def just_load_modules(pkgs: List[str]):
             importlib.import_module(name)
 
 
+def list_modules(pkgs: List[str]) -> List[Tuple[str, str]]:
+    """
+    Returns the name and file of the same modules :py:func:`just_load_modules` loads, without importing them. Only
+    the modules of packages that can be found on ``sys.path`` without importing anything are listed, e.g. not the
+    ones of namespace packages spread over multiple folders.
+    """
+    modules: List[Tuple[str, str]] = []
+    for package_name in pkgs:
+        spec = None
+        for path in sys.path:
+            finder = pkgutil.get_importer(path or ".")
+            spec = _find_spec(finder, package_name) if finder else None
+            if spec is not None:
+                break
+        if spec is None or not spec.origin:
+            raise ModuleNotFoundError(f"Module {package_name} not found", name=package_name)
+        modules.append((package_name, spec.origin))
+        if spec.submodule_search_locations:
+            modules.extend(_list_submodules(list(spec.submodule_search_locations), f"{package_name}."))
+    # Packages may be given together with their subpackages
+    return list(dict.fromkeys(modules))
+
+
+def _find_spec(finder, name: str):
+    """
+    Walks down the folders of the parent packages of a dotted module name, instead of importing them.
+    """
+    parts = name.split(".")
+    for i, part in enumerate(parts):
+        spec = finder.find_spec(".".join(parts[: i + 1]))
+        if spec is None:
+            return None
+        if i < len(parts) - 1:
+            if not spec.submodule_search_locations:
+                return None
+            finder = pkgutil.get_importer(list(spec.submodule_search_locations)[0])
+    return spec
+
+
+def _list_submodules(paths: List[str], prefix: str) -> List[Tuple[str, str]]:
+    modules = []
+    for info in pkgutil.iter_modules(paths, prefix=prefix):
+        spec = info.module_finder.find_spec(info.name)  # type: ignore
+        if spec is None or not spec.origin:
+            continue
+        modules.append((info.name, spec.origin))
+        if info.ispkg:
+            modules.extend(_list_submodules(list(spec.submodule_search_locations), f"{info.name}."))
+    return modules
+
+
 def load_object_from_module(object_location: str) -> Any:
     """
     # TODO: Handle corner cases, like where the first part is [] maybe
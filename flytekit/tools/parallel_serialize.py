@@ -0,0 +1,218 @@
+"""
+Serializes the entities of a package tree in worker processes, one independent subtree of modules per process, and
+keeps the serialized specs of every module in a persistent cache.
+
+A module's cache entry is keyed by the module name, the ``SerializationSettings`` and ``Options`` used and the
+flytekit version. It records the hash of every file under the source root that was imported while the module was
+loaded, so the entry is only used while none of those files changed. Unchanged modules are neither imported nor
+serialized again.
+"""
+
+import base64
+import hashlib
+import importlib
+import json
+import multiprocessing
+import os
+import sys
+import typing
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+
+from flyteidl.admin import launch_plan_pb2 as _launch_plan_pb2
+from flyteidl.admin import task_pb2 as _task_pb2
+from flyteidl.admin import workflow_pb2 as _workflow_pb2
+
+from flytekit import LaunchPlan
+from flytekit.core import context_manager as flyte_context
+from flytekit.core.base_task import PythonTask
+from flytekit.core.data_persistence import file_digest
+from flytekit.core.workflow import WorkflowBase
+from flytekit.loggers import logger
+from flytekit.models import launch_plan as _launch_plan_models
+from flytekit.models.admin.workflow import WorkflowSpec
+from flytekit.models.task import TaskSpec
+from flytekit.tools import module_loader
+from flytekit.tools.json_cache import read_json, write_json
+from flytekit.tools.serialize_helpers import _should_register_with_admin, build_image_specs
+from flytekit.tools.translator import FlyteControlPlaneEntity, Options, get_serializable
+
+if typing.TYPE_CHECKING:
+    from flytekit.configuration import SerializationSettings
+
+_SPEC_TYPES = {
+    "task": (TaskSpec, _task_pb2.TaskSpec),
+    "workflow": (WorkflowSpec, _workflow_pb2.WorkflowSpec),
+    "launch_plan": (_launch_plan_models.LaunchPlan, _launch_plan_pb2.LaunchPlan),
+}
+
+# The serialized specs of a module, tagged with their _SPEC_TYPES key, and the files it depends on with their hashes
+ModuleSpecs = typing.Tuple[typing.List[typing.Tuple[str, bytes]], typing.Dict[str, str]]
+
+
+def _spec_kind(spec: FlyteControlPlaneEntity) -> str:
+    for kind, (t, _) in _SPEC_TYPES.items():
+        if isinstance(spec, t):
+            return kind
+    raise ValueError(f"Unknown spec type {type(spec)}")
+
+
+def _spec_id(kind: str, spec: FlyteControlPlaneEntity) -> bytes:
+    i = spec.id if kind == "launch_plan" else spec.template.id  # type: ignore
+    return i.to_flyte_idl().SerializeToString(deterministic=True)
+
+
+def _loaded_files(source_root: str) -> typing.Dict[str, str]:
+    """
+    Returns the hashes of the files of all the loaded modules under the source root.
+    """
+    root = os.path.join(os.path.abspath(source_root), "")
+    files = {}
+    for m in list(sys.modules.values()):
+        f = getattr(m, "__file__", None)
+        if f and os.path.abspath(f).startswith(root) and os.path.isfile(f):
+            files[os.path.abspath(f)] = file_digest(f)
+    return files
+
+
+def _serialize_modules(
+    modules: typing.List[str],
+    source_root: str,
+    settings: "SerializationSettings",
+    options: typing.Optional[Options] = None,
+) -> typing.Dict[str, ModuleSpecs]:
+    """
+    Imports the given modules in order and serializes the entities each of them declares. An entity belongs to the
+    module whose import created it, so it is serialized only once even if other modules import it as well.
+    """
+    results = {}
+    ctx = flyte_context.FlyteContextManager.current_context().with_serialization_settings(settings)
+    with flyte_context.FlyteContextManager.with_context(ctx) as ctx, module_loader.add_sys_path(source_root):
+        for name in modules:
+            start = len(flyte_context.FlyteEntities.entities)
+            importlib.import_module(name)
+            serialized: typing.Dict = OrderedDict()
+            build_image_specs(ctx, flyte_context.FlyteEntities.entities[start:])
+            for entity in flyte_context.FlyteEntities.entities[start:]:
+                if isinstance(entity, (PythonTask, WorkflowBase, LaunchPlan)):
+                    get_serializable(serialized, ctx.serialization_settings, entity, options=options)
+                    if isinstance(entity, WorkflowBase):
+                        lp = LaunchPlan.get_default_launch_plan(ctx, entity)
+                        get_serializable(serialized, ctx.serialization_settings, lp, options)
+            specs = [
+                (_spec_kind(s), s.serialize_to_string())
+                for s in filter(_should_register_with_admin, serialized.values())
+            ]
+            results[name] = (specs, _loaded_files(source_root))
+    return results
+
+
+class ModuleSpecCache(object):
+    """
+    A folder of serialized specs, one json file per module and serialization key.
+    """
+
+    def __init__(self, path: str, settings: "SerializationSettings", options: typing.Optional[Options] = None):
+        from flytekit import __version__
+
+        self._path = path
+        key = json.dumps(
+            [settings.to_json(sort_keys=True), repr(options), __version__, sys.version_info[:2]], sort_keys=True
+        )
+        self._key = hashlib.sha256(key.encode("utf-8")).hexdigest()
+        self._digests: typing.Dict[str, typing.Optional[str]] = {}
+
+    def _entry_path(self, module: str) -> str:
+        return os.path.join(self._path, hashlib.sha256(f"{self._key}:{module}".encode("utf-8")).hexdigest() + ".json")
+
+    def _digest(self, path: str) -> typing.Optional[str]:
+        if path not in self._digests:
+            self._digests[path] = file_digest(path) if os.path.isfile(path) else None
+        return self._digests[path]
+
+    def get(self, module: str) -> typing.Optional[ModuleSpecs]:
+        """
+        Returns the cached specs of the module, unless any of the files it depends on changed.
+        """
+        entry = read_json(self._entry_path(module))
+        if not entry:
+            return None
+        files = entry["files"]
+        if any(self._digest(path) != digest for path, digest in files.items()):
+            return None
+        return [(kind, base64.b64decode(spec)) for kind, spec in entry["specs"]], files
+
+    def put(self, module: str, module_specs: ModuleSpecs):
+        specs, files = module_specs
+        entry = {
+            "specs": [(kind, base64.b64encode(spec).decode("ascii")) for kind, spec in specs],
+            "files": files,
+        }
+        write_json(self._entry_path(module), entry)
+
+
+def _subtrees(modules: typing.List[str], pkgs: typing.List[str]) -> typing.List[typing.List[str]]:
+    """
+    Groups the modules by the first level below the package they were listed for. Modules in the same subtree
+    usually import each other, so they are loaded in the same process.
+    """
+    groups: typing.Dict[str, typing.List[str]] = OrderedDict()
+    for m in modules:
+        pkg = max((p for p in pkgs if m == p or m.startswith(f"{p}.")), key=len, default=m)
+        rest = m[len(pkg) + 1 :].split(".")[0] if m != pkg else ""
+        groups.setdefault(f"{pkg}.{rest}" if rest else pkg, []).append(m)
+    return list(groups.values())
+
+
+def serialize_modules(
+    pkgs: typing.List[str],
+    settings: "SerializationSettings",
+    source_root: str,
+    options: typing.Optional[Options] = None,
+    workers: int = 1,
+    cache_dir: typing.Optional[str] = None,
+) -> typing.List[FlyteControlPlaneEntity]:
+    """
+    Serializes the entities of the given packages the same way :py:func:`flytekit.tools.repo.serialize` does, but
+    loads the modules that are not in the cache in worker processes.
+
+    :param pkgs: Dot-delimited Python packages/subpackages to look into for serialization.
+    :param settings: SerializationSettings to be used, with the source root set.
+    :param source_root: Where to start looking for the code.
+    :param options: Options to be used for the launch plans.
+    :param workers: The maximum number of processes to import and serialize modules in.
+    :param cache_dir: The folder to keep the serialized specs of every module in, nothing is cached if not given.
+    """
+    with module_loader.add_sys_path(source_root):
+        modules = [m for m, _ in module_loader.list_modules(pkgs)]
+
+    cache = ModuleSpecCache(cache_dir, settings, options) if cache_dir else None
+    results: typing.Dict[str, ModuleSpecs] = {}
+    if cache:
+        for m in modules:
+            cached = cache.get(m)
+            if cached is not None:
+                results[m] = cached
+    stale = [m for m in modules if m not in results]
+    logger.info(f"Serializing {len(stale)} of {len(modules)} modules, the others are cached")
+
+    if stale:
+        groups = _subtrees(stale, pkgs)
+        # Modules are loaded in fresh interpreters, so modules the current process already imported are loaded and
+        # their entities created again.
+        mp_context = multiprocessing.get_context("spawn")
+        with ProcessPoolExecutor(max_workers=max(1, min(workers, len(groups))), mp_context=mp_context) as pool:
+            futures = [pool.submit(_serialize_modules, g, source_root, settings, options) for g in groups]
+            for f in futures:
+                for m, module_specs in f.result().items():
+                    results[m] = module_specs
+                    if cache:
+                        cache.put(m, module_specs)
+
+    entities: typing.Dict[typing.Tuple[str, bytes], FlyteControlPlaneEntity] = OrderedDict()
+    for m in modules:
+        for kind, spec in results[m][0]:
+            model_type, pb_type = _SPEC_TYPES[kind]
+            model = model_type.from_flyte_idl(pb_type.FromString(spec))
+            entities.setdefault((kind, _spec_id(kind, model)), model)
+    return list(entities.values())
@@ -14,6 +14,7 @@ from flytekit.models.core.identifier import Identifier
 from flytekit.remote import FlyteRemote
 from flytekit.remote.remote import RegistrationSkipped, _get_git_repo_url
 from flytekit.tools import fast_registration, module_loader
+from flytekit.tools.parallel_serialize import serialize_modules
 from flytekit.tools.script_mode import _find_project_root
 from flytekit.tools.serialize_helpers import get_registrable_entities, persist_registrable_entities
 from flytekit.tools.translator import FlyteControlPlaneEntity, Options
@@ -28,6 +29,8 @@ def serialize(
     settings: SerializationSettings,
     local_source_root: typing.Optional[str] = None,
     options: typing.Optional[Options] = None,
+    workers: int = 1,
+    cache_dir: typing.Optional[str] = None,
 ) -> typing.List[FlyteControlPlaneEntity]:
     """
     See :py:class:`flytekit.models.core.identifier.ResourceType` to match the trailing index in the file name with the
@@ -36,8 +39,21 @@ def serialize(
     :param settings: SerializationSettings to be used
     :param pkgs: Dot-delimited Python packages/subpackages to look into for serialization.
     :param local_source_root: Where to start looking for the code.
+    :param workers: If more than one, independent module subtrees are loaded and serialized in this many processes.
+    :param cache_dir: If given, the serialized specs of every module are cached in this folder, and modules whose
+        files did not change are not loaded again.
     """
     settings.source_root = local_source_root
+    if workers > 1 or cache_dir:
+        click.secho(
+            f"Loading packages {pkgs} under source root {local_source_root} in {workers} processes", fg="yellow"
+        )
+        registrable_entities = serialize_modules(
+            pkgs, settings, local_source_root or os.getcwd(), options, workers=workers, cache_dir=cache_dir
+        )
+        click.secho(f"Successfully serialized {len(registrable_entities)} flyte objects", fg="green")
+        return registrable_entities
+
     ctx = FlyteContextManager.current_context().with_serialization_settings(settings)
     with FlyteContextManager.with_context(ctx) as ctx:
         # Scan all modules. the act of loading populates the global singleton that contains all objects
@@ -110,11 +126,13 @@ def serialize_and_package(
     fast: bool = False,
     deref_symlinks: bool = False,
     options: typing.Optional[Options] = None,
+    workers: int = 1,
+    cache_dir: typing.Optional[str] = None,
 ):
     """
     Fist serialize and then package all entities
     """
-    serializable_entities = serialize(pkgs, settings, source, options=options)
+    serializable_entities = serialize(pkgs, settings, source, options=options, workers=workers, cache_dir=cache_dir)
     package(serializable_entities, source, output, fast, deref_symlinks)
 
 
@@ -148,6 +166,8 @@ def load_packages_and_modules(
     project_root: Path,
     pkgs_or_mods: typing.List[str],
     options: typing.Optional[Options] = None,
+    workers: int = 1,
+    cache_dir: typing.Optional[str] = None,
 ) -> typing.List[FlyteControlPlaneEntity]:
     """
     The project root is added as the first entry to sys.path, and then all the specified packages and modules
@@ -162,6 +182,8 @@ def load_packages_and_modules(
     :param project_root:
     :param pkgs_or_mods:
     :param options:
+    :param workers: The number of processes to serialize the modules in, see :py:func:`serialize`
+    :param cache_dir: The folder to cache the serialized modules in, see :py:func:`serialize`
     :return: The common detected root path, the output of _find_project_root
     """
     ss.git_repo = _get_git_repo_url(project_root)
@@ -178,7 +200,9 @@ def load_packages_and_modules(
         )
         pkgs_and_modules.append(dot_delineated)
 
-    registrable_entities = serialize(pkgs_and_modules, ss, str(project_root), options)
+    registrable_entities = serialize(
+        pkgs_and_modules, ss, str(project_root), options, workers=workers, cache_dir=cache_dir
+    )
 
     return registrable_entities
 
@@ -218,6 +242,8 @@ def register(
     package_or_module: typing.Tuple[str],
     remote: FlyteRemote,
     dry_run: bool = False,
+    workers: int = 1,
+    cache_dir: typing.Optional[str] = None,
 ):
     detected_root = find_common_root(package_or_module)
     click.secho(f"Detected Root {detected_root}, using this to create deployable package...", fg="yellow")
@@ -255,7 +281,7 @@ def register(
 
     # Load all the entities
     registrable_entities = load_packages_and_modules(
-        serialization_settings, detected_root, list(package_or_module), options
+        serialization_settings, detected_root, list(package_or_module), options, workers=workers, cache_dir=cache_dir
     )
     if len(registrable_entities) == 0:
         click.secho("No Flyte entities were detected. Aborting!", fg="red")
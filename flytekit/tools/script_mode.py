@@ -1,17 +1,23 @@
-import gzip
+import collections
 import hashlib
 import importlib
 import os
 import shutil
+import struct
 import tarfile
 import tempfile
 import typing
+import zlib
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 from flytekit import PythonFunctionTask
 from flytekit.core.tracker import get_full_module_path
 from flytekit.core.workflow import ImperativeWorkflow, WorkflowBase
 
+# The size of the chunks of a tarball that are compressed in parallel
+GZIP_CHUNK_SIZE = 4 * 1024 * 1024
+
 
 def compress_scripts(source_path: str, destination: str, module_name: str):
     """
@@ -46,12 +52,74 @@ def compress_scripts(source_path: str, destination: str, module_name: str):
 
         visited: typing.List[str] = []
         copy_module_to_destination(source_path, destination_path, module_name, visited)
+        compress_directory(destination_path, destination)
+
+
+def compress_directory(
+    source: typing.Union[os.PathLike, str],
+    destination: typing.Union[os.PathLike, str],
+    filter: typing.Optional[typing.Callable[[tarfile.TarInfo], typing.Optional[tarfile.TarInfo]]] = None,
+    deref_symlinks: bool = False,
+):
+    """
+    Packages the directory into a gzipped tarball that only depends on the names and contents of its files, so that
+    the same sources always produce the same archive and md5 digest.
+
+    :param source: the directory to package
+    :param destination: the path of the tarball to write
+    :param filter: a tarfile filter applied to every member once its attributes are stripped
+    :param deref_symlinks: whether to package the files symlinks point to instead of the symlinks
+    """
+
+    def strip(tar_info: tarfile.TarInfo) -> typing.Optional[tarfile.TarInfo]:
+        tar_info = tar_strip_file_attributes(tar_info)
+        return filter(tar_info) if filter else tar_info
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
         tar_path = os.path.join(tmp_dir, "tmp.tar")
-        with tarfile.open(tar_path, "w") as tar:
-            tar.add(os.path.join(tmp_dir, "code"), arcname="", filter=tar_strip_file_attributes)
-        with gzip.GzipFile(filename=destination, mode="wb", mtime=0) as gzipped:
-            with open(tar_path, "rb") as tar_file:
-                gzipped.write(tar_file.read())
+        with tarfile.open(tar_path, "w", dereference=deref_symlinks) as tar:
+            tar.add(source, arcname="", filter=strip)
+        gzip_file(tar_path, destination)
+
+
+def _deflate(chunk: bytes, last: bool) -> bytes:
+    compressor = zlib.compressobj(9, zlib.DEFLATED, -zlib.MAX_WBITS)
+    # A full flush ends the chunk on a byte boundary without ending the stream, so the next chunk can follow it
+    return compressor.compress(chunk) + compressor.flush(zlib.Z_FINISH if last else zlib.Z_FULL_FLUSH)
+
+
+def gzip_file(
+    source: typing.Union[os.PathLike, str],
+    destination: typing.Union[os.PathLike, str],
+    chunk_size: int = GZIP_CHUNK_SIZE,
+    max_workers: typing.Optional[int] = None,
+):
+    """
+    Compresses the file with gzip, deflating its chunks in parallel the way pigz does, into a single gzip stream that
+    any gzip reader can read. The stream records neither a file name nor a modification time, so the same file always
+    compresses to the same bytes.
+    """
+    max_workers = max_workers or os.cpu_count() or 1
+    with open(source, "rb") as src, open(destination, "wb") as dst, ThreadPoolExecutor(max_workers) as pool:
+        # Magic number, deflate, no flags, no modification time, maximum compression, unknown OS
+        dst.write(b"\x1f\x8b\x08\x00\x00\x00\x00\x00\x02\xff")
+        pending: typing.Deque = collections.deque()
+        crc, size = 0, 0
+        chunk = src.read(chunk_size)
+        while True:
+            next_chunk = src.read(chunk_size) if chunk else b""
+            last = not next_chunk
+            crc = zlib.crc32(chunk, crc)
+            size += len(chunk)
+            # zlib releases the GIL while it compresses
+            pending.append(pool.submit(_deflate, chunk, last))
+            # Write the chunks in order, keeping only a few of them in memory
+            while pending and (last or len(pending) >= 2 * max_workers):
+                dst.write(pending.popleft().result())
+            if last:
+                break
+            chunk = next_chunk
+        dst.write(struct.pack("<II", crc, size & 0xFFFFFFFF))
 
 
 def copy_module_to_destination(
@@ -1,9 +1,11 @@
 from __future__ import annotations
 
+import fnmatch
 import os
 import pathlib
 import random
 import typing
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any, Generator, Tuple
@@ -30,6 +32,22 @@ def noop():
     ...
 
 
+def _glob_match(rel_path: str, pattern: str) -> bool:
+    """
+    Returns whether a relative path matches a glob pattern. As in shell globs, ``*`` and ``?`` don't match ``/``, and
+    a ``**`` path segment matches any number of directories.
+    """
+
+    def _match(parts: typing.List[str], segments: typing.List[str]) -> bool:
+        if not segments:
+            return not parts
+        if segments[0] == "**":
+            return any(_match(parts[i:], segments[1:]) for i in range(len(parts) + 1))
+        return bool(parts) and fnmatch.fnmatchcase(parts[0], segments[0]) and _match(parts[1:], segments[1:])
+
+    return _match(rel_path.replace(os.sep, "/").split("/"), pattern.split("/"))
+
+
 @dataclass
 class FlyteDirectory(DataClassJsonMixin, os.PathLike, typing.Generic[T]):
     path: PathType = field(default=None, metadata=config(mm_field=fields.String()))  # type: ignore
@@ -138,6 +156,8 @@ class FlyteDirectory(DataClassJsonMixin, os.PathLike, typing.Generic[T]):
         self._downloaded = False
         self._remote_directory = remote_directory
         self._remote_source = None
+        self._listing: typing.Optional[typing.List[str]] = None
+        self._fetched: typing.Set[str] = set()
 
     def __fspath__(self):
         """
@@ -230,8 +250,70 @@ class FlyteDirectory(DataClassJsonMixin, os.PathLike, typing.Generic[T]):
         new_path = self.sep.join([str(self.path).rstrip(self.sep), name])  # trim trailing sep if any and join
         return FlyteDirectory(path=new_path)
 
-    def download(self) -> str:
-        return self.__fspath__()
+    def download(self, pattern: typing.Optional[str] = None, max_workers: typing.Optional[int] = None) -> str:
+        """
+        Downloads the directory and returns the local path to it. If a glob pattern is given, e.g. ``"*.parquet"``,
+        only the files whose path relative to the directory matches it are downloaded, concurrently. As in shell
+        globs, ``*`` doesn't match ``/``, so ``"**/*.parquet"`` matches the files in all subdirectories.
+
+        :param pattern: Optional glob pattern matched against the relative paths returned by listing()
+        :param max_workers: Number of files fetched at the same time when downloading a subset of the files
+        """
+        if pattern is None:
+            return self.__fspath__()
+        if self._remote_source is not None and not self._downloaded:
+            self._fetch_files([p for p in self.listing() if _glob_match(p, pattern)], max_workers)
+        return str(self.path)
+
+    def listing(self) -> typing.List[str]:
+        """
+        Returns the paths of all files in the directory, relative to it. For remote directories only the listing is
+        fetched, not the files. The result is cached.
+
+            >>> fd.listing()
+            ['dir1/file1', 'dir2/file1', 'file1']
+        """
+        if self._listing is None:
+            self._listing = sorted(str(p) for _, p in self.crawl())
+        return self._listing
+
+    def get_file(self, rel_path: str) -> FlyteFile:
+        """
+        Returns a single file of the directory. If the directory has not been downloaded, the returned FlyteFile only
+        downloads that file, and only once it is opened.
+
+        :param rel_path: The path of the file relative to the directory, as returned by listing()
+        """
+        local_path = os.path.join(str(self.path), rel_path)
+        if self._remote_source is None or self._downloaded:
+            return FlyteFile(path=local_path)
+
+        ff = FlyteFile(path=local_path, downloader=lambda: self._fetch_files([rel_path]))
+        ff._remote_source = self._remote_file_path(rel_path)
+        return ff
+
+    def _remote_file_path(self, rel_path: str) -> str:
+        return "/".join([self._remote_source.rstrip("/"), rel_path.replace(os.sep, "/")])  # type: ignore
+
+    def _fetch_files(self, rel_paths: typing.List[str], max_workers: typing.Optional[int] = None):
+        """
+        Downloads the given files of a remote directory to the same location a full download would put them.
+        """
+        rel_paths = [p for p in rel_paths if p not in self._fetched]
+        if not rel_paths:
+            return
+        ctx = FlyteContextManager.current_context()
+
+        def _fetch(rel_path: str):
+            ctx.file_access.get_data(self._remote_file_path(rel_path), os.path.join(str(self.path), rel_path))
+            self._fetched.add(rel_path)
+
+        if len(rel_paths) == 1:
+            _fetch(rel_paths[0])
+            return
+        with ThreadPoolExecutor(max_workers=max_workers or min(32, len(rel_paths))) as executor:
+            # Consume the results so that the first failure is raised
+            list(executor.map(_fetch, rel_paths))
 
     def crawl(
         self, maxdepth: typing.Optional[int] = None, topdown: bool = True, **kwargs
@@ -357,6 +439,11 @@ class FlyteDirToMultipartBlobTransformer(TypeTransformer[FlyteDirectory]):
 
         # If we're uploading something, that means that the uri should always point to the upload destination.
         if should_upload:
+            if remote_directory is None and ctx.file_access.content_addressed_uploads:
+                remote_directory = ctx.file_access.put_content_addressed(
+                    source_path, is_multipart=True, batch_size=batch_size
+                )
+                return Literal(scalar=Scalar(blob=Blob(metadata=meta, uri=remote_directory)))
             if remote_directory is None:
                 remote_directory = ctx.file_access.get_random_remote_directory()
             ctx.file_access.put_data(source_path, remote_directory, is_multipart=True, batch_size=batch_size)
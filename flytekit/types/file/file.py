@@ -390,6 +390,9 @@ class FlyteFilePathTransformer(TypeTransformer[FlyteFile]):
 
         # If we're uploading something, that means that the uri should always point to the upload destination.
         if should_upload:
+            if remote_path is None and ctx.file_access.content_addressed_uploads:
+                remote_path = ctx.file_access.put_content_addressed(source_path, is_multipart=False)
+                return Literal(scalar=Scalar(blob=Blob(metadata=meta, uri=remote_path)))
             if remote_path is None:
                 remote_path = ctx.file_access.get_random_remote_path(source_path)
             ctx.file_access.put_data(source_path, remote_path, is_multipart=False)
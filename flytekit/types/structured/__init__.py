@@ -13,7 +13,7 @@ Flytekit StructuredDataset
 """
 
 
-from flytekit.deck.renderer import ArrowRenderer, TopFrameRenderer
+from flytekit.deck.renderer import ArrowDatasetRenderer, ArrowRenderer, TopFrameRenderer
 from flytekit.loggers import logger
 
 from .structured_dataset import (
@@ -44,12 +44,26 @@ def register_pandas_handlers():
 
 def register_arrow_handlers():
     import pyarrow as pa
+    import pyarrow.dataset as ds
 
-    from .basic_dfs import ArrowToParquetEncodingHandler, ParquetToArrowDecodingHandler
+    from .basic_dfs import (
+        ArrowDatasetToParquetEncodingHandler,
+        ArrowToParquetEncodingHandler,
+        ParquetToArrowDatasetDecodingHandler,
+        ParquetToArrowDecodingHandler,
+    )
 
     StructuredDatasetTransformerEngine.register(ArrowToParquetEncodingHandler(), default_format_for_type=True)
     StructuredDatasetTransformerEngine.register(ParquetToArrowDecodingHandler(), default_format_for_type=True)
     StructuredDatasetTransformerEngine.register_renderer(pa.Table, ArrowRenderer())
+    StructuredDatasetTransformerEngine.register(ArrowDatasetToParquetEncodingHandler(), default_format_for_type=True)
+    StructuredDatasetTransformerEngine.register(ParquetToArrowDatasetDecodingHandler(), default_format_for_type=True)
+    # Encoders and renderers are looked up by the exact type of the value, which is one of the concrete dataset classes
+    for dataset_type in (ds.FileSystemDataset, ds.InMemoryDataset, ds.UnionDataset):
+        StructuredDatasetTransformerEngine.register(
+            ArrowDatasetToParquetEncodingHandler(dataset_type), default_format_for_type=True
+        )
+        StructuredDatasetTransformerEngine.register_renderer(dataset_type, ArrowDatasetRenderer())
 
 
 def register_bigquery_handlers():
@@ -1,10 +1,13 @@
+import math
 import os
 import typing
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import TypeVar
 
 import pandas as pd
 import pyarrow as pa
+import pyarrow.dataset as ds
 import pyarrow.parquet as pq
 from botocore.exceptions import NoCredentialsError
 from fsspec.core import split_protocol, strip_protocol
@@ -12,6 +15,7 @@ from fsspec.utils import get_protocol
 
 from flytekit import FlyteContext, logger
 from flytekit.configuration import DataConfig
+from flytekit.configuration.internal import LocalSDK
 from flytekit.core.data_persistence import s3_setup_args
 from flytekit.models import literals
 from flytekit.models.literals import StructuredDatasetMetadata
@@ -26,6 +30,11 @@ from flytekit.types.structured.structured_dataset import (
 
 T = TypeVar("T")
 
+DEFAULT_PARQUET_PART_SIZE_BYTES = 256 * 1024 * 1024
+DEFAULT_PARQUET_WRITE_CONCURRENCY = 8
+
+PARQUET_METADATA_FILE = "_metadata"
+
 
 def get_storage_options(cfg: DataConfig, uri: str, anon: bool = False) -> typing.Optional[typing.Dict]:
     protocol = get_protocol(uri)
@@ -36,6 +45,229 @@ def get_storage_options(cfg: DataConfig, uri: str, anon: bool = False) -> typing
     return None
 
 
+def parquet_part_max_rows() -> int:
+    """
+    Returns the upper bound on the rows of each Parquet part, 0 if it is unbounded.
+    """
+    return LocalSDK.PARQUET_PART_MAX_ROWS.read() or 0
+
+
+def _rows_per_part(table: pa.Table, part_size_bytes: int, max_rows_per_part: int) -> int:
+    num_rows = table.num_rows
+    rows = num_rows
+    if num_rows and table.nbytes > part_size_bytes:
+        rows = math.ceil(num_rows / math.ceil(table.nbytes / part_size_bytes))
+    if max_rows_per_part > 0:
+        rows = min(rows, max_rows_per_part)
+    return max(rows, 1)
+
+
+def write_parquet_parts(
+    ctx: FlyteContext,
+    table: pa.Table,
+    uri: str,
+    part_size_bytes: typing.Optional[int] = None,
+    max_rows_per_part: typing.Optional[int] = None,
+    max_workers: typing.Optional[int] = None,
+    **kwargs,
+) -> int:
+    """
+    Writes the table under the ``uri`` prefix as row-bounded Parquet parts named ``00000``, ``00001``..., written
+    concurrently and directly through the filesystem of ``uri``, so that nothing is staged locally for remote
+    destinations. A ``_metadata`` summary file holding the schema and the row group footers of every part is written
+    alongside, so readers can plan their reads without opening each part.
+
+    :param ctx: FlyteContext
+    :param table: The table to write
+    :param uri: The directory (local or remote) to write the parts to
+    :param part_size_bytes: Target in-memory size of each part, defaults to ``FLYTE_SDK_PARQUET_PART_SIZE_BYTES``
+    :param max_rows_per_part: Upper bound on the rows of each part, defaults to ``FLYTE_SDK_PARQUET_PART_MAX_ROWS``
+    :param max_workers: The number of parts written at the same time, defaults to ``FLYTE_SDK_PARQUET_WRITE_CONCURRENCY``
+    :param kwargs: Passed through to :py:func:`pyarrow.parquet.write_table`
+    :return: The number of parts written
+    """
+    part_size_bytes = part_size_bytes or LocalSDK.PARQUET_PART_SIZE_BYTES.read() or DEFAULT_PARQUET_PART_SIZE_BYTES
+    max_rows_per_part = parquet_part_max_rows() if max_rows_per_part is None else max_rows_per_part
+    if not ctx.file_access.is_remote(uri):
+        Path(uri).mkdir(parents=True, exist_ok=True)
+    filesystem = ctx.file_access.get_filesystem_for_path(uri)
+
+    rows = _rows_per_part(table, part_size_bytes, max_rows_per_part)
+    parts = [table.slice(offset, rows) for offset in range(0, max(table.num_rows, 1), rows)]
+    footers: typing.List[typing.Optional[pq.FileMetaData]] = [None] * len(parts)
+
+    def _write_part(i: int):
+        name = f"{i:05}"
+        collector: typing.List[pq.FileMetaData] = []
+        pq.write_table(
+            parts[i],
+            strip_protocol(os.path.join(uri, name)),
+            filesystem=filesystem,
+            metadata_collector=collector,
+            **kwargs,
+        )
+        collector[0].set_file_path(name)
+        footers[i] = collector[0]
+
+    if len(parts) == 1:
+        _write_part(0)
+    else:
+        max_workers = max_workers or LocalSDK.PARQUET_WRITE_CONCURRENCY.read() or DEFAULT_PARQUET_WRITE_CONCURRENCY
+        workers = min(max_workers, len(parts))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="flyte-parquet-writer") as executor:
+            # Surface the first failure, if any
+            list(executor.map(_write_part, range(len(parts))))
+
+    _write_metadata_summary(filesystem, uri, typing.cast(typing.List[pq.FileMetaData], footers))
+    return len(parts)
+
+
+def write_parquet_dataset(
+    ctx: FlyteContext,
+    dataset: ds.Dataset,
+    uri: str,
+    max_rows_per_part: typing.Optional[int] = None,
+) -> int:
+    """
+    Streams a :py:class:`pyarrow.dataset.Dataset` batch by batch into Parquet parts under the ``uri`` prefix, so that
+    the dataset is never materialized in memory. Like :py:func:`write_parquet_parts`, a ``_metadata`` summary file is
+    written alongside the parts.
+
+    :param ctx: FlyteContext
+    :param dataset: The dataset to write
+    :param uri: The directory (local or remote) to write the parts to
+    :param max_rows_per_part: Upper bound on the rows of each part, defaults to ``FLYTE_SDK_PARQUET_PART_MAX_ROWS``
+    :return: The number of parts written
+    """
+    max_rows_per_part = parquet_part_max_rows() if max_rows_per_part is None else max_rows_per_part
+    if not ctx.file_access.is_remote(uri):
+        Path(uri).mkdir(parents=True, exist_ok=True)
+    filesystem = ctx.file_access.get_filesystem_for_path(uri)
+
+    footers: typing.Dict[int, pq.FileMetaData] = {}
+
+    def _collect_footer(written_file):
+        name = os.path.basename(written_file.path)
+        footer = written_file.metadata
+        footer.set_file_path(name)
+        footers[int(name[len("part-") : -len(".parquet")])] = footer
+
+    kwargs: typing.Dict[str, typing.Any] = {}
+    if max_rows_per_part > 0:
+        kwargs["max_rows_per_file"] = max_rows_per_part
+        kwargs["max_rows_per_group"] = min(max_rows_per_part, 1024 * 1024)
+    ds.write_dataset(
+        dataset,
+        strip_protocol(uri),
+        format="parquet",
+        filesystem=filesystem,
+        basename_template="part-{i}.parquet",
+        existing_data_behavior="overwrite_or_ignore",
+        file_visitor=_collect_footer,
+        **kwargs,
+    )
+    _write_metadata_summary(filesystem, uri, [footers[i] for i in sorted(footers)])
+    return len(footers)
+
+
+def write_parquet_chunks(
+    ctx: FlyteContext, chunks: typing.Iterable[pa.Table], uri: str, schema: typing.Optional[pa.Schema] = None
+) -> int:
+    """
+    Writes each table yielded by ``chunks`` as its own Parquet part under the ``uri`` prefix as soon as it arrives, so
+    that producing the next chunk (e.g. fetching it from a database) overlaps with writing the previous one and at most
+    two chunks are held in memory. A ``_metadata`` summary file is written once the iterator is exhausted.
+
+    Without a ``schema``, the schemas of the chunks are unified as they arrive, so that a column that is all null in the
+    first chunks gets the type it has in a later one. The parts written before that are rewritten with the final schema.
+    If there are no chunks, a single empty part is written so that the dataset can be read back.
+
+    :param ctx: FlyteContext
+    :param chunks: The tables to write, one part per table
+    :param uri: The directory (local or remote) to write the parts to
+    :param schema: The schema to cast every chunk to
+    :return: The number of parts written
+    """
+    if not ctx.file_access.is_remote(uri):
+        Path(uri).mkdir(parents=True, exist_ok=True)
+    filesystem = ctx.file_access.get_filesystem_for_path(uri)
+    footers: typing.List[pq.FileMetaData] = []
+    # The schema each part was written with
+    part_schemas: typing.List[pa.Schema] = []
+    unify = schema is None
+
+    def _path(i: int) -> str:
+        return strip_protocol(os.path.join(uri, f"{i:05}"))
+
+    def _write_part(i: int, chunk: pa.Table) -> pq.FileMetaData:
+        collector: typing.List[pq.FileMetaData] = []
+        pq.write_table(chunk, _path(i), filesystem=filesystem, metadata_collector=collector)
+        collector[0].set_file_path(f"{i:05}")
+        return collector[0]
+
+    with ThreadPoolExecutor(max_workers=1, thread_name_prefix="flyte-parquet-writer") as executor:
+        pending = None
+        for i, chunk in enumerate(chunks):
+            if schema is None:
+                schema = chunk.schema
+            elif not chunk.schema.equals(schema):
+                try:
+                    if unify:
+                        schema = pa.unify_schemas([schema, chunk.schema])
+                    chunk = chunk.cast(schema)
+                except (pa.ArrowInvalid, pa.ArrowNotImplementedError, pa.ArrowTypeError) as e:
+                    raise ValueError(
+                        f"Chunk {i} has schema {chunk.schema} which can't be cast to the schema {schema} of the"
+                        f" previous chunks. Consider a larger chunk size or explicit casts in the query."
+                    ) from e
+            part_schemas.append(schema)
+            if pending is not None:
+                footers.append(pending.result())
+            pending = executor.submit(_write_part, i, chunk)
+        if pending is not None:
+            footers.append(pending.result())
+
+    if not footers:
+        footers.append(_write_part(0, (schema or pa.schema([])).empty_table()))
+    for i, part_schema in enumerate(part_schemas):
+        if not part_schema.equals(schema):
+            # Columns of this part got their type from a later chunk
+            table = pq.read_table(_path(i), filesystem=filesystem).cast(schema)
+            footers[i] = _write_part(i, table)
+
+    _write_metadata_summary(filesystem, uri, footers)
+    return len(footers)
+
+
+def _write_metadata_summary(filesystem, uri: str, footers: typing.List[pq.FileMetaData]):
+    # pq.write_metadata re-reads the file it writes without the filesystem, so merge the footers here instead
+    if not footers:
+        return
+    summary = footers[0]
+    for footer in footers[1:]:
+        summary.append_row_groups(footer)
+    with filesystem.open(strip_protocol(os.path.join(uri, PARQUET_METADATA_FILE)), "wb") as f:
+        summary.write_metadata_file(f)
+
+
+def open_parquet_dataset(ctx: FlyteContext, uri: str) -> ds.Dataset:
+    """
+    Returns a lazy :py:class:`pyarrow.dataset.Dataset` over the Parquet file or directory of parts at ``uri``, read
+    directly through the filesystem of ``uri``. Only the footers are read when the dataset is opened, rows and columns are
+    fetched when the dataset is scanned. Summary files such as ``_metadata`` are skipped.
+    """
+    _, path = split_protocol(uri)
+    try:
+        fs = ctx.file_access.get_filesystem_for_path(uri)
+        return ds.dataset(path, filesystem=fs, format="parquet")
+    except NoCredentialsError as e:
+        logger.debug("S3 source detected, attempting anonymous S3 access")
+        fs = ctx.file_access.get_filesystem_for_path(uri, anonymous=True)
+        if fs is not None:
+            return ds.dataset(path, filesystem=fs, format="parquet")
+        raise e
+
+
 class PandasToCSVEncodingHandler(StructuredDatasetEncoder):
     def __init__(self):
         super().__init__(pd.DataFrame, None, CSV)
@@ -95,15 +327,13 @@ class PandasToParquetEncodingHandler(StructuredDatasetEncoder):
         structured_dataset_type: StructuredDatasetType,
     ) -> literals.StructuredDataset:
         uri = typing.cast(str, structured_dataset.uri) or ctx.file_access.get_random_remote_directory()
-        if not ctx.file_access.is_remote(uri):
-            Path(uri).mkdir(parents=True, exist_ok=True)
-        path = os.path.join(uri, f"{0:05}")
         df = typing.cast(pd.DataFrame, structured_dataset.dataframe)
-        df.to_parquet(
-            path,
+        write_parquet_parts(
+            ctx,
+            pa.Table.from_pandas(df),
+            uri,
             coerce_timestamps="us",
             allow_truncated_timestamps=False,
-            storage_options=get_storage_options(ctx.file_access.data_config, path),
         )
         structured_dataset_type.format = PARQUET
         return literals.StructuredDataset(uri=uri, metadata=StructuredDatasetMetadata(structured_dataset_type))
@@ -143,11 +373,7 @@ class ArrowToParquetEncodingHandler(StructuredDatasetEncoder):
         structured_dataset_type: StructuredDatasetType,
     ) -> literals.StructuredDataset:
         uri = typing.cast(str, structured_dataset.uri) or ctx.file_access.get_random_remote_directory()
-        if not ctx.file_access.is_remote(uri):
-            Path(uri).mkdir(parents=True, exist_ok=True)
-        path = os.path.join(uri, f"{0:05}")
-        filesystem = ctx.file_access.get_filesystem_for_path(path)
-        pq.write_table(structured_dataset.dataframe, strip_protocol(path), filesystem=filesystem)
+        write_parquet_parts(ctx, structured_dataset.dataframe, uri)
         return literals.StructuredDataset(uri=uri, metadata=StructuredDatasetMetadata(structured_dataset_type))
 
 
@@ -178,3 +404,39 @@ class ParquetToArrowDecodingHandler(StructuredDatasetDecoder):
             if fs is not None:
                 return pq.read_table(path, filesystem=fs, columns=columns)
             raise e
+
+
+class ArrowDatasetToParquetEncodingHandler(StructuredDatasetEncoder):
+    def __init__(self, python_type: typing.Type[ds.Dataset] = ds.Dataset):
+        super().__init__(python_type, None, PARQUET)
+
+    def encode(
+        self,
+        ctx: FlyteContext,
+        structured_dataset: StructuredDataset,
+        structured_dataset_type: StructuredDatasetType,
+    ) -> literals.StructuredDataset:
+        uri = typing.cast(str, structured_dataset.uri) or ctx.file_access.get_random_remote_directory()
+        write_parquet_dataset(ctx, structured_dataset.dataframe, uri)
+        return literals.StructuredDataset(uri=uri, metadata=StructuredDatasetMetadata(structured_dataset_type))
+
+
+class ParquetToArrowDatasetDecodingHandler(StructuredDatasetDecoder):
+    """
+    Returns a lazy dataset over the Parquet parts, nothing is read until the dataset is scanned.
+    """
+
+    def __init__(self):
+        super().__init__(ds.Dataset, None, PARQUET)
+
+    def decode(
+        self,
+        ctx: FlyteContext,
+        flyte_value: literals.StructuredDataset,
+        current_task_metadata: StructuredDatasetMetadata,
+    ) -> ds.Dataset:
+        dataset = open_parquet_dataset(ctx, flyte_value.uri)
+        if current_task_metadata.structured_dataset_type and current_task_metadata.structured_dataset_type.columns:
+            columns = [c.name for c in current_task_metadata.structured_dataset_type.columns]
+            return dataset.replace_schema(pa.schema([dataset.schema.field(c) for c in columns]))
+        return dataset
@@ -1,12 +1,13 @@
-import os
 import typing
 
 import datasets
+import pyarrow.parquet as pq
 
 from flytekit import FlyteContext
 from flytekit.models import literals
 from flytekit.models.literals import StructuredDatasetMetadata
 from flytekit.models.types import StructuredDatasetType
+from flytekit.types.structured.basic_dfs import open_parquet_dataset, write_parquet_parts
 from flytekit.types.structured.structured_dataset import (
     PARQUET,
     StructuredDataset,
@@ -42,13 +43,9 @@ class HuggingFaceDatasetToParquetEncodingHandler(StructuredDatasetEncoder):
             columns = [c.name for c in structured_dataset_type.columns]
             df = df.remove_columns([c for c in df.features.keys() if c not in columns])
 
-        local_dir = ctx.file_access.get_random_local_directory()
-        local_path = f"{local_dir}/00000"
-
-        df.to_parquet(local_path)
-
         remote_dir = typing.cast(str, structured_dataset.uri) or ctx.file_access.get_random_remote_directory()
-        ctx.file_access.upload_directory(local_dir, remote_dir)
+        # Formatting as arrow applies any pending indices mapping (select, shuffle, filter...) to the table
+        write_parquet_parts(ctx, df.with_format("arrow")[:], remote_dir)
         return literals.StructuredDataset(uri=remote_dir, metadata=StructuredDatasetMetadata(structured_dataset_type))
 
 
@@ -62,13 +59,17 @@ class ParquetToHuggingFaceDatasetDecodingHandler(StructuredDatasetDecoder):
         flyte_value: literals.StructuredDataset,
         current_task_metadata: StructuredDatasetMetadata,
     ) -> datasets.Dataset:
-        local_dir = ctx.file_access.get_random_local_directory()
-        ctx.file_access.get_data(flyte_value.uri, local_dir, is_multipart=True)
-        files = [item.path for item in os.scandir(local_dir)]
+        uri = flyte_value.uri
+        columns = None
         if current_task_metadata.structured_dataset_type and current_task_metadata.structured_dataset_type.columns:
             columns = [c.name for c in current_task_metadata.structured_dataset_type.columns]
-            return datasets.Dataset.from_parquet(files, columns=columns)
-        return datasets.Dataset.from_parquet(files)
+        if ctx.file_access.is_remote(uri):
+            # Only the requested column chunks are fetched, there is no local copy of the dataset
+            table = open_parquet_dataset(ctx, uri).to_table(columns=columns)
+        else:
+            # Local parts are memory mapped instead of being read into buffers
+            table = pq.read_table(uri, columns=columns, memory_map=True)
+        return datasets.Dataset(table)
 
 
 StructuredDatasetTransformerEngine.register(HuggingFaceDatasetToParquetEncodingHandler())
@@ -9,6 +9,13 @@ This package contains things that are useful when extending Flytekit.
 
    PolarsDataFrameToParquetEncodingHandler
    ParquetToPolarsDataFrameDecodingHandler
+   PolarsLazyFrameToParquetEncodingHandler
+   ParquetToPolarsLazyFrameDecodingHandler
 """
 
-from .sd_transformers import ParquetToPolarsDataFrameDecodingHandler, PolarsDataFrameToParquetEncodingHandler
+from .sd_transformers import (
+    ParquetToPolarsDataFrameDecodingHandler,
+    ParquetToPolarsLazyFrameDecodingHandler,
+    PolarsDataFrameToParquetEncodingHandler,
+    PolarsLazyFrameToParquetEncodingHandler,
+)
@@ -1,3 +1,4 @@
+import os
 import typing
 
 import pandas as pd
@@ -7,7 +8,7 @@ from flytekit import FlyteContext
 from flytekit.models import literals
 from flytekit.models.literals import StructuredDatasetMetadata
 from flytekit.models.types import StructuredDatasetType
-from flytekit.types.structured.basic_dfs import get_storage_options
+from flytekit.types.structured.basic_dfs import get_storage_options, open_parquet_dataset, write_parquet_parts
 from flytekit.types.structured.structured_dataset import (
     PARQUET,
     StructuredDataset,
@@ -28,6 +29,19 @@ class PolarsDataFrameRenderer:
         return pd.DataFrame(describe_df.transpose(), columns=describe_df.columns).to_html(index=False)
 
 
+class PolarsLazyFrameRenderer:
+    """
+    The Polars LazyFrame schema is rendered as an HTML table, the query is not collected.
+    """
+
+    def to_html(self, lf: pl.LazyFrame) -> str:
+        assert isinstance(lf, pl.LazyFrame)
+        schema = lf.schema
+        return pd.DataFrame({"column": list(schema.keys()), "type": [str(t) for t in schema.values()]}).to_html(
+            index=False
+        )
+
+
 class PolarsDataFrameToParquetEncodingHandler(StructuredDatasetEncoder):
     def __init__(self):
         super().__init__(pl.DataFrame, None, PARQUET)
@@ -39,17 +53,40 @@ class PolarsDataFrameToParquetEncodingHandler(StructuredDatasetEncoder):
         structured_dataset_type: StructuredDatasetType,
     ) -> literals.StructuredDataset:
         df = typing.cast(pl.DataFrame, structured_dataset.dataframe)
+        remote_dir = typing.cast(str, structured_dataset.uri) or ctx.file_access.get_random_remote_directory()
+        write_parquet_parts(ctx, df.to_arrow(), remote_dir)
+        return literals.StructuredDataset(uri=remote_dir, metadata=StructuredDatasetMetadata(structured_dataset_type))
 
-        local_dir = ctx.file_access.get_random_local_directory()
-        local_path = f"{local_dir}/00000"
 
-        # Polars 0.13.12 deprecated to_parquet in favor of write_parquet
-        if hasattr(df, "write_parquet"):
-            df.write_parquet(local_path)
-        else:
-            df.to_parquet(local_path)
+class PolarsLazyFrameToParquetEncodingHandler(StructuredDatasetEncoder):
+    """
+    Sinks the ``pl.LazyFrame`` query to Parquet with the streaming engine, so that the result is never fully held in
+    memory. Queries the streaming engine can't run are collected and written like a ``pl.DataFrame``.
+    """
+
+    def __init__(self):
+        super().__init__(pl.LazyFrame, None, PARQUET)
+
+    def encode(
+        self,
+        ctx: FlyteContext,
+        structured_dataset: StructuredDataset,
+        structured_dataset_type: StructuredDatasetType,
+    ) -> literals.StructuredDataset:
+        lf = typing.cast(pl.LazyFrame, structured_dataset.dataframe)
         remote_dir = typing.cast(str, structured_dataset.uri) or ctx.file_access.get_random_remote_directory()
-        ctx.file_access.upload_directory(local_dir, remote_dir)
+        # polars can only sink to local paths, remote outputs are sunk into the sandbox and then uploaded
+        local_dir = (
+            remote_dir if not ctx.file_access.is_remote(remote_dir) else ctx.file_access.get_random_local_directory()
+        )
+        try:
+            os.makedirs(local_dir, exist_ok=True)
+            lf.sink_parquet(os.path.join(local_dir, f"{0:05}"))
+        except pl.InvalidOperationError:
+            write_parquet_parts(ctx, lf.collect().to_arrow(), remote_dir)
+        else:
+            if local_dir != remote_dir:
+                ctx.file_access.upload_directory(local_dir, remote_dir)
         return literals.StructuredDataset(uri=remote_dir, metadata=StructuredDatasetMetadata(structured_dataset_type))
 
 
@@ -71,6 +108,33 @@ class ParquetToPolarsDataFrameDecodingHandler(StructuredDatasetDecoder):
         return pl.read_parquet(uri, use_pyarrow=True, storage_options=kwargs)
 
 
+class ParquetToPolarsLazyFrameDecodingHandler(StructuredDatasetDecoder):
+    """
+    Returns a ``pl.LazyFrame`` scanning the Parquet parts in place. Nothing is downloaded until the query is collected,
+    and only the columns and row groups the query needs are read then.
+    """
+
+    def __init__(self):
+        super().__init__(pl.LazyFrame, None, PARQUET)
+
+    def decode(
+        self,
+        ctx: FlyteContext,
+        flyte_value: literals.StructuredDataset,
+        current_task_metadata: StructuredDatasetMetadata,
+    ) -> pl.LazyFrame:
+        # Scanning the pyarrow dataset rather than using pl.scan_parquet keeps the flytekit storage configuration and
+        # skips summary files, while projections and predicates are still pushed down to the reads.
+        lf = pl.scan_pyarrow_dataset(open_parquet_dataset(ctx, flyte_value.uri))
+        if current_task_metadata.structured_dataset_type and current_task_metadata.structured_dataset_type.columns:
+            columns = [c.name for c in current_task_metadata.structured_dataset_type.columns]
+            return lf.select(columns)
+        return lf
+
+
 StructuredDatasetTransformerEngine.register(PolarsDataFrameToParquetEncodingHandler())
 StructuredDatasetTransformerEngine.register(ParquetToPolarsDataFrameDecodingHandler())
+StructuredDatasetTransformerEngine.register(PolarsLazyFrameToParquetEncodingHandler())
+StructuredDatasetTransformerEngine.register(ParquetToPolarsLazyFrameDecodingHandler())
 StructuredDatasetTransformerEngine.register_renderer(pl.DataFrame, PolarsDataFrameRenderer())
+StructuredDatasetTransformerEngine.register_renderer(pl.LazyFrame, PolarsLazyFrameRenderer())
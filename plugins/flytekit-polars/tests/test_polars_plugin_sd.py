@@ -1,8 +1,9 @@
 import tempfile
+import typing
 
 import pandas as pd
 import polars as pl
-from flytekitplugins.polars.sd_transformers import PolarsDataFrameRenderer
+from flytekitplugins.polars.sd_transformers import PolarsDataFrameRenderer, PolarsLazyFrameRenderer
 from typing_extensions import Annotated
 
 from flytekit import kwtypes, task, workflow
@@ -87,7 +88,64 @@ def test_parquet_to_polars():
 
     @task
     def t1(sd: StructuredDataset) -> pl.DataFrame:
-        return sd.open(pd.DataFrame).all()
+        return sd.open(pl.DataFrame).all()
 
     sd = StructuredDataset(uri=tmp)
     t1(sd=sd).frame_equal(polars_df)
+
+
+def test_parquet_to_polars_lazyframe():
+    data = {"name": ["Alice", "Bob", "Carol"], "age": [5, 7, 9]}
+
+    @task
+    def create_sd() -> StructuredDataset:
+        df = pl.DataFrame(data=data)
+        return StructuredDataset(dataframe=df)
+
+    sd = create_sd()
+    lf = sd.open(pl.LazyFrame).all()
+    assert isinstance(lf, pl.LazyFrame)
+    assert lf.filter(pl.col("age") > 5).select("name").collect()["name"].to_list() == ["Bob", "Carol"]
+
+    @task
+    def consume(sd: subset_schema) -> int:
+        lf = sd.open(pl.LazyFrame).all()
+        assert lf.columns == ["col2"]
+        return lf.select(pl.count()).collect().item()
+
+    @task
+    def generate() -> full_schema:
+        return StructuredDataset(dataframe=pl.DataFrame({"col1": [1, 3, 2], "col2": list("abc")}))
+
+    @workflow
+    def wf() -> int:
+        return consume(sd=generate())
+
+    assert wf() == 3
+
+
+def test_polars_lazyframe_workflow():
+    @task
+    def generate() -> pl.LazyFrame:
+        return pl.LazyFrame({"col1": [1, 3, 2], "col2": list("abc")}).filter(pl.col("col1") > 1)
+
+    @task
+    def aggregate(lf: pl.LazyFrame) -> pl.LazyFrame:
+        # Grouping can't be sunk with the streaming engine in every polars version
+        return lf.group_by("col2").agg(pl.col("col1").sum()).sort("col2")
+
+    @task
+    def consume(lf: pl.LazyFrame) -> typing.List[int]:
+        return lf.collect()["col1"].to_list()
+
+    @workflow
+    def wf() -> typing.List[int]:
+        return consume(lf=aggregate(lf=generate()))
+
+    assert wf() == [3, 2]
+
+
+def test_polars_lazyframe_renderer():
+    lf = pl.LazyFrame({"col1": [1, 3, 2], "col2": list("abc")})
+    html = PolarsLazyFrameRenderer().to_html(lf)
+    assert "col1" in html and "Int64" in html
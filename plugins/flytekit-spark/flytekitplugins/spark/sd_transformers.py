@@ -8,6 +8,7 @@ from flytekit import FlyteContext
 from flytekit.models import literals
 from flytekit.models.literals import StructuredDatasetMetadata
 from flytekit.models.types import StructuredDatasetType
+from flytekit.types.structured.basic_dfs import parquet_part_max_rows
 from flytekit.types.structured.structured_dataset import (
     PARQUET,
     StructuredDataset,
@@ -42,7 +43,12 @@ class SparkToParquetEncodingHandler(StructuredDatasetEncoder):
         ss = pyspark.sql.SparkSession.builder.getOrCreate()
         # Avoid generating SUCCESS files
         ss.conf.set("mapreduce.fileoutputcommitter.marksuccessfuljobs", "false")
-        df.write.mode("overwrite").parquet(path=path)
+        writer = df.write.mode("overwrite")
+        # Spark already writes one part per partition concurrently, only bound the size of each part if requested
+        max_rows = parquet_part_max_rows()
+        if max_rows > 0:
+            writer = writer.option("maxRecordsPerFile", max_rows)
+        writer.parquet(path=path)
         return literals.StructuredDataset(uri=path, metadata=StructuredDatasetMetadata(structured_dataset_type))
 
 
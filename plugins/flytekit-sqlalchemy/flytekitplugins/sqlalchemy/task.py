@@ -1,11 +1,15 @@
+import json
+import threading
 import typing
 from dataclasses import dataclass
 
 import pandas as pd
+import pyarrow as pa
 from pandas.io.sql import pandasSQL_builder
 from sqlalchemy import create_engine, text  # type: ignore
+from sqlalchemy.engine import Engine  # type: ignore
 
-from flytekit import current_context, kwtypes
+from flytekit import FlyteContextManager, current_context, kwtypes
 from flytekit.configuration import SerializationSettings
 from flytekit.configuration.default_images import DefaultImages, PythonVersion
 from flytekit.core.base_sql_task import SQLTask
@@ -15,6 +19,8 @@ from flytekit.loggers import logger
 from flytekit.models import task as task_models
 from flytekit.models.security import Secret
 from flytekit.types.schema import FlyteSchema
+from flytekit.types.structured.basic_dfs import write_parquet_chunks
+from flytekit.types.structured.structured_dataset import StructuredDataset, extract_cols_and_format
 
 
 class SQLAlchemyDefaultImages(DefaultImages):
@@ -43,11 +49,15 @@ class SQLAlchemyConfig(object):
         connect_args: sqlalchemy kwarg overrides -- ex: host
         secret_connect_args: flyte secrets loaded into sqlalchemy connect args
             -- ex: {"password": flytekit.models.security.Secret(name=SECRET_NAME, group=SECRET_GROUP)}
+        chunksize: if set, results are streamed from a server side cursor ``chunksize`` rows at a time, and each chunk
+            is written as a part of a multi-part Parquet StructuredDataset as it arrives, instead of loading the whole
+            result in memory. Requires a StructuredDataset ``output_schema_type``.
     """
 
     uri: str
     connect_args: typing.Optional[typing.Dict[str, typing.Any]] = None
     secret_connect_args: typing.Optional[typing.Dict[str, Secret]] = None
+    chunksize: typing.Optional[int] = None
 
     @staticmethod
     def _secret_to_dict(secret: Secret) -> typing.Dict[str, typing.Optional[str]]:
@@ -92,6 +102,10 @@ class SQLAlchemyTask(PythonCustomizedContainerTask[SQLAlchemyConfig], SQLTask[SQ
             outputs = kwtypes(results=output_schema_type)
         else:
             outputs = None
+        if task_config.chunksize and not (
+            output_schema_type and issubclass(extract_cols_and_format(output_schema_type)[0], StructuredDataset)
+        ):
+            raise ValueError("Streaming results with a chunksize requires a StructuredDataset output_schema_type")
 
         super().__init__(
             name=name,
@@ -116,9 +130,28 @@ class SQLAlchemyTask(PythonCustomizedContainerTask[SQLAlchemyConfig], SQLTask[SQ
             "uri": self.task_config.uri,
             "connect_args": self.task_config.connect_args or {},
             "secret_connect_args": self.task_config.secret_connect_args_to_dicts(),
+            "chunksize": self.task_config.chunksize,
         }
 
 
+_engines: typing.Dict[typing.Tuple[str, str], Engine] = {}
+_engines_lock = threading.Lock()
+
+
+def _get_engine(uri: str, connect_args: typing.Dict[str, typing.Any]) -> Engine:
+    """
+    Engines, and hence their connection pools, are shared by every execution in the process that targets the same
+    database with the same connect args, e.g. the instances of a map task running in the same container.
+    """
+    key = (uri, json.dumps(connect_args, sort_keys=True, default=str))
+    with _engines_lock:
+        engine = _engines.get(key)
+        if engine is None:
+            engine = create_engine(uri, connect_args=connect_args, echo=False)
+            _engines[key] = engine
+        return engine
+
+
 class SQLAlchemyTaskExecutor(ShimTaskExecutor[SQLAlchemyTask]):
     def execute_from_model(self, tt: task_models.TaskTemplate, **kwargs) -> typing.Any:
         if tt.custom["secret_connect_args"] is not None:
@@ -126,13 +159,22 @@ class SQLAlchemyTaskExecutor(ShimTaskExecutor[SQLAlchemyTask]):
                 value = current_context().secrets.get(group=secret_dict["group"], key=secret_dict["key"])
                 tt.custom["connect_args"][key] = value
 
-        engine = create_engine(tt.custom["uri"], connect_args=tt.custom["connect_args"], echo=False)
+        engine = _get_engine(tt.custom["uri"], tt.custom["connect_args"])
         logger.info(f"Connecting to db {tt.custom['uri']}")
 
         interpolated_query = SQLAlchemyTask.interpolate_query(tt.custom["query_template"], **kwargs)
         logger.info(f"Interpolated query {interpolated_query}")
+        chunksize = tt.custom.get("chunksize")
         with engine.begin() as connection:
             df = None
+            if tt.interface.outputs and chunksize:
+                # Ask the driver for a server side cursor so that rows are fetched chunk by chunk
+                connection = connection.execution_options(stream_results=True)
+                chunks = pd.read_sql_query(text(interpolated_query), connection, chunksize=chunksize)
+                ctx = FlyteContextManager.current_context()
+                uri = ctx.file_access.get_random_remote_directory()
+                write_parquet_chunks(ctx, (pa.Table.from_pandas(c, preserve_index=False) for c in chunks), uri)
+                return StructuredDataset(uri=uri)
             if tt.interface.outputs:
                 df = pd.read_sql_query(text(interpolated_query), connection)
             else:
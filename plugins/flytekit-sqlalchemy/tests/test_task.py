@@ -8,12 +8,13 @@ from typing import Iterator
 import pandas
 import pytest
 from flytekitplugins.sqlalchemy import SQLAlchemyConfig, SQLAlchemyTask
-from flytekitplugins.sqlalchemy.task import SQLAlchemyTaskExecutor
+from flytekitplugins.sqlalchemy.task import SQLAlchemyTaskExecutor, _get_engine
 
 from flytekit import kwtypes, task, workflow
 from flytekit.core.context_manager import SecretsManager
 from flytekit.models.security import Secret
 from flytekit.types.schema import FlyteSchema
+from flytekit.types.structured.structured_dataset import StructuredDataset
 
 tk = SQLAlchemyTask(
     "test",
@@ -197,3 +198,35 @@ def test_task_serialization_deserialization_with_secret(sql_server):
     r = executor.execute_from_model(tt)
 
     assert r.iat[0, 0] == 1
+
+
+def test_task_chunked(sql_server):
+    sql_task = SQLAlchemyTask(
+        "test",
+        query_template="select * from tracks order by TrackId",
+        output_schema_type=StructuredDataset,
+        task_config=SQLAlchemyConfig(uri=sql_server, chunksize=2),
+    )
+
+    tt = sql_task.serialize_to_model(sql_task.SERIALIZE_SETTINGS)
+    assert tt.custom["chunksize"] == 2
+
+    sd = sql_task()
+    assert sorted(f for f in os.listdir(sd.literal.uri) if not f.startswith("_")) == ["00000", "00001", "00002"]
+    df = sd.open(pandas.DataFrame).all()
+    assert df["TrackId"].tolist() == [0, 1, 2, 3, 4]
+    assert df["Name"].tolist() == ["Sue", "L", "M", "Ji", "Po"]
+
+
+def test_task_chunked_requires_structured_dataset(sql_server):
+    with pytest.raises(ValueError):
+        SQLAlchemyTask(
+            "test",
+            query_template="select * from tracks",
+            task_config=SQLAlchemyConfig(uri=sql_server, chunksize=2),
+        )
+
+
+def test_engine_reuse(sql_server):
+    assert _get_engine(sql_server, {}) is _get_engine(sql_server, {})
+    assert _get_engine(sql_server, {}) is not _get_engine(sql_server, {"timeout": 10})
@@ -1,4 +1,3 @@
-import os
 import typing
 
 import pandas as pd
@@ -7,6 +6,7 @@ import vaex
 from flytekit import FlyteContext, StructuredDatasetType
 from flytekit.models import literals
 from flytekit.models.literals import StructuredDatasetMetadata
+from flytekit.types.structured.basic_dfs import open_parquet_dataset, write_parquet_parts
 from flytekit.types.structured.structured_dataset import (
     PARQUET,
     StructuredDataset,
@@ -27,11 +27,8 @@ class VaexDataFrameToParquetEncodingHandler(StructuredDatasetEncoder):
         structured_dataset_type: StructuredDatasetType,
     ) -> literals.StructuredDataset:
         df = typing.cast(vaex.dataframe.DataFrameLocal, structured_dataset.dataframe)
-        path = ctx.file_access.get_random_remote_directory()
-        local_dir = ctx.file_access.get_random_local_directory()
-        local_path = os.path.join(local_dir, f"{0:05}")
-        df.export_parquet(local_path)
-        ctx.file_access.upload_directory(local_dir, path)
+        path = typing.cast(str, structured_dataset.uri) or ctx.file_access.get_random_remote_directory()
+        write_parquet_parts(ctx, df.to_arrow_table(), path)
         return literals.StructuredDataset(
             uri=path,
             metadata=StructuredDatasetMetadata(structured_dataset_type=structured_dataset_type),
@@ -48,13 +45,12 @@ class ParquetToVaexDataFrameDecodingHandler(StructuredDatasetDecoder):
         flyte_value: literals.StructuredDataset,
         current_task_metadata: StructuredDatasetMetadata,
     ) -> vaex.dataframe.DataFrameLocal:
-        local_dir = ctx.file_access.get_random_local_directory()
-        ctx.file_access.get_data(flyte_value.uri, local_dir, is_multipart=True)
-        path = f"{local_dir}/00000"
+        # Vaex reads the arrow dataset lazily, so the parts are read in place rather than downloaded up front
+        df = vaex.from_arrow_dataset(open_parquet_dataset(ctx, flyte_value.uri))
         if current_task_metadata.structured_dataset_type and current_task_metadata.structured_dataset_type.columns:
             columns = [c.name for c in current_task_metadata.structured_dataset_type.columns]
-            return vaex.open(path)[columns]
-        return vaex.open(path)
+            return df[columns]
+        return df
 
 
 class VaexDataFrameRenderer:
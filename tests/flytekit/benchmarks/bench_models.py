@@ -0,0 +1,82 @@
+"""
+Micro-benchmarks of the model operations the compiler, translator and remote code run the most. Run with
+``python -m tests.flytekit.benchmarks.bench_models``.
+"""
+
+import argparse
+import timeit
+import typing
+
+from flytekit.models import literals, types
+from flytekit.models.core import identifier
+
+
+def _identifier(i: int = 0) -> identifier.Identifier:
+    return identifier.Identifier(identifier.ResourceType.TASK, "project", "domain", f"module.task_{i}", "version")
+
+
+def _literal_type() -> types.LiteralType:
+    return types.LiteralType(
+        map_value_type=types.LiteralType(
+            collection_type=types.LiteralType(
+                union_type=types.UnionType(
+                    [
+                        types.LiteralType(simple=types.SimpleType.INTEGER),
+                        types.LiteralType(simple=types.SimpleType.STRING),
+                    ]
+                )
+            )
+        )
+    )
+
+
+def _literal(n: int = 100) -> literals.Literal:
+    return literals.Literal(
+        map=literals.LiteralMap(
+            {
+                f"k{i}": literals.Literal(
+                    collection=literals.LiteralCollection(
+                        [
+                            literals.Literal(scalar=literals.Scalar(primitive=literals.Primitive(integer=j)))
+                            for j in range(10)
+                        ]
+                    )
+                )
+                for i in range(n)
+            }
+        )
+    )
+
+
+def _benchmarks() -> typing.Dict[str, typing.Callable[[], typing.Any]]:
+    ids = [_identifier(i) for i in range(100)]
+    id_a, id_b = _identifier(), _identifier()
+    lt_a, lt_b = _literal_type(), _literal_type()
+    lv_a, lv_b = _literal(), _literal()
+    return {
+        "identifier hash (100 as dict keys)": lambda: {i: None for i in ids},
+        "identifier eq": lambda: id_a == id_b,
+        "identifier to_flyte_idl": id_a.to_flyte_idl,
+        "literal type hash": lambda: hash(lt_a),
+        "literal type eq": lambda: lt_a == lt_b,
+        "literal type to_flyte_idl": lt_a.to_flyte_idl,
+        "literal (1000 values) hash": lambda: hash(lv_a),
+        "literal (1000 values) eq": lambda: lv_a == lv_b,
+        "literal (1000 values) to_flyte_idl": lv_a.to_flyte_idl,
+        "literal (1000 values) serialize_to_string": lv_a.serialize_to_string,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("-n", "--number", type=int, default=1000, help="Calls per repetition")
+    parser.add_argument("-r", "--repeat", type=int, default=5, help="Repetitions, the fastest one is reported")
+    args = parser.parse_args()
+
+    for name, f in _benchmarks().items():
+        best = min(timeit.repeat(f, number=args.number, repeat=args.repeat))
+        print(f"{name:<45} {best / args.number * 1e6:>10.2f} us")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,172 @@
+import multiprocessing
+import os
+import sys
+import tarfile
+import time
+
+import mock
+import pytest
+from flyteidl.core import literals_pb2
+
+from flytekit.bin.worker import _MAX_RESPAWN_DELAY, TaskWorker, _respawn_delay, serve, submit
+from flytekit.core import utils
+from flytekit.models import literals as _literal_models
+from flytekit.tools.fast_registration import download_distribution as _download_distribution
+
+task_text = """
+import os
+
+from flytekit import task
+
+
+@task
+def t1(a: int) -> int:
+    # The process the task ran in
+    return os.getpid() * 10 + a
+"""
+
+
+def _literal_map(**kwargs):
+    return _literal_models.LiteralMap(
+        literals={
+            k: _literal_models.Literal(scalar=_literal_models.Scalar(primitive=_literal_models.Primitive(integer=v)))
+            for k, v in kwargs.items()
+        }
+    )
+
+
+def _output(output_prefix):
+    outputs = utils.load_proto_from_file(literals_pb2.LiteralMap, os.path.join(output_prefix, "outputs.pb"))
+    return outputs.literals["o0"].scalar.primitive.integer
+
+
+@pytest.fixture
+def invocation(tmp_path):
+    """
+    Returns a function that writes the inputs of an invocation of the task and returns its arguments.
+    """
+    inputs = tmp_path / "inputs.pb"
+    utils.write_proto_to_file(_literal_map(a=1).to_flyte_idl(), str(inputs))
+
+    def args(name, module="worker_tasks"):
+        return [
+            "pyflyte-execute",
+            "--inputs",
+            str(inputs),
+            "--output-prefix",
+            str(tmp_path / name),
+            "--raw-output-data-prefix",
+            str(tmp_path / "raw"),
+            "--resolver",
+            "flytekit.core.python_auto_container.default_task_resolver",
+            "--",
+            "task-module",
+            module,
+            "task-name",
+            "t1",
+        ]
+
+    return args
+
+
+@pytest.fixture
+def code(tmp_path):
+    src = tmp_path / "src"
+    src.mkdir()
+    (src / "worker_tasks.py").write_text(task_text)
+    sys.path.insert(0, str(src))
+    yield src
+    sys.path.remove(str(src))
+    sys.modules.pop("worker_tasks", None)
+
+
+def test_execute(code, invocation, tmp_path):
+    worker = TaskWorker(max_tasks=2)
+    cwd, env = os.getcwd(), dict(os.environ)
+    assert worker.execute(invocation("out1"), env={"FLYTE_INTERNAL_EXECUTION_ID": "e1"}) == 0
+    module = sys.modules["worker_tasks"]
+    assert worker.recycle is False
+    assert worker.execute(invocation("out2")) == 0
+    assert worker.recycle is True
+    # The module is only imported once
+    assert sys.modules["worker_tasks"] is module
+    assert _output(tmp_path / "out1") == os.getpid() * 10 + 1
+    assert _output(tmp_path / "out2") == os.getpid() * 10 + 1
+    assert os.getcwd() == cwd
+    assert dict(os.environ) == env
+
+    assert worker.execute(invocation("out3", module="missing")) == 1
+    with pytest.raises(ValueError):
+        worker.execute(["python", "-c", "print(1)"])
+
+
+def test_fast_execute(invocation, tmp_path):
+    src = tmp_path / "src"
+    src.mkdir()
+    # Files an invocation leaves in its working directory are not seen by the next one
+    leaky_task_text = task_text.replace(
+        "    return os.getpid() * 10 + a",
+        "    leaked = os.path.exists('leftover.txt')\n"
+        "    open('leftover.txt', 'w').close()\n"
+        "    return os.getpid() * 10 + a + (5 if leaked else 0)",
+    )
+    (src / "worker_tasks.py").write_text(leaky_task_text)
+    distribution = tmp_path / "fast1.tar.gz"
+    with tarfile.open(distribution, "w:gz") as tar:
+        tar.add(src / "worker_tasks.py", arcname="worker_tasks.py")
+
+    worker = TaskWorker()
+    args = ["pyflyte-fast-execute", "--additional-distribution", str(distribution), "--"]
+    try:
+        with mock.patch("flytekit.bin.worker._download_distribution", wraps=_download_distribution) as download:
+            assert worker.execute(args + invocation("out1")) == 0
+            assert worker.execute(args + invocation("out2")) == 0
+            # The distribution is only downloaded once
+            download.assert_called_once()
+            assert worker.recycle is False
+
+            # Another distribution runs in a new process
+            other = tmp_path / "fast2.tar.gz"
+            os.rename(distribution, other)
+            with mock.patch("flytekit.bin.worker.subprocess.run") as run:
+                run.return_value.returncode = 0
+                other_args = ["pyflyte-fast-execute", "--additional-distribution", str(other), "--"]
+                assert worker.execute(other_args + invocation("out3")) == 0
+                assert run.call_args[0][0] == other_args + invocation("out3")
+            assert worker.recycle is True
+    finally:
+        sys.modules.pop("worker_tasks", None)
+    assert _output(tmp_path / "out1") == os.getpid() * 10 + 1
+    assert _output(tmp_path / "out2") == os.getpid() * 10 + 1
+    assert not os.path.exists(os.path.join(worker._code_dir, "leftover.txt"))
+
+
+def test_respawn_delay():
+    assert _respawn_delay(10, 0) == 0
+    assert _respawn_delay(0.01, 0) == 0.1
+    assert _respawn_delay(0.01, 0.1) == 0.2
+    assert _respawn_delay(0.01, _MAX_RESPAWN_DELAY) == _MAX_RESPAWN_DELAY
+    # The delay is reset once a worker runs long enough
+    assert _respawn_delay(10, _MAX_RESPAWN_DELAY) == 0
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="The worker forks processes and listens on a unix socket")
+def test_serve(code, invocation, tmp_path):
+    address = str(tmp_path / "worker.sock")
+    ctx = multiprocessing.get_context("fork")
+    server = ctx.Process(target=serve, args=(address,), kwargs={"max_tasks": 2})
+    server.start()
+    try:
+        for _ in range(100):
+            if os.path.exists(address):
+                break
+            time.sleep(0.1)
+        for i in range(3):
+            assert submit(address, invocation(f"out{i}")) == 0
+    finally:
+        server.terminate()
+        server.join()
+    # The worker is replaced after two tasks
+    pids = [_output(tmp_path / f"out{i}") // 10 for i in range(3)]
+    assert pids[0] == pids[1] != pids[2]
+    assert server.pid not in pids
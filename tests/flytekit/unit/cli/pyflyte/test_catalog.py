@@ -0,0 +1,90 @@
+import mock
+
+from flytekit.clis.sdk_in_container.catalog import LaunchPlanCatalog
+from flytekit.models import common, interface, launch_plan, literals, types
+from flytekit.models.core.identifier import Identifier, ResourceType
+from flytekit.remote import FlyteLaunchPlan
+
+
+def _launch_plan(version: str) -> FlyteLaunchPlan:
+    wf_id = Identifier(ResourceType.WORKFLOW, "p", "d", "wf", version)
+    spec = launch_plan.LaunchPlanSpec(
+        wf_id,
+        launch_plan.LaunchPlanMetadata(schedule=None, notifications=[]),
+        interface.ParameterMap({}),
+        literals.LiteralMap({}),
+        common.Labels({}),
+        common.Annotations({}),
+        common.AuthRole(),
+        common.RawOutputDataConfig(""),
+    )
+    lp = FlyteLaunchPlan.promote_from_model(Identifier(ResourceType.LAUNCH_PLAN, "p", "d", "lp", version), spec)
+    lp._interface = interface.TypedInterface(
+        {"a": interface.Variable(types.LiteralType(simple=types.SimpleType.INTEGER), "a")}, {}
+    )
+    return lp
+
+
+def _remote(latest_version: str) -> mock.MagicMock:
+    remote = mock.MagicMock()
+    remote.client.list_launch_plan_ids_paginated.return_value = ([mock.Mock(), mock.Mock()], None)
+    remote.client.list_launch_plan_ids_paginated.return_value[0][0].name = "lp"
+    remote.client.list_launch_plan_ids_paginated.return_value[0][1].name = "lp2"
+    remote.client.list_launch_plans_paginated.return_value = ([mock.Mock(id=mock.Mock(version=latest_version))], None)
+    remote.fetch_launch_plan.side_effect = lambda *args: _launch_plan(latest_version)
+    return remote
+
+
+def test_list_names(tmp_path):
+    catalog = LaunchPlanCatalog("localhost:30080", "p", "d", ttl=60, location=str(tmp_path))
+    assert catalog.cached_names(10) == []
+    remote = _remote("v1")
+    assert catalog.list_names(remote, 10) == ["lp", "lp2"]
+    assert catalog.list_names(remote, 1) == ["lp"]
+    assert catalog.cached_names(10) == ["lp", "lp2"]
+    assert remote.client.list_launch_plan_ids_paginated.call_count == 1
+
+    # More launch plans than were listed before
+    catalog.list_names(remote, 20)
+    assert remote.client.list_launch_plan_ids_paginated.call_count == 2
+
+    # Other deployments don't share the catalog
+    assert LaunchPlanCatalog("other:30080", "p", "d", ttl=60, location=str(tmp_path)).cached_names(10) == []
+
+
+def test_fetch_launch_plan(tmp_path):
+    catalog = LaunchPlanCatalog("localhost:30080", "p", "d", ttl=60, location=str(tmp_path))
+    remote = _remote("v1")
+    lp = catalog.fetch_launch_plan(remote, "lp")
+    assert remote.fetch_launch_plan.call_count == 1
+
+    # Recently fetched launch plans are used as is
+    cached = catalog.fetch_launch_plan(remote, "lp")
+    assert remote.fetch_launch_plan.call_count == 1
+    assert remote.client.list_launch_plans_paginated.call_count == 0
+    assert cached.id == lp.id
+    assert cached.workflow_id == lp.workflow_id
+    assert cached.interface == lp.interface
+
+    # Otherwise only the latest version is looked up, while it didn't change
+    catalog.fetch_launch_plan(remote, "lp", checked_since=float("inf"))
+    assert remote.client.list_launch_plans_paginated.call_count == 1
+    assert remote.fetch_launch_plan.call_count == 1
+
+    remote = _remote("v2")
+    assert catalog.fetch_launch_plan(remote, "lp", checked_since=float("inf")).id.version == "v2"
+    assert remote.fetch_launch_plan.call_count == 1
+    assert catalog.fetch_launch_plan(remote, "lp").id.version == "v2"
+    assert remote.fetch_launch_plan.call_count == 1
+
+
+def test_disabled(tmp_path):
+    catalog = LaunchPlanCatalog("localhost:30080", "p", "d", ttl=0, location=str(tmp_path))
+    remote = _remote("v1")
+    catalog.list_names(remote, 10)
+    catalog.list_names(remote, 10)
+    assert remote.client.list_launch_plan_ids_paginated.call_count == 2
+    catalog.fetch_launch_plan(remote, "lp")
+    catalog.fetch_launch_plan(remote, "lp")
+    assert remote.fetch_launch_plan.call_count == 2
+    assert list(tmp_path.iterdir()) == []
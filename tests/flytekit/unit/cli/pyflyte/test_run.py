@@ -205,13 +205,43 @@ def test_union_type_with_invalid_input():
     assert result.exit_code == 2
 
 
-def test_get_entities_in_file():
-    e = get_entities_in_file(WORKFLOW_FILE, False)
+@pytest.mark.parametrize("static", [False, True])
+def test_get_entities_in_file(static):
+    e = get_entities_in_file(WORKFLOW_FILE, False, static=static)
     assert e.workflows == ["my_wf"]
     assert e.tasks == ["get_subset_df", "print_all", "show_sd", "test_union1", "test_union2"]
     assert e.all() == ["my_wf", "get_subset_df", "print_all", "show_sd", "test_union1", "test_union2"]
 
 
+def test_get_entities_in_file_imported(tmp_path, monkeypatch: pytest.MonkeyPatch):
+    (tmp_path / "factory_entities.py").write_text(
+        "\n".join(
+            [
+                "from flytekit import task",
+                "",
+                "@task",
+                "def double(a: int) -> int:",
+                "    return a * 2",
+                "",
+                "make_task = task",
+                "created = make_task(double.task_function)",
+            ]
+        )
+    )
+    monkeypatch.chdir(tmp_path)
+    # Entities created by a factory can't be found in the source, so they are only listed when the file is imported
+    e = get_entities_in_file(tmp_path / "factory_entities.py", False)
+    assert e.workflows == []
+    assert e.tasks == ["created", "double"]
+    e = get_entities_in_file(tmp_path / "factory_entities.py", False, static=True)
+    assert e.tasks == ["double"]
+
+    runner = CliRunner()
+    result = runner.invoke(pyflyte.main, ["run", "factory_entities.py", "--help"], catch_exceptions=False)
+    assert result.exit_code == 0
+    assert "created" in result.output
+
+
 @pytest.mark.parametrize(
     "working_dir, wf_path",
     [
@@ -1,6 +1,7 @@
 from datetime import timedelta
 
 import mock as _mock
+from flyteidl.admin import execution_pb2 as _execution_pb2
 from flyteidl.admin import project_pb2 as _project_pb2
 from flyteidl.service import dataproxy_pb2 as _data_proxy_pb2
 from google.protobuf.duration_pb2 import Duration
@@ -36,3 +37,17 @@ def test_create_upload_location(mock_raw_create_upload_location):
         project="foo", domain="bar", filename="baz.qux", expires_in=duration_pb
     )
     mock_raw_create_upload_location.assert_called_with(create_upload_location_request)
+
+
+@_mock.patch("flytekit.clients.friendly._RawSynchronousFlyteClient.list_executions_paginated")
+def test_iterate_paginated(mock_raw_list_executions):
+    client = _SynchronousFlyteClient(PlatformConfig.for_endpoint("a.b.com", True))
+    mock_raw_list_executions.side_effect = [
+        _execution_pb2.ExecutionList(executions=[], token="1"),
+        _execution_pb2.ExecutionList(executions=[], token=""),
+    ]
+    assert list(client.iterate_paginated(client.list_executions_paginated, "p", "d", page_size=20)) == []
+    assert mock_raw_list_executions.call_count == 2
+    last_request = mock_raw_list_executions.call_args.kwargs["resource_list_request"]
+    assert last_request.limit == 20
+    assert last_request.token == "1"
@@ -0,0 +1,95 @@
+import threading
+
+import pytest
+
+from flytekit.clients.helpers import iterate_paginated, iterate_paginated_concurrently, iterate_task_executions
+
+
+def _pager(total, calls=None):
+    def fetch_page(limit, token):
+        start = int(token) if token else 0
+        if calls is not None:
+            calls.append((limit, token))
+        end = min(start + limit, total)
+        return list(range(start, end)), str(end) if end < total else ""
+
+    return fetch_page
+
+
+@pytest.mark.parametrize("prefetch", [True, False])
+def test_iterate_paginated(prefetch):
+    calls = []
+    assert list(iterate_paginated(_pager(25, calls), page_size=10, prefetch=prefetch)) == list(range(25))
+    assert calls == [(10, ""), (10, "10"), (10, "20")]
+
+
+def test_iterate_paginated_limit():
+    calls = []
+    assert list(iterate_paginated(_pager(25, calls), limit=12, page_size=10)) == list(range(12))
+    # The page after the one reaching the limit must not be requested
+    assert calls == [(10, ""), (10, "10")]
+
+    calls = []
+    assert list(iterate_paginated(_pager(25, calls), limit=5, page_size=10)) == list(range(5))
+    assert calls == [(5, "")]
+
+    assert list(iterate_paginated(_pager(25), limit=0)) == []
+
+
+def test_iterate_paginated_prefetches_next_page():
+    requested = threading.Event()
+    release = threading.Event()
+
+    def fetch_page(limit, token):
+        if not token:
+            return [0, 1], "next"
+        requested.set()
+        release.wait(5)
+        return [2], ""
+
+    it = iterate_paginated(fetch_page, page_size=2)
+    assert next(it) == 0
+    # The second page is requested while the first one is still being consumed
+    assert requested.wait(5)
+    release.set()
+    assert list(it) == [1, 2]
+
+
+def test_iterate_paginated_bad_page_size():
+    with pytest.raises(ValueError):
+        list(iterate_paginated(_pager(3), page_size=0))
+
+
+def test_iterate_paginated_concurrently():
+    scopes = [("p1", "development"), ("p2", "staging"), ("p3", "production")]
+    sizes = {"p1": 7, "p2": 0, "p3": 31}
+
+    results = list(iterate_paginated_concurrently(lambda s: _pager(sizes[s[0]]), scopes, page_size=5, max_workers=2))
+    by_scope = {}
+    for scope, e in results:
+        by_scope.setdefault(scope, []).append(e)
+    assert by_scope == {("p1", "development"): list(range(7)), ("p3", "production"): list(range(31))}
+
+    results = list(
+        iterate_paginated_concurrently(lambda s: _pager(sizes[s[0]]), scopes, limit_per_scope=6, page_size=5)
+    )
+    assert sorted(e for s, e in results if s[0] == "p3") == list(range(6))
+
+
+def test_iterate_paginated_concurrently_propagates_errors():
+    def fetch_page_for(scope):
+        if scope == "bad":
+            raise ValueError("boom")
+        return _pager(3)
+
+    with pytest.raises(ValueError, match="boom"):
+        list(iterate_paginated_concurrently(fetch_page_for, ["good", "bad"]))
+
+
+def test_iterate_task_executions():
+    class _Client(object):
+        def list_task_executions_paginated(self, node_execution_identifier, limit, token, filters):
+            return _pager(8)(limit, token)
+
+    assert list(iterate_task_executions(_Client(), "n0", page_size=3)) == list(range(8))
+    assert list(iterate_task_executions(_Client(), "n0", limit=4, page_size=3)) == list(range(4))
@@ -1,11 +1,20 @@
 import os
+import threading
+import time
 
+import mock
 import pytest
 
 from flytekit.core import context_manager
 from flytekit.core.context_manager import ExecutionState
 from flytekit.image_spec import ImageSpec
-from flytekit.image_spec.image_spec import _F_IMG_ID, ImageBuildEngine, ImageSpecBuilder, calculate_hash_from_image_spec
+from flytekit.image_spec.image_spec import (
+    _F_IMG_ID,
+    ImageBuildEngine,
+    ImageSpecBuilder,
+    calculate_hash_from_image_spec,
+    hash_directory,
+)
 
 REQUIREMENT_FILE = os.path.join(os.path.dirname(os.path.realpath(__file__)), "requirements.txt")
 REGISTRY_CONFIG_FILE = os.path.join(os.path.dirname(os.path.realpath(__file__)), "registry_config.json")
@@ -63,3 +72,92 @@ def test_image_spec():
     with pytest.raises(Exception):
         image_spec.builder = "flyte"
         ImageBuildEngine.build(image_spec)
+
+
+def test_hash_directory(tmp_path):
+    src = tmp_path / "src"
+    os.makedirs(src / "pkg")
+    (src / "pkg" / "a.py").write_text("a")
+    (src / "pkg" / "b.py").write_text("b")
+    (src / ".gitignore").write_text("*.txt")
+    cache_dir = str(tmp_path / "cache")
+
+    with mock.patch("flytekit.image_spec.image_spec.IMAGE_SPEC_CACHE_LOCATION", cache_dir):
+        # Ignored files are copied into the image as well, so they change the hash
+        digest = hash_directory(str(src))
+        (src / "pkg" / "c.txt").write_text("c")
+        assert hash_directory(str(src)) != digest
+        os.remove(src / "pkg" / "c.txt")
+        os.remove(src / ".gitignore")
+        digest = hash_directory(str(src))
+        # The order the files were created in doesn't change the hash
+        other = tmp_path / "other"
+        os.makedirs(other / "pkg")
+        (other / "pkg" / "b.py").write_text("b")
+        (other / "pkg" / "a.py").write_text("a")
+        assert hash_directory(str(other)) == digest
+        # Renaming a file does
+        os.rename(src / "pkg" / "b.py", src / "pkg" / "c.py")
+        assert hash_directory(str(src)) != digest
+
+        # Files are read again only once they changed
+        old = time.time() - 60
+        for f in ("a.py", "c.py"):
+            os.utime(src / "pkg" / f, (old, old))
+        hash_directory(str(src))
+        real_open = open
+
+        def open_outside_src(file, *args, **kwargs):
+            assert not str(file).startswith(str(src))
+            return real_open(file, *args, **kwargs)
+
+        with mock.patch("builtins.open", side_effect=open_outside_src):
+            digest = hash_directory(str(src))
+        (src / "pkg" / "a.py").write_text("changed")
+        assert hash_directory(str(src)) != digest
+
+
+def test_image_existence_cache(tmp_path):
+    image_spec = ImageSpec(name="flytekit", registry="localhost:30000")
+    with mock.patch("flytekit.image_spec.image_spec.IMAGE_SPEC_CACHE_LOCATION", str(tmp_path)):
+        with mock.patch.object(ImageSpec, "_exist", return_value=False):
+            assert image_spec.exist() is False
+        image_spec.exist.cache_clear()
+        with mock.patch.object(ImageSpec, "_exist", return_value=True) as m:
+            assert image_spec.exist() is True
+            image_spec.exist.cache_clear()
+            assert image_spec.exist() is True
+            m.assert_called_once()
+        image_spec.exist.cache_clear()
+        # The registry couldn't be checked, the image is assumed to exist but that is not remembered
+        other = ImageSpec(name="other", registry="localhost:30000")
+        with mock.patch.object(ImageSpec, "_exist", return_value=None):
+            assert other.exist() is True
+        other.exist.cache_clear()
+        with mock.patch.object(ImageSpec, "_exist", return_value=False):
+            assert other.exist() is False
+        with mock.patch.dict(os.environ, {"FLYTE_SDK_IMAGE_SPEC_EXIST_TTL": "0"}):
+            image_spec.exist.cache_clear()
+            with mock.patch.object(ImageSpec, "_exist", return_value=False):
+                assert image_spec.exist() is False
+    image_spec.exist.cache_clear()
+
+
+def test_build_all():
+    built = []
+    barrier = threading.Barrier(2, timeout=10)
+
+    class ParallelImageSpecBuilder(ImageSpecBuilder):
+        def build_image(self, img):
+            # Both images are built at the same time
+            barrier.wait()
+            built.append(img.name)
+
+    ImageBuildEngine.register("parallel", ParallelImageSpecBuilder())
+    specs = [ImageSpec(name=n, builder="parallel", registry="localhost:30000") for n in ("a", "b", "a")]
+    with mock.patch.object(ImageSpec, "exist", return_value=False):
+        ImageBuildEngine.build_all(specs)
+    assert sorted(built) == ["a", "b"]
+
+    with pytest.raises(Exception):
+        ImageBuildEngine.build_all([ImageSpec(builder="unknown")])
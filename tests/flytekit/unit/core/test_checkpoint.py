@@ -1,10 +1,11 @@
 import os
 from pathlib import Path
 
+import mock
 import pytest
 
 import flytekit
-from flytekit.core.checkpointer import SyncCheckpoint
+from flytekit.core.checkpointer import AsyncCheckpoint, SyncCheckpoint
 from flytekit.core.local_cache import LocalTaskCache
 
 
@@ -120,6 +121,74 @@ def test_sync_checkpoint_read_multiple_files(tmpdir):
         cp.read()
 
 
+def test_async_checkpoint_incremental(tmpdir):
+    td_path = Path(tmpdir)
+    src = td_path.joinpath("src")
+    src.joinpath("sub").mkdir(parents=True)
+    src.joinpath("a").write_bytes(b"a")
+    src.joinpath("sub", "b").write_bytes(b"b")
+    dest = td_path.joinpath("dest")
+    dest.mkdir()
+    cp = AsyncCheckpoint(checkpoint_dest=str(dest))
+
+    cp.save(src)
+    cp.wait()
+    assert dest.joinpath("a").read_bytes() == b"a"
+    assert dest.joinpath("sub", "b").read_bytes() == b"b"
+
+    # Only changed files are uploaded again
+    dest.joinpath("a").write_bytes(b"not uploaded again")
+    src.joinpath("sub", "b").write_bytes(b"b2")
+    cp.save(str(src))
+    # The checkpoint is snapshotted, changes after save are not uploaded
+    src.joinpath("sub", "b").write_bytes(b"b3")
+    cp.wait()
+    assert dest.joinpath("a").read_bytes() == b"not uploaded again"
+    assert dest.joinpath("sub", "b").read_bytes() == b"b2"
+
+
+def test_async_checkpoint_same_size_rewrite(tmpdir):
+    td_path = Path(tmpdir)
+    src = td_path.joinpath("src")
+    src.mkdir()
+    src.joinpath("a").write_bytes(b"a1")
+    dest = td_path.joinpath("dest")
+    dest.mkdir()
+    cp = AsyncCheckpoint(checkpoint_dest=str(dest))
+    cp.save(src)
+    cp.wait()
+
+    # The contents are compared, not the size and modification time
+    stat = os.stat(src.joinpath("a"))
+    src.joinpath("a").write_bytes(b"a2")
+    os.utime(src.joinpath("a"), ns=(stat.st_atime_ns, stat.st_mtime_ns))
+    cp.save(src)
+    cp.wait()
+    assert dest.joinpath("a").read_bytes() == b"a2"
+
+
+def test_async_checkpoint_write(tmpdir):
+    cp = AsyncCheckpoint(checkpoint_dest=tmpdir)
+    cp.write(b"bytes")
+    cp.write(b"bytes2")
+    cp.wait()
+    assert Path(tmpdir).joinpath(SyncCheckpoint.TMP_DST_PATH).read_bytes() == b"bytes2"
+
+    with pytest.raises(ValueError):
+        cp.save(SyncCheckpoint)  # noqa
+
+
+def test_async_checkpoint_upload_error(tmpdir):
+    cp = AsyncCheckpoint(checkpoint_dest=tmpdir)
+    with mock.patch("flytekit.core.data_persistence.FileAccessProvider.put_data", side_effect=ValueError("boom")):
+        cp.write(b"bytes")
+        with pytest.raises(ValueError, match="boom"):
+            cp.wait()
+    cp.write(b"bytes")
+    cp.wait()
+    assert Path(tmpdir).joinpath(SyncCheckpoint.TMP_DST_PATH).read_bytes() == b"bytes"
+
+
 @flytekit.task
 def t1(n: int) -> int:
     ctx = flytekit.current_context()
@@ -1,3 +1,6 @@
+import os
+from unittest import mock
+
 from flytekit.core.data_persistence import FileAccessProvider
 
 
@@ -14,3 +17,33 @@ def test_is_remote():
     assert fp.is_remote("/tmp/foo/bar") is False
     assert fp.is_remote("file://foo/bar") is False
     assert fp.is_remote("s3://my-bucket/foo/bar") is True
+
+
+def test_put_content_addressed(tmp_path):
+    fp = FileAccessProvider(str(tmp_path / "sandbox"), str(tmp_path / "raw"), content_addressed_uploads=True)
+    assert fp.content_addressed_uploads
+
+    src = tmp_path / "src"
+    (src / "sub").mkdir(parents=True)
+    (src / "a.txt").write_text("hello")
+    (src / "sub" / "b.txt").write_text("world")
+
+    remote = fp.put_content_addressed(str(src / "a.txt"))
+    assert remote == fp.get_content_addressed_remote_path(fp.content_digest(str(src / "a.txt")), "a.txt")
+    assert os.path.basename(remote) == "a.txt"
+    with open(remote) as f:
+        assert f.read() == "hello"
+
+    # Identical contents are not uploaded again
+    copy = tmp_path / "copy"
+    copy.mkdir()
+    (copy / "a.txt").write_text("hello")
+    with mock.patch.object(fp, "put_data") as put_data:
+        assert fp.put_content_addressed(str(copy / "a.txt")) == remote
+        put_data.assert_not_called()
+
+    remote_dir = fp.put_content_addressed(str(src), is_multipart=True)
+    assert sorted(os.listdir(remote_dir)) == ["a.txt", "sub"]
+    assert os.path.exists(remote_dir + ".complete")
+    (src / "sub" / "b.txt").write_text("changed")
+    assert fp.put_content_addressed(str(src), is_multipart=True) != remote_dir
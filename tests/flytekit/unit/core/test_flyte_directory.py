@@ -5,6 +5,7 @@ import tempfile
 import typing
 from unittest.mock import MagicMock
 
+import fsspec
 import pytest
 
 import flytekit.configuration
@@ -276,3 +277,32 @@ def test_directory_guess():
     fft = transformer.guess_python_type(lt)
     assert issubclass(fft, FlyteDirectory)
     assert fft.extension() == ""
+
+
+def test_lazy_file_access():
+    fs = fsspec.filesystem("memory")
+    for name in ["a.parquet", "b.parquet", "sub/c.parquet", "sub/d.txt"]:
+        fs.pipe(f"/lazy-dir/{name}", name.encode())
+
+    ctx = FlyteContextManager.current_context()
+    lv = TypeEngine.to_literal(ctx, "memory://lazy-dir", FlyteDirectory, TypeEngine.to_literal_type(FlyteDirectory))
+    fd = TypeEngine.to_python_value(ctx, lv, FlyteDirectory)
+
+    assert fd.listing() == ["a.parquet", "b.parquet", "sub/c.parquet", "sub/d.txt"]
+    assert os.listdir(fd.path) == []
+
+    ff = fd.get_file("sub/d.txt")
+    assert ff.remote_source == "memory://lazy-dir/sub/d.txt"
+    assert not os.path.exists(ff.path)
+    with open(ff) as f:
+        assert f.read() == "sub/d.txt"
+
+    # Like in shell globs, * doesn't match /
+    local = fd.download(pattern="*.parquet")
+    assert sorted(os.listdir(local)) == ["a.parquet", "b.parquet", "sub"]
+    assert sorted(os.listdir(os.path.join(local, "sub"))) == ["d.txt"]
+
+    local = fd.download(pattern="**/*.parquet")
+    assert sorted(os.listdir(os.path.join(local, "sub"))) == ["c.parquet", "d.txt"]
+    assert not fd.downloaded
+    fs.rm("/lazy-dir", recursive=True)
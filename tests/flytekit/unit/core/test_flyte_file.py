@@ -496,3 +496,33 @@ def test_file_open_things():
             # print_file uses traditional download semantics so now a file should have been created
             files = local.find(new_sandbox)
             assert len(files) == 1
+
+
+def test_content_addressed_uploads():
+    random_dir = FlyteContextManager.current_context().file_access.get_random_local_directory()
+    fs = FileAccessProvider(
+        local_sandbox_dir=random_dir,
+        raw_output_prefix=os.path.join(random_dir, "mock_remote"),
+        content_addressed_uploads=True,
+    )
+    ctx = FlyteContextManager.current_context()
+    with FlyteContextManager.with_context(ctx.with_file_access(fs)) as ctx:
+        lt = TypeEngine.to_literal_type(FlyteFile)
+        first = TypeEngine.to_literal(ctx, __file__, FlyteFile, lt)
+        second = TypeEngine.to_literal(ctx, __file__, FlyteFile, lt)
+        assert first.scalar.blob.uri == second.scalar.blob.uri
+        assert os.path.basename(first.scalar.blob.uri) == os.path.basename(__file__)
+        assert len(os.listdir(os.path.join(random_dir, "mock_remote", "content-addressed"))) == 1
+
+        # Different files that share a HashMethod value are stored under different paths
+        hashed = Annotated[FlyteFile, HashMethod(lambda f: "v1")]
+        for name, contents in [("a", "one"), ("b", "two")]:
+            os.makedirs(os.path.join(random_dir, name))
+            with open(os.path.join(random_dir, name, "out.csv"), "w") as f:
+                f.write(contents)
+        lv_a = TypeEngine.to_literal(ctx, os.path.join(random_dir, "a", "out.csv"), hashed, lt)
+        lv_b = TypeEngine.to_literal(ctx, os.path.join(random_dir, "b", "out.csv"), hashed, lt)
+        assert lv_a.hash == lv_b.hash == "v1"
+        assert lv_a.scalar.blob.uri != lv_b.scalar.blob.uri
+        with open(lv_b.scalar.blob.uri) as f:
+            assert f.read() == "two"
@@ -0,0 +1,116 @@
+import os
+import tempfile
+import typing
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from flytekit.core.context_manager import FlyteContextManager
+from flytekit.core.local_cache import LocalTaskCache
+from flytekit.core.native_passthrough import NativePassthrough
+from flytekit.core.task import task
+from flytekit.core.type_engine import TypeEngine
+from flytekit.core.workflow import workflow
+from flytekit.types.file import FlyteFile
+from flytekit.types.structured.structured_dataset import StructuredDataset
+
+
+@pytest.fixture
+def passthrough(monkeypatch):
+    monkeypatch.setenv("FLYTE_SDK_LOCAL_NATIVE_PASSTHROUGH", "true")
+
+
+def test_dataframe_passthrough(passthrough):
+    produced = []
+
+    @task
+    def produce() -> pd.DataFrame:
+        df = pd.DataFrame({"a": [1, 2, 3]})
+        produced.append(df)
+        return df
+
+    @task
+    def consume(df: pd.DataFrame) -> bool:
+        return df is produced[0]
+
+    @task
+    def total(arr: np.ndarray) -> int:
+        return int(arr.sum())
+
+    @task
+    def to_array(df: pd.DataFrame) -> np.ndarray:
+        return df["a"].to_numpy()
+
+    @workflow
+    def wf() -> typing.Tuple[bool, int]:
+        df = produce()
+        return consume(df=df), total(arr=to_array(df=df))
+
+    assert wf() == (True, 6)
+
+
+def test_incompatible_consumer_materializes(passthrough):
+    @task
+    def produce() -> pd.DataFrame:
+        return pd.DataFrame({"a": [1, 2, 3]})
+
+    @task
+    def consume(sd: StructuredDataset) -> int:
+        return int(sd.open(pd.DataFrame).all()["a"].sum())
+
+    @task
+    def write_file() -> FlyteFile:
+        path = os.path.join(tempfile.mkdtemp(), "f.txt")
+        with open(path, "w") as f:
+            f.write("hello")
+        return path  # type: ignore
+
+    @task
+    def read_file(f: FlyteFile) -> str:
+        with open(f) as fh:
+            return fh.read()
+
+    @workflow
+    def wf() -> typing.Tuple[int, str]:
+        return consume(sd=produce()), read_file(f=write_file())
+
+    assert wf() == (6, "hello")
+
+
+def test_cached_outputs_are_materialized(passthrough):
+    LocalTaskCache.initialize()
+    LocalTaskCache.clear()
+    calls = []
+
+    @task(cache=True, cache_version="v1")
+    def produce(n: int) -> pd.DataFrame:
+        calls.append(n)
+        return pd.DataFrame({"a": list(range(n))})
+
+    @workflow
+    def wf(n: int) -> pd.DataFrame:
+        return produce(n=n)
+
+    assert wf(n=3)["a"].tolist() == [0, 1, 2]
+    assert wf(n=3)["a"].tolist() == [0, 1, 2]
+    assert calls == [3]
+
+
+def test_passthrough_literals():
+    ctx = FlyteContextManager.current_context()
+    df = pd.DataFrame({"a": [1]})
+    lt = TypeEngine.to_literal_type(pd.DataFrame)
+
+    # Only enabled for local executions
+    lv = TypeEngine.to_literal(ctx, df, pd.DataFrame, lt)
+    assert not NativePassthrough.is_passthrough(lv)
+
+    lv = NativePassthrough.to_literal(df, pd.DataFrame, lt)
+    assert NativePassthrough.is_passthrough(lv)
+    assert TypeEngine.to_python_value(ctx, lv, pd.DataFrame) is df
+
+    materialized = NativePassthrough.materialize(ctx, lv)
+    assert not NativePassthrough.is_passthrough(materialized)
+    assert NativePassthrough.materialize(ctx, lv) is materialized
+    assert TypeEngine.to_python_value(ctx, materialized, pd.DataFrame)["a"].tolist() == [1]
@@ -0,0 +1,104 @@
+import contextvars
+import json
+import os
+import pstats
+import tempfile
+import threading
+
+import mock
+import pytest
+
+from flytekit.core import profiler
+from flytekit.core.context_manager import FlyteContextManager
+from flytekit.core.data_persistence import FileAccessProvider
+from flytekit.core.profiler import CPU_PROFILE_FILE_NAME, TRACE_FILE_NAME, profile_cpu, profile_task
+from flytekit.core.utils import timeit
+
+
+@pytest.fixture
+def profiling(monkeypatch):
+    monkeypatch.setenv("FLYTE_SDK_PROFILING", "true")
+
+
+def test_profiling_disabled():
+    with profile_task("t") as profile:
+        with timeit("child"):
+            pass
+    assert profile is None
+    assert profiler.current_profile() is None
+
+
+def test_nested_spans(profiling):
+    local_dir = tempfile.mkdtemp()
+    with open(os.path.join(local_dir, "a.txt"), "wb") as f:
+        f.write(b"x" * 100)
+    fp = FileAccessProvider(local_sandbox_dir=tempfile.mkdtemp(), raw_output_prefix=tempfile.mkdtemp())
+
+    with profile_task("t") as profile:
+        with timeit("Upload outputs"):
+            fp.put_data(local_dir, os.path.join(tempfile.mkdtemp(), "remote"), is_multipart=True)
+        with timeit("Download inputs"):
+            fp.get_data(os.path.join(local_dir, "a.txt"), os.path.join(tempfile.mkdtemp(), "b.txt"))
+
+    root, upload, put, download, get = profile.spans
+    assert root.parent is None and root.metric == "task"
+    assert upload.parent is root and put.parent is upload and put.metric == "upload"
+    assert download.parent is root and get.parent is download and get.metric == "download"
+    assert upload.bytes_written == put.bytes_written == 100
+    assert download.bytes_read == get.bytes_read == 100
+    assert root.bytes_written == root.bytes_read == 100
+    assert root.wall_time >= upload.wall_time + download.wall_time
+    assert profiler.current_profile() is None
+
+
+def test_concurrent_decorated_calls(profiling):
+    @timeit("work")
+    def work(started: threading.Event, release: threading.Event):
+        started.set()
+        release.wait()
+
+    events = [(threading.Event(), threading.Event()) for _ in range(2)]
+    with profile_task("t") as profile:
+        threads = [
+            threading.Thread(target=contextvars.copy_context().run, args=(work, *e), daemon=True) for e in events
+        ]
+        for thread, (started, _) in zip(threads, events):
+            thread.start()
+            started.wait()
+        # The first call ends while the second is still running, and only ends its own span
+        events[0][1].set()
+        threads[0].join()
+        _, first, second = profile.spans
+        try:
+            assert first.end_time_ns is not None
+            assert second.end_time_ns is None
+        finally:
+            events[1][1].set()
+            threads[1].join()
+        assert second.end_time_ns is not None
+
+
+def test_export(profiling, monkeypatch):
+    monkeypatch.setenv("FLYTE_SDK_PROFILE_CPU", "true")
+    with profile_task("t") as profile:
+        with timeit("Execute user level code"), profile_cpu():
+            sum(range(1000))
+
+    output_prefix = tempfile.mkdtemp()
+    stats = mock.MagicMock()
+    profile.export(FlyteContextManager.current_context().file_access, output_prefix, stats)
+
+    with open(os.path.join(output_prefix, TRACE_FILE_NAME)) as f:
+        spans = json.load(f)["resourceSpans"][0]["scopeSpans"][0]["spans"]
+    assert [s["name"] for s in spans] == ["t", "Execute user level code"]
+    assert spans[1]["parentSpanId"] == spans[0]["spanId"]
+    assert {a["key"] for a in spans[1]["attributes"]} >= {"flyte.rss_delta_bytes", "flyte.bytes_read"}
+
+    with open(os.path.join(output_prefix, CPU_PROFILE_FILE_NAME), "rb") as f:
+        stats_file = os.path.join(tempfile.mkdtemp(), "stats")
+        with open(stats_file, "wb") as o:
+            o.write(f.read())
+    assert pstats.Stats(stats_file).total_calls > 0
+
+    stats.timing.assert_any_call("profile.execute_user_level_code", mock.ANY)
+    stats.gauge.assert_any_call("profile.task.bytes_read", 0)
@@ -1,11 +1,15 @@
+import os
 import typing
 
 import pandas as pd
 import pyarrow as pa
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
 import pytest
 
 from flytekit.core import context_manager
 from flytekit.core.base_task import kwtypes
+from flytekit.models import literals
 from flytekit.models.literals import StructuredDatasetMetadata
 from flytekit.models.types import StructuredDatasetType
 from flytekit.types.structured import basic_dfs
@@ -36,6 +40,34 @@ def test_pandas():
     assert df.equals(df2)
 
 
+def test_pandas_sharded():
+    df = pd.DataFrame({"Name": [f"name-{i}" for i in range(1000)], "Age": list(range(1000))})
+    ctx = context_manager.FlyteContextManager.current_context()
+    uri = ctx.file_access.get_random_local_directory()
+
+    n = basic_dfs.write_parquet_parts(ctx, pa.Table.from_pandas(df), uri, max_rows_per_part=300)
+    assert n == 4
+    assert sorted(os.listdir(uri)) == ["00000", "00001", "00002", "00003", "_metadata"]
+    summary = pq.read_metadata(os.path.join(uri, "_metadata"))
+    assert summary.num_rows == 1000
+    assert summary.num_row_groups == 4
+    assert summary.row_group(3).column(0).file_path == "00003"
+
+    decoder = basic_dfs.ParquetToPandasDecodingHandler()
+    sd_type = StructuredDatasetType(format="parquet")
+    sd_lit = literals.StructuredDataset(uri=uri, metadata=StructuredDatasetMetadata(sd_type))
+    df2 = decoder.decode(ctx, sd_lit, StructuredDatasetMetadata(sd_type))
+    assert df.equals(df2)
+
+
+def test_rows_per_part():
+    table = pa.Table.from_pydict({"a": list(range(100))})
+    assert basic_dfs._rows_per_part(table, table.nbytes, 0) == 100
+    assert basic_dfs._rows_per_part(table, table.nbytes // 4, 0) == 25
+    assert basic_dfs._rows_per_part(table, table.nbytes, 30) == 30
+    assert basic_dfs._rows_per_part(table.slice(0, 0), 1, 0) == 1
+
+
 def test_csv():
     df = pd.DataFrame({"Name": ["Tom", "Joseph"], "Age": [20, 22]})
     encoder = basic_dfs.PandasToCSVEncodingHandler()
@@ -66,3 +98,81 @@ def test_arrow():
     assert encoder.python_type is decoder.python_type
     d = StructuredDatasetTransformerEngine.DECODERS[encoder.python_type]["fsspec"]["parquet"]
     assert d is not None
+
+
+def test_arrow_dataset():
+    ctx = context_manager.FlyteContextManager.current_context()
+    table = pa.Table.from_pydict({"a": list(range(100)), "b": [str(i) for i in range(100)]})
+    encoder = basic_dfs.ArrowDatasetToParquetEncodingHandler()
+    decoder = basic_dfs.ParquetToArrowDatasetDecodingHandler()
+
+    uri = ctx.file_access.get_random_local_directory()
+    assert basic_dfs.write_parquet_dataset(ctx, ds.dataset(table), uri, max_rows_per_part=40) == 3
+    assert sorted(os.listdir(uri)) == ["_metadata", "part-0.parquet", "part-1.parquet", "part-2.parquet"]
+    assert pq.read_metadata(os.path.join(uri, "_metadata")).num_rows == 100
+
+    sd_type = StructuredDatasetType(format="parquet")
+    sd_lit = encoder.encode(ctx, StructuredDataset(dataframe=ds.dataset(table)), sd_type)
+    dataset = decoder.decode(ctx, sd_lit, StructuredDatasetMetadata(sd_type))
+    assert isinstance(dataset, ds.Dataset)
+    assert dataset.to_table().sort_by("a").equals(table)
+
+    subset_type = StructuredDatasetType(columns=[StructuredDatasetType.DatasetColumn("b", None)], format="parquet")
+    dataset = decoder.decode(ctx, sd_lit, StructuredDatasetMetadata(subset_type))
+    assert dataset.schema.names == ["b"]
+    assert dataset.count_rows(filter=ds.field("b") == "42") == 1
+
+
+def test_arrow_dataset_task():
+    from flytekit import task
+
+    table = pa.Table.from_pydict({"a": [1, 2, 3]})
+
+    @task
+    def produce() -> StructuredDataset:
+        # ds.dataset returns one of the concrete dataset classes
+        return StructuredDataset(dataframe=ds.dataset(table))
+
+    @task
+    def produce_dataset() -> ds.Dataset:
+        return ds.dataset(table)
+
+    assert produce().open(pa.Table).all().equals(table)
+    assert produce_dataset().to_table().equals(table)
+
+
+def test_write_parquet_chunks():
+    ctx = context_manager.FlyteContextManager.current_context()
+    chunks = [
+        pa.Table.from_pydict({"a": [1, 2], "b": [None, None]}),
+        pa.Table.from_pydict({"a": [3], "b": ["x"]}),
+        pa.Table.from_pydict({"a": [4], "b": [None]}),
+    ]
+    uri = ctx.file_access.get_random_local_directory()
+    assert basic_dfs.write_parquet_chunks(ctx, iter(chunks), uri) == 3
+    # The column that is all null in the first chunk gets its type from the second one, in every part
+    table = basic_dfs.open_parquet_dataset(ctx, uri).to_table()
+    assert table.schema.field("b").type == pa.string()
+    assert table.sort_by("a").column("b").to_pylist() == [None, None, "x", None]
+    assert pq.read_metadata(os.path.join(uri, "_metadata")).num_rows == 4
+
+    with pytest.raises(ValueError):
+        basic_dfs.write_parquet_chunks(
+            ctx, iter(chunks[1:]), ctx.file_access.get_random_local_directory(), schema=pa.schema([("a", pa.int64())])
+        )
+
+    # No chunks still write a part that can be read back
+    schema = pa.schema([("a", pa.int64())])
+    uri = ctx.file_access.get_random_local_directory()
+    assert basic_dfs.write_parquet_chunks(ctx, iter([]), uri, schema=schema) == 1
+    assert basic_dfs.open_parquet_dataset(ctx, uri).to_table().schema == schema
+
+
+def test_write_parquet_parts_config(monkeypatch):
+    ctx = context_manager.FlyteContextManager.current_context()
+    table = pa.Table.from_pydict({"a": list(range(100))})
+    # The limits are read every time parts are written
+    monkeypatch.setenv("FLYTE_SDK_PARQUET_PART_MAX_ROWS", "40")
+    assert basic_dfs.write_parquet_parts(ctx, table, ctx.file_access.get_random_local_directory()) == 3
+    monkeypatch.delenv("FLYTE_SDK_PARQUET_PART_MAX_ROWS")
+    assert basic_dfs.write_parquet_parts(ctx, table, ctx.file_access.get_random_local_directory()) == 1
@@ -1,3 +1,5 @@
+import threading
+import time
 import typing
 from collections import OrderedDict
 
@@ -11,8 +13,18 @@ from flytekit import FlyteContextManager, StructuredDataset, kwtypes
 from flytekit.configuration import Image, ImageConfig
 from flytekit.core import context_manager
 from flytekit.core.condition import conditional
+from flytekit.core.promise import Promise
 from flytekit.core.task import task
-from flytekit.core.workflow import WorkflowFailurePolicy, WorkflowMetadata, WorkflowMetadataDefaults, workflow
+from flytekit.core.type_engine import TypeEngine
+from flytekit.core.workflow import (
+    GLOBAL_START_NODE,
+    ImperativeWorkflow,
+    LocalNodeScheduler,
+    WorkflowFailurePolicy,
+    WorkflowMetadata,
+    WorkflowMetadataDefaults,
+    workflow,
+)
 from flytekit.exceptions.user import FlyteValidationException, FlyteValueException
 from flytekit.tools.translator import get_serializable
 from flytekit.types.schema import FlyteSchema
@@ -423,3 +435,111 @@ def test_compile_wf_at_compile_time():
             t4()
 
         assert ctx.compilation_state is None
+
+
+@task
+def _square(x: int) -> int:
+    return x * x
+
+
+def test_concurrent_local_execution(monkeypatch):
+    monkeypatch.setenv("FLYTE_SDK_LOCAL_PARALLELISM", "3")
+    barrier = threading.Barrier(3, timeout=10)
+
+    @task
+    def wait_for_peers(x: int) -> int:
+        # Fails with a BrokenBarrierError unless all three branches run at the same time
+        barrier.wait()
+        return x * 2
+
+    @task
+    def total(a: int, b: int, c: int) -> int:
+        return a + b + c
+
+    @workflow
+    def wf(x: int) -> int:
+        return total(a=wait_for_peers(x=x), b=wait_for_peers(x=2), c=wait_for_peers(x=3))
+
+    assert wf(x=1) == 2 + 4 + 6
+
+    wb = ImperativeWorkflow(name="my.concurrent.workflow")
+    wb.add_workflow_input("x", int)
+    nodes = [wb.add_entity(wait_for_peers, x=wb.inputs["x"]) for _ in range(3)]
+    t = wb.add_entity(total, a=nodes[0].outputs["o0"], b=nodes[1].outputs["o0"], c=nodes[2].outputs["o0"])
+    wb.add_workflow_output("total", t.outputs["o0"])
+    assert wb(x=1) == 6
+
+
+def test_local_node_scheduler_critical_path():
+    @task
+    def slow(x: int) -> int:
+        time.sleep(0.2)
+        return x
+
+    @task
+    def fast(x: int) -> int:
+        return x
+
+    @workflow
+    def wf(x: int) -> typing.Tuple[int, int]:
+        a = slow(x=x)
+        return fast(x=a), fast(x=x)
+
+    wf.compile()
+    scheduler = LocalNodeScheduler(max_workers=2)
+    ctx = FlyteContextManager.current_context()
+    with FlyteContextManager.with_context(
+        ctx.with_execution_state(
+            ctx.new_execution_state().with_params(mode=context_manager.ExecutionState.Mode.LOCAL_WORKFLOW_EXECUTION)
+        )
+    ):
+        outputs = scheduler.run(
+            wf.nodes,
+            {
+                GLOBAL_START_NODE: {
+                    "x": Promise(var="x", val=TypeEngine.to_literal(ctx, 3, int, TypeEngine.to_literal_type(int)))
+                }
+            },
+        )
+
+    assert [n.id for n in scheduler.critical_path] == [wf.nodes[0].id, wf.nodes[1].id]
+    assert scheduler.critical_path_duration >= 0.2
+    assert outputs[wf.nodes[1]]["o0"].val.scalar.primitive.integer == 3
+
+
+def test_concurrent_local_execution_failure(monkeypatch):
+    monkeypatch.setenv("FLYTE_SDK_LOCAL_PARALLELISM", "2")
+
+    @task
+    def fail(x: int) -> int:
+        raise ValueError("fail")
+
+    @workflow
+    def wf(x: int) -> typing.Tuple[int, int]:
+        return fail(x=x), _square(x=x)
+
+    with pytest.raises(ValueError):
+        wf(x=2)
+
+
+def test_concurrent_local_execution_processes(monkeypatch):
+    monkeypatch.setenv("FLYTE_SDK_LOCAL_PARALLELISM", "2")
+    monkeypatch.setenv("FLYTE_SDK_LOCAL_EXECUTOR", "process")
+
+    @workflow
+    def wf(x: int) -> typing.Tuple[int, int]:
+        return _square(x=x), _square(x=_square(x=x))
+
+    assert wf(x=3) == (9, 81)
+
+
+def test_concurrent_local_execution_conditional(monkeypatch):
+    # Conditionals are not scheduled, the workflow function runs as before
+    monkeypatch.setenv("FLYTE_SDK_LOCAL_PARALLELISM", "2")
+
+    @workflow
+    def wf(x: int) -> int:
+        return conditional("test").if_(x > 2).then(_square(x=x)).else_().then(_square(x=1))
+
+    assert wf(x=3) == 9
+    assert wf(x=1) == 1
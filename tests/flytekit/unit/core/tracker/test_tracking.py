@@ -1,10 +1,11 @@
+import types
 import typing
 
 import pytest
 
 from flytekit import task
 from flytekit.configuration.feature_flags import FeatureFlags
-from flytekit.core.tracker import extract_task_module
+from flytekit.core.tracker import _GlobalsIndex, extract_task_module
 from tests.flytekit.unit.core.tracker import d
 from tests.flytekit.unit.core.tracker.b import b_local_a, local_b
 from tests.flytekit.unit.core.tracker.c import b_in_c, c_local_a
@@ -86,3 +87,24 @@ local_task = task(d.inner_function)
 
 def test_local_task_wrap():
     assert local_task.instantiated_in == "tests.flytekit.unit.core.tracker.test_tracking"
+
+
+def test_globals_index():
+    m = types.ModuleType("tests.flytekit.unit.core.tracker.generated")
+    objs = [object() for _ in range(3)]
+    for i, o in enumerate(objs):
+        setattr(m, f"o{i}", o)
+    m.alias = objs[1]
+    assert [_GlobalsIndex.find(m, o) for o in objs] == ["o0", "alias", "o2"]
+    assert _GlobalsIndex.find(m, object()) is None
+
+    # Globals added or reassigned after the index was built are found
+    m.o0 = new = object()
+    m.o3 = objs[0]
+    assert _GlobalsIndex.find(m, new) == "o0"
+    assert _GlobalsIndex.find(m, objs[0]) == "o3"
+
+    # A module replacing the indexed one under the same name gets its own index
+    m2 = types.ModuleType(m.__name__)
+    m2.x = objs[2]
+    assert _GlobalsIndex.find(m2, objs[2]) == "x"
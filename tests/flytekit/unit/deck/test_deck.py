@@ -1,4 +1,8 @@
 import datetime
+import os
+import tempfile
+import threading
+import time
 
 import pandas as pd
 import pytest
@@ -6,8 +10,9 @@ from mock import mock
 
 import flytekit
 from flytekit import Deck, FlyteContextManager, task
+from flytekit.core.context_manager import ExecutionParameters, ExecutionState
 from flytekit.deck import TopFrameRenderer
-from flytekit.deck.deck import _output_deck
+from flytekit.deck.deck import RENDER_WORKERS, _output_deck, _render_workers, render_html
 
 
 def test_deck():
@@ -119,3 +124,90 @@ def test_get_deck():
     ctx.user_space_params._decks = [ctx.user_space_params.default_deck]
     ctx.user_space_params._decks[0] = flytekit.Deck("test", html)
     _output_deck("test_task", ctx.user_space_params)
+
+
+def test_deck_append_async():
+    ctx = FlyteContextManager.current_context()
+    ctx.user_space_params._decks = [ctx.user_space_params.default_deck]
+    deck = Deck("test", "a")
+    deck.append_async(lambda x: x, "b")
+    deck.append("c")
+    assert deck.html == "a\nb\nc"
+
+
+def test_deck_render_budget(monkeypatch):
+    ctx = FlyteContextManager.current_context()
+    ctx.user_space_params._decks = [ctx.user_space_params.default_deck]
+
+    monkeypatch.setenv("FLYTE_SDK_DECK_RENDER_MAX_BYTES", "10")
+    assert render_html(ctx, "x" * 100, str).startswith("x" * 10 + "\n<p><strong>Truncated 90 bytes")
+
+    monkeypatch.setenv("FLYTE_SDK_DECK_RENDER_TIMEOUT", "0")
+    deck = Deck("test")
+    deck.append_async(lambda: time.sleep(1) or "slow")
+    assert "timed out" in deck.html
+
+
+def test_render_html_mutated():
+    ctx = FlyteContextManager.current_context()
+    df = pd.DataFrame({"Name": ["Tom", "Joseph"], "Age": [1, 22]})
+    html = render_html(ctx, df, pd.DataFrame)
+    df["Age"] = [2, 23]
+    # Values mutated in place are rendered again
+    assert render_html(ctx, df, pd.DataFrame) != html
+
+
+def test_deck_render_workers_bounded():
+    ctx = FlyteContextManager.current_context()
+    ctx.user_space_params._decks = [ctx.user_space_params.default_deck]
+    deck = Deck("test")
+    for i in range(RENDER_WORKERS * 3):
+        deck.append_async(str, i)
+    assert deck.html == "\n" + "\n".join(str(i) for i in range(RENDER_WORKERS * 3))
+    assert len(_render_workers) <= RENDER_WORKERS
+
+
+def test_deck_hung_renders_replaced(monkeypatch):
+    ctx = FlyteContextManager.current_context()
+    ctx.user_space_params._decks = [ctx.user_space_params.default_deck]
+    monkeypatch.setenv("FLYTE_SDK_DECK_RENDER_TIMEOUT", "1")
+    release = threading.Event()
+    try:
+        deck = Deck("test")
+        for _ in range(RENDER_WORKERS):
+            deck.append_async(lambda: release.wait() and "hung")
+        # Queued behind the hung renders for longer than the timeout, but rendered once they are given up on
+        deck.append_async(str, "queued")
+        assert deck.html == "\n" + "\n".join(["<p>Rendering timed out.</p>"] * RENDER_WORKERS + ["queued"])
+
+        deck = Deck("test")
+        deck.append_async(str, "later")
+        assert deck.html == "\nlater"
+        assert len(_render_workers) <= RENDER_WORKERS
+    finally:
+        release.set()
+
+
+def test_output_deck_streams_to_remote():
+    ctx = FlyteContextManager.current_context()
+    output_prefix = tempfile.mkdtemp()
+    params = ExecutionParameters(
+        execution_date=datetime.datetime.utcnow(),
+        tmp_dir=tempfile.mkdtemp(),
+        stats=None,
+        execution_id=None,
+        logging=None,
+        raw_output_prefix=None,
+        output_metadata_prefix=output_prefix,
+        decks=[],
+    )
+    with FlyteContextManager.with_context(
+        ctx.with_execution_state(
+            ctx.new_execution_state().with_params(mode=ExecutionState.Mode.TASK_EXECUTION, user_space_params=params)
+        )
+    ):
+        Deck("test", "你好，Flyte")
+        _output_deck("test_task", params)
+
+    with open(os.path.join(output_prefix, "deck.html"), encoding="utf-8") as f:
+        assert "你好，Flyte" in f.read()
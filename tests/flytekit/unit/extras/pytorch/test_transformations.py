@@ -13,6 +13,7 @@ from flytekit.extras.pytorch import (
     PyTorchModuleTransformer,
     PyTorchTensorTransformer,
 )
+from flytekit.extras.pytorch.native import is_safetensors_file, load_tensors, save_tensors
 from flytekit.models.core.types import BlobType
 from flytekit.models.literals import BlobMetadata
 from flytekit.models.types import LiteralType
@@ -130,3 +131,63 @@ def test_example_checkpoint():
         task_spec.template.interface.outputs["o0"].type.blob.format
         is PyTorchCheckpointTransformer.PYTORCH_CHECKPOINT_FORMAT
     )
+
+
+@pytest.mark.parametrize(
+    "python_val",
+    [
+        torch.tensor([[1.0, -1.0, 2], [1.0, -1.0, 9]]),
+        torch.arange(7, dtype=torch.int8),
+        torch.tensor([True, False]),
+        torch.ones(3, dtype=torch.bfloat16),
+        torch.zeros(0, 3),
+        torch.tensor(3.5, dtype=torch.float64),
+    ],
+)
+def test_safetensors_tensor(monkeypatch, python_val):
+    monkeypatch.setenv("FLYTE_SDK_PYTORCH_SAFETENSORS", "true")
+    ctx = context_manager.FlyteContext.current_context()
+    tf = PyTorchTensorTransformer()
+    lv = tf.to_literal(ctx, python_val, torch.Tensor, tf.get_literal_type(torch.Tensor))
+    assert lv.scalar.blob.uri.endswith(".safetensors")
+
+    output = tf.to_python_value(ctx, lv, torch.Tensor)
+    assert output.dtype == python_val.dtype
+    assert torch.equal(output.cpu(), python_val)
+
+
+@pytest.mark.parametrize(
+    "python_val",
+    [
+        torch.ones(2, dtype=torch.complex64),
+        torch.tensor([[0.0, 1.0], [2.0, 0.0]]).to_sparse(),
+    ],
+)
+def test_safetensors_unsupported_tensor(monkeypatch, python_val):
+    monkeypatch.setenv("FLYTE_SDK_PYTORCH_SAFETENSORS", "true")
+    ctx = context_manager.FlyteContext.current_context()
+    tf = PyTorchTensorTransformer()
+    # Tensors the safetensors format can't hold are saved with torch.save
+    lv = tf.to_literal(ctx, python_val, torch.Tensor, tf.get_literal_type(torch.Tensor))
+    assert not lv.scalar.blob.uri.endswith(".safetensors")
+
+    output = tf.to_python_value(ctx, lv, torch.Tensor)
+    assert output.dtype == python_val.dtype
+    assert output.layout == python_val.layout
+    assert torch.equal(output.cpu().to_dense(), python_val.to_dense())
+
+
+def test_save_and_load_tensors(tmp_path):
+    tensors = {"a": torch.arange(3, dtype=torch.int8), "b": torch.rand(2, 3), "c": torch.rand(4, 4).t()}
+    path = str(tmp_path / "t.safetensors")
+    with open(path, "wb") as f:
+        save_tensors(tensors, f, metadata={"format": "pt"})
+    assert is_safetensors_file(path)
+
+    loaded = load_tensors(path)
+    assert loaded.keys() == tensors.keys()
+    for k, t in tensors.items():
+        assert torch.equal(loaded[k], t)
+    # Changes to memory mapped tensors are not written back
+    loaded["b"].zero_()
+    assert torch.equal(load_tensors(path)["b"], tensors["b"])
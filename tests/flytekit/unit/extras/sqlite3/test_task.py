@@ -10,6 +10,7 @@ from flytekit.extras.sqlite3.task import SQLite3Config, SQLite3Task
 
 # https://www.sqlitetutorial.net/sqlite-sample-database/
 from flytekit.types.schema import FlyteSchema
+from flytekit.types.structured.structured_dataset import StructuredDataset
 
 ctx = context_manager.FlyteContextManager.current_context()
 EXAMPLE_DB = os.path.join(os.path.dirname(os.path.realpath(__file__)), "chinook.zip")
@@ -143,3 +144,33 @@ def test_query_sanitization(query_template, expected_query):
         ),
     )
     assert sql_task.query_template == expected_query
+
+
+def test_task_chunked():
+    sql_task = SQLite3Task(
+        "test",
+        query_template="select TrackId, Name from tracks order by TrackId limit {{.inputs.limit}}",
+        inputs=kwtypes(limit=int),
+        output_schema_type=StructuredDataset,
+        task_config=SQLite3Config(uri=EXAMPLE_DB, compressed=True, chunksize=4),
+    )
+    tt = sql_task.serialize_to_model(sql_task.SERIALIZE_SETTINGS)
+    assert tt.custom["chunksize"] == 4
+
+    sd = sql_task(limit=10)
+    assert sorted(f for f in os.listdir(sd.literal.uri) if not f.startswith("_")) == ["00000", "00001", "00002"]
+    df = sd.open(pandas.DataFrame).all()
+    assert df["TrackId"].tolist() == list(range(1, 11))
+
+    with pytest.raises(ValueError):
+        SQLite3Task(
+            "test",
+            query_template="select * from tracks",
+            task_config=SQLite3Config(uri=EXAMPLE_DB, compressed=True, chunksize=4),
+        )
+
+
+def test_local_db_reuse():
+    from flytekit.extras.sqlite3.task import _get_local_db
+
+    assert _get_local_db(EXAMPLE_DB, True) == _get_local_db(EXAMPLE_DB, True)
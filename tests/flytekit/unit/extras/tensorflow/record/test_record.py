@@ -1,3 +1,4 @@
+import os
 from typing import Dict, Tuple
 
 import numpy as np
@@ -6,6 +7,8 @@ from tensorflow.python.data.ops.readers import TFRecordDatasetV2
 from typing_extensions import Annotated
 
 from flytekit import task, workflow
+from flytekit.core.context_manager import FlyteContextManager
+from flytekit.core.type_engine import TypeEngine
 from flytekit.extras.tensorflow.record import TFRecordDatasetConfig
 from flytekit.types.directory import TFRecordsDirectory
 from flytekit.types.file import TFRecordFile
@@ -115,3 +118,55 @@ def test_wf():
     assert np.array_equal(np.sort(dir_res["a"]), np.array([b"bar", b"foo", b"ham", b"spam"]))
     assert np.array_equal(np.sort(dir_res["b"]), np.array([1.0, 2.0, 8.0, 9.0]))
     assert np.array_equal(np.sort(dir_res["c"]), np.array([3, 4, 22, 23]))
+
+
+@task
+def generate_sharded_tf_record_dir() -> (
+    Annotated[TFRecordsDirectory, TFRecordDatasetConfig(sharded=True, num_shards=1)]
+):
+    return [tf.train.Example(features=features1), tf.train.Example(features=features2)]
+
+
+@task
+def t6(dataset: Annotated[TFRecordsDirectory, TFRecordDatasetConfig(sharded=True)]) -> Dict[str, np.ndarray]:
+    assert isinstance(dataset, TFRecordDatasetV2)
+    assert dataset._num_parallel_reads == tf.data.AUTOTUNE
+    return decode_fn(dataset)
+
+
+@workflow
+def sharded_wf() -> Tuple[Dict[str, np.ndarray], Dict[str, np.ndarray]]:
+    return t6(dataset=generate_sharded_tf_record_dir()), t6(dataset=generate_tf_record_dir())
+
+
+def test_sharded_wf():
+    for res in sharded_wf():
+        assert np.array_equal(np.sort(res["a"]), np.array([b"bar", b"foo", b"ham", b"spam"]))
+        assert np.array_equal(np.sort(res["c"]), np.array([3, 4, 22, 23]))
+
+
+@task
+def generate_empty_sharded_tf_record_dir() -> Annotated[TFRecordsDirectory, TFRecordDatasetConfig(sharded=True)]:
+    return []
+
+
+@task
+def count_sharded_records(dataset: Annotated[TFRecordsDirectory, TFRecordDatasetConfig(sharded=True)]) -> int:
+    return sum(1 for _ in dataset)
+
+
+@task
+def count_records(dataset: TFRecordsDirectory) -> int:
+    return sum(1 for _ in dataset)
+
+
+def test_empty_sharded():
+    ctx = FlyteContextManager.current_context()
+    python_type = Annotated[TFRecordsDirectory, TFRecordDatasetConfig(sharded=True)]
+    lv = TypeEngine.to_literal(ctx, [], python_type, TypeEngine.to_literal_type(python_type))
+    # An empty shard is written, so that the directory exists wherever it is stored
+    assert os.listdir(lv.scalar.blob.uri) == ["part_0.tfrecord"]
+
+    assert count_sharded_records(dataset=generate_empty_sharded_tf_record_dir()) == 0
+    # The directory is downloaded when it isn't read as shards
+    assert count_records(dataset=generate_empty_sharded_tf_record_dir()) == 0
@@ -0,0 +1,70 @@
+import time
+
+import mock
+
+from flytekit.configuration import StatsConfig
+from flytekit.interfaces.stats import client
+from flytekit.interfaces.stats.client import BufferedStatsClient
+from flytekit.interfaces.stats.taggable import TaggableStats
+
+
+def _buffered_client(**kwargs) -> BufferedStatsClient:
+    c = BufferedStatsClient(flush_interval=3600, **kwargs)
+    c._send = mock.MagicMock()
+    return c
+
+
+def _sent(c: BufferedStatsClient):
+    return [line for call in c._send.call_args_list for line in call.args[0].split("\n")]
+
+
+def test_buffered_client_aggregates():
+    c = _buffered_client()
+    for _ in range(10):
+        c.incr("a")
+    c.decr("b", 2)
+    c.gauge("g", 1)
+    c.gauge("g", -5)
+    c.timing("t", 1)
+    c.timing("t", 2)
+    with c.pipeline() as p:
+        p.incr("p")
+    c._send.assert_not_called()
+
+    c.flush()
+    assert c._send.call_count == 1
+    assert sorted(_sent(c)) == sorted(
+        ["t:1.000000|ms", "t:2.000000|ms", "p:1|c", "a:10|c", "b:-2|c", "g:0|g", "g:-5|g"]
+    )
+
+    c.flush()
+    assert c._send.call_count == 1
+
+
+def test_buffered_client_flushes_on_size():
+    c = _buffered_client(max_buffered=3, maxudpsize=20)
+    for i in range(3):
+        c.timing(f"t{i}", 1)
+    # The background thread sends the metrics without waiting for the interval, every line needs a packet of its own
+    # with the small udp size
+    deadline = time.monotonic() + 5
+    while c._send.call_count < 3 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert c._send.call_count == 3
+
+
+def test_taggable_stats_with_buffered_client():
+    c = _buffered_client()
+    stats = TaggableStats(client.StatsClientProxy(c, "p"), "p", StatsConfig(), tags={"k": "v.1"})
+    stats.incr("a", tags={"x": "y"})
+    stats.incr("a", tags={"x": "y"})
+    c.flush()
+    assert _sent(c) == ["p.a.__k=v_1.__x=y:2|c"]
+
+
+def test_tag_suffix_cache():
+    proxy = client.ScopeableStatsProxy(_buffered_client())
+    tags = {"b": "1", "a": "x:y"}
+    assert proxy._tag_suffix(tags) == ".__a=x_y.__b=1"
+    assert proxy._tag_suffix(dict(tags)) is proxy._tag_suffix(tags)
+    assert proxy._serialize_tags("m", tags) == "m" + proxy._tag_suffix(tags)
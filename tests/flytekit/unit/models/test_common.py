@@ -103,3 +103,77 @@ def test_auth_role_empty():
     x = obj.to_flyte_idl()
     y = _common.AuthRole.from_flyte_idl(x)
     assert y == obj
+
+
+def test_cached_idl():
+    from flytekit.models import literals, types
+    from flytekit.models.core import identifier
+
+    def lt():
+        return types.LiteralType(collection_type=types.LiteralType(simple=types.SimpleType.INTEGER))
+
+    a, b = lt(), lt()
+    assert a == b and hash(a) == hash(b)
+    assert a.to_flyte_idl() == b.to_flyte_idl()
+    assert a._idl_cache() is not None and a.collection_type._idl_cache() is not None
+
+    # Callers can't change the cached protobuf
+    pb = a.to_flyte_idl()
+    pb.collection_type.simple = types.SimpleType.STRING
+    assert a == b
+
+    # Models are cached once they were converted twice
+    c = lt()
+    assert c.to_flyte_idl() is not None and c._idl_cache() is None
+    pb = c.to_flyte_idl()
+    assert c._idl_cache() is not None
+    pb.collection_type.simple = types.SimpleType.STRING
+    assert c == lt()
+
+    # Assigning an attribute of a contained model invalidates the containing model
+    a.collection_type.metadata = {"k": "v"}
+    assert a != b
+    assert a.to_flyte_idl().collection_type.metadata["k"] == "v"
+    assert types.LiteralType.from_flyte_idl(a.to_flyte_idl()) == a
+
+    # Attributes assigned directly are noticed by the model itself
+    i = identifier.Identifier(identifier.ResourceType.TASK, "p", "d", "n", "v")
+    assert i == identifier.Identifier(identifier.ResourceType.TASK, "p", "d", "n", "v") and i._idl_cache() is None
+    assert hash(i) and i._idl_cache() is not None
+    i._project = "p2"
+    assert i.to_flyte_idl().project == "p2"
+
+    # And by the models containing it
+    sd = literals.Literal(
+        scalar=literals.Scalar(
+            structured_dataset=literals.StructuredDataset(
+                uri="s3://a", metadata=literals.StructuredDatasetMetadata(types.StructuredDatasetType(format="csv"))
+            )
+        )
+    )
+    assert hash(sd) and hash(sd) and sd._idl_cache() is not None
+    sd.scalar.structured_dataset.metadata._structured_dataset_type._format = "parquet"
+    assert sd.to_flyte_idl().scalar.structured_dataset.metadata.structured_dataset_type.format == "parquet"
+    sd.scalar.structured_dataset._uri = "s3://b"
+    assert sd.to_flyte_idl().scalar.structured_dataset.uri == "s3://b"
+
+    lv = literals.Literal(scalar=literals.Scalar(primitive=literals.Primitive(integer=1)))
+    assert lv.to_flyte_idl().hash == ""
+    lv.hash = "h"
+    assert lv.to_flyte_idl().hash == "h"
+
+    # Models holding lists of models can be changed in place, so they are not cached
+    c = literals.LiteralCollection([lv])
+    assert len(c.to_flyte_idl().literals) == 1
+    c.literals.append(lv)
+    assert len(c.to_flyte_idl().literals) == 2
+    assert c._idl_cache() is None
+
+    # Copies don't share the cache
+    import copy
+    import pickle
+
+    d = copy.deepcopy(a)
+    assert d._idl_cache() is None
+    assert d == a
+    assert pickle.loads(pickle.dumps(a)) == a
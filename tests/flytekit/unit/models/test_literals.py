@@ -1,8 +1,11 @@
+import copy
+import pickle
 from datetime import datetime, timedelta
 
 import pytest
 import pytz
 
+from flytekit.models import common as _common
 from flytekit.models import literals
 from flytekit.models import types as _types
 from tests.flytekit.common import parameterizers
@@ -526,3 +529,40 @@ def test_literal_collection(literal_value_pair):
     assert obj == obj2
     assert all(ll == lit for ll in obj.literals)
     assert len(obj.literals) == 3
+
+
+def test_lazy_literal_map():
+    def lit(i):
+        return literals.Literal(scalar=literals.Scalar(primitive=literals.Primitive(integer=i)))
+
+    pb = literals.LiteralMap(
+        {
+            "c": literals.Literal(collection=literals.LiteralCollection([lit(1), lit(2)])),
+            "m": literals.Literal(map=literals.LiteralMap({"x": lit(3)})),
+        }
+    ).to_flyte_idl()
+
+    # Nothing is converted until it is accessed, copies of the protobuf are returned until then
+    obj = literals.LiteralMap.from_flyte_idl(pb)
+    assert obj._literals is _common.UNLOADED
+    assert obj.to_flyte_idl() == pb and obj.to_flyte_idl() is not pb
+    assert obj.literals["c"]._collection is _common.UNLOADED
+    assert obj.to_flyte_idl() == pb
+    assert obj.literals["c"].collection.literals[1].scalar.primitive.integer == 2
+    assert obj.literals["m"].map.literals["x"].value.value.value == 3
+    assert obj.to_flyte_idl() == pb
+    assert obj == literals.LiteralMap.from_flyte_idl(pb)
+
+    # Changes are noticed by the models containing them
+    obj = literals.LiteralMap.from_flyte_idl(pb)
+    obj.literals["c"].collection.literals.append(lit(4))
+    assert len(obj.to_flyte_idl().literals["c"].collection.literals) == 3
+    obj.literals["m"].hash = "h"
+    assert obj.to_flyte_idl().literals["m"].hash == "h"
+    del obj.literals["c"]
+    assert list(obj.to_flyte_idl().literals) == ["m"]
+    assert len(pb.literals) == 2
+
+    obj = literals.LiteralMap.from_flyte_idl(pb)
+    assert pickle.loads(pickle.dumps(obj)) == obj
+    assert copy.deepcopy(obj).literals["m"].map.literals["x"] == lit(3)
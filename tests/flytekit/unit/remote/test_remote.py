@@ -175,6 +175,41 @@ def test_passing_of_kwargs(mock_client):
     assert mock_client.call_args[1] == additional_args
 
 
+def test_register_script_reuses_bundle(remote, tmp_path, monkeypatch):
+    monkeypatch.setenv("HOME", str(tmp_path / "home"))
+    source = tmp_path / "src"
+    source.mkdir()
+    (source / "wf.py").write_text("print('hello')")
+
+    @task
+    def t1() -> int:
+        return 1
+
+    def register(exists=True):
+        with patch.object(
+            remote, "upload_file", return_value=(b"md5", "s3://bucket/fast.tar.gz")
+        ) as upload, patch.object(remote, "_remote_file_exists", return_value=exists), patch.object(
+            remote, "register_task"
+        ) as register_task:
+            remote.register_script(t1, source_path=str(source), copy_all=True)
+        return upload, register_task.call_args[0][1].fast_serialization_settings.distribution_location
+
+    upload, location = register()
+    upload.assert_called_once()
+    assert location == "s3://bucket/fast.tar.gz"
+    # The same sources are neither packaged nor uploaded again
+    upload, location = register()
+    upload.assert_not_called()
+    assert location == "s3://bucket/fast.tar.gz"
+    # Unless the uploaded bundle is gone
+    upload, _ = register(exists=False)
+    upload.assert_called_once()
+    # Or the sources changed
+    (source / "wf.py").write_text("print('bye')")
+    upload, _ = register()
+    upload.assert_called_once()
+
+
 @patch("flytekit.remote.remote.SynchronousFlyteClient")
 def test_more_stuff(mock_client):
     r = FlyteRemote(config=Config.auto(), default_project="project", default_domain="domain")
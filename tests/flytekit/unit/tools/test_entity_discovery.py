@@ -0,0 +1,64 @@
+import textwrap
+
+from flytekit.tools.entity_discovery import find_entities
+
+
+def test_find_entities(tmp_path):
+    (tmp_path / "lib.py").write_text(
+        textwrap.dedent(
+            """
+            from flytekit import task, workflow
+
+            @task
+            def lib_t(a: int) -> int:
+                return a
+
+            @workflow
+            def lib_wf(a: int) -> int:
+                return lib_t(a=a)
+
+            def helper():
+                pass
+            """
+        )
+    )
+    path = tmp_path / "wf.py"
+    path.write_text(
+        textwrap.dedent(
+            """
+            import flytekit as fl
+            from flytekit import dynamic, map_task, Workflow
+            from flytekit.extras.tasks.shell import ShellTask
+            from lib import lib_t, lib_wf as other_wf, helper
+            import pandas as pd
+
+            @fl.task(cache=True)
+            def t1(a: int) -> int:
+                return a
+
+            @dynamic
+            async def d1(a: int):
+                pass
+
+            shell = ShellTask(name="shell", script="echo")
+            mapped = map_task(t1)
+            imperative = Workflow(name="imperative")
+            df = pd.DataFrame()
+
+            @fl.workflow
+            def wf(a: int) -> int:
+                return t1(a=a)
+
+            def not_an_entity():
+                pass
+            """
+        )
+    )
+    assert find_entities(str(path)) == (["imperative", "other_wf", "wf"], ["d1", "lib_t", "mapped", "shell", "t1"])
+
+
+def test_find_entities_unparsable(tmp_path):
+    path = tmp_path / "wf.py"
+    path.write_text("def broken(:\n")
+    assert find_entities(str(path)) is None
+    assert find_entities(str(tmp_path / "missing.py")) is None
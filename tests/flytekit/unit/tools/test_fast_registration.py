@@ -1,13 +1,17 @@
 import os
+import pathlib
 import subprocess
 import tarfile
+from concurrent.futures import ThreadPoolExecutor
 
+import mock
 import pytest
 
 from flytekit.tools.fast_registration import (
     FAST_FILEENDING,
     FAST_PREFIX,
     compute_digest,
+    download_distribution,
     fast_package,
     get_additional_distribution_loc,
 )
@@ -105,3 +109,65 @@ def test_digest_change(flyte_project):
 
 def test_get_additional_distribution_loc():
     assert get_additional_distribution_loc("s3://my-s3-bucket/dir", "123abc") == "s3://my-s3-bucket/dir/123abc.tar.gz"
+
+
+def test_download_distribution(flyte_project, tmp_path):
+    archive_fname = fast_package(source=flyte_project / "src", output_dir=tmp_path)
+    dest = tmp_path / "dest"
+    os.makedirs(dest / "workflows")
+    (dest / "workflows" / "hello_world.py").write_text("old")
+    download_distribution(archive_fname, str(dest))
+    assert (dest / "workflows" / "hello_world.py").read_text() == "print('Hello World!')"
+    assert os.path.islink(dest / "util")
+
+    with pytest.raises(RuntimeError):
+        download_distribution(str(tmp_path / "code.zip"), str(dest))
+
+
+def test_download_distribution_cached(flyte_project, tmp_path):
+    archive_fname = fast_package(source=flyte_project / "src", output_dir=tmp_path)
+    cache_dir = tmp_path / "cache"
+    with mock.patch.dict(os.environ, {"FLYTE_SDK_FAST_REGISTRATION_CACHE": str(cache_dir)}):
+        with ThreadPoolExecutor(4) as pool:
+            dests = [str(tmp_path / f"dest{i}") for i in range(4)]
+            for d in dests:
+                os.makedirs(d)
+            list(pool.map(lambda d: download_distribution(archive_fname, d), dests))
+        for d in dests:
+            assert pathlib.Path(d, "workflows", "hello_world.py").read_text() == "print('Hello World!')"
+        # Only one extracted copy is kept
+        assert len([f for f in os.listdir(cache_dir) if not f.endswith(".lock")]) == 1
+
+        # The distribution is not downloaded again
+        os.makedirs(tmp_path / "dest")
+        with mock.patch("flytekit.tools.fast_registration._extract_distribution") as extract:
+            download_distribution(archive_fname, str(tmp_path / "dest"))
+            extract.assert_not_called()
+        assert (tmp_path / "dest" / "workflows" / "hello_world.py").exists()
+
+
+def test_download_distribution_cached_mode(flyte_project, tmp_path):
+    archive_fname = fast_package(source=flyte_project / "src", output_dir=tmp_path)
+    cache_dir = tmp_path / "cache"
+    dest = tmp_path / "dest"
+    os.makedirs(dest)
+    os.chmod(dest, 0o775)
+    with mock.patch.dict(os.environ, {"FLYTE_SDK_FAST_REGISTRATION_CACHE": str(cache_dir)}):
+        download_distribution(archive_fname, str(dest))
+    # Other users sharing the cache can read the extracted distribution
+    (cached,) = [f for f in os.listdir(cache_dir) if not f.endswith(".lock")]
+    assert os.stat(cache_dir / cached).st_mode & 0o777 == 0o755
+    # The mode of the destination is kept
+    assert os.stat(dest).st_mode & 0o777 == 0o775
+    assert (dest / "workflows" / "hello_world.py").read_text() == "print('Hello World!')"
+    assert os.path.islink(dest / "util")
+
+
+def test_digest_ignored_directory(flyte_project):
+    ignore = IgnoreGroup(flyte_project, [GitIgnore, DockerIgnore, StandardIgnore])
+    digest1 = compute_digest(flyte_project, ignore.is_ignored)
+
+    # Files in ignored directories don't matter, even if they don't match the patterns themselves
+    (flyte_project / "src" / "workflows" / "__pycache__" / "notes.txt").write_text("I don't matter")
+    ignore = IgnoreGroup(flyte_project, [GitIgnore, DockerIgnore, StandardIgnore])
+    assert compute_digest(flyte_project, ignore.is_ignored) == digest1
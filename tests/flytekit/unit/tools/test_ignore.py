@@ -1,5 +1,6 @@
 import os
 import subprocess
+from fnmatch import fnmatch
 from pathlib import Path
 from tarfile import TarInfo
 from typing import Dict
@@ -233,3 +234,40 @@ def test_all_ignore_tar_filter(all_ignore):
     assert ignore.tar_filter(TarInfo(name=".gitignore")).name == ".gitignore"
     assert ignore.tar_filter(TarInfo(name=".dockerignore")).name == ".dockerignore"
     assert not ignore.tar_filter(TarInfo(name=".git"))
+
+
+def test_gitignore_directory(tmp_path):
+    tree = {
+        ".venv": {"lib": {"site-packages": {"pkg.py": ""}}},
+        "src": {"empty": {}, "app.py": ""},
+        "empty": {"nested": {}},
+        ".gitignore": ".venv",
+    }
+    make_tree(tmp_path, tree)
+    subprocess.run(["git", "init", str(tmp_path)])
+    gitignore = GitIgnore(tmp_path)
+    # Ignored directories are listed once, not file by file
+    assert ".venv/" in gitignore.ignored
+    assert gitignore.is_ignored(".venv")
+    assert gitignore.is_ignored(".venv/lib/site-packages/pkg.py")
+    assert not gitignore.is_ignored("src")
+    assert not gitignore.is_ignored("src/app.py")
+    assert gitignore.is_ignored("src/empty")
+    assert gitignore.is_ignored("empty")
+
+
+def test_standard_ignore_compiled():
+    patterns = ["*.pyc", ".cache", ".cache/*", "__pycache__", "**/__pycache__", "*.foo"]
+    ignore = StandardIgnore(root=".", patterns=patterns)
+    for path in ["a.py", "a.pyc", "x/y.pyc", ".cache", ".cache/x", "x/.cache", "__pycache__", "x/__pycache__", "a.foo"]:
+        assert ignore.is_ignored(path) == any(fnmatch(path, p) for p in patterns)
+
+
+def test_all_ignore_walk(all_ignore):
+    ignore = IgnoreGroup(all_ignore, [GitIgnore, DockerIgnore, StandardIgnore])
+    walked = [(os.path.relpath(root, all_ignore), dirs, files) for root, dirs, files in ignore.walk()]
+    # Ignored directories are not descended into
+    assert walked == [
+        (".", ["sub"], [".dockerignore", ".gitignore", "keep.foo"]),
+        ("sub", [], ["some.bar"]),
+    ]
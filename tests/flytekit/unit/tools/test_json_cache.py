@@ -0,0 +1,26 @@
+import os
+
+from flytekit.tools.json_cache import read_json, write_json
+
+
+def test_read_write_json(tmp_path):
+    path = str(tmp_path / "cache" / "entries.json")
+    assert read_json(path) == {}
+    write_json(path, {"a": 1})
+    assert read_json(path) == {"a": 1}
+    write_json(path, {"b": [2]})
+    assert read_json(path) == {"b": [2]}
+    # No temporary files are left behind
+    assert os.listdir(tmp_path / "cache") == ["entries.json"]
+
+    with open(path, "w") as f:
+        f.write("{")
+    assert read_json(path) == {}
+
+
+def test_write_json_failure(tmp_path):
+    (tmp_path / "file").write_text("")
+    # The parent of the cache file is not a directory, so it can't be written
+    path = str(tmp_path / "file" / "entries.json")
+    write_json(path, {"a": 1})
+    assert read_json(path) == {}
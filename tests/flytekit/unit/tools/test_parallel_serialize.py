@@ -0,0 +1,99 @@
+import os
+import pathlib
+
+import mock
+import pytest
+
+from flytekit.configuration import DefaultImages, ImageConfig, SerializationSettings
+from flytekit.models.launch_plan import LaunchPlan
+from flytekit.tools import module_loader
+from flytekit.tools.parallel_serialize import _subtrees, serialize_modules
+from flytekit.tools.repo import serialize
+
+tasks_text = """
+from flytekit import task
+
+@task
+def t1(a: int) -> int:
+    return a
+"""
+
+workflow_text = """
+from flytekit import workflow
+from proj.tasks.t import t1
+
+@workflow
+def wf(a: int) -> int:
+    return t1(a=t1(a=a))
+"""
+
+
+@pytest.fixture
+def project(tmp_path):
+    for d in ["proj", "proj/tasks", "proj/workflows"]:
+        os.makedirs(tmp_path / d)
+        pathlib.Path(tmp_path / d / "__init__.py").touch()
+    (tmp_path / "proj/tasks/t.py").write_text(tasks_text)
+    (tmp_path / "proj/workflows/w.py").write_text(workflow_text)
+    return tmp_path
+
+
+@pytest.fixture
+def settings():
+    return SerializationSettings(
+        project="project",
+        domain="domain",
+        version="version",
+        image_config=ImageConfig.auto(img_name=DefaultImages.default_image()),
+    )
+
+
+def _id(e):
+    return e.id if isinstance(e, LaunchPlan) else e.template.id
+
+
+def _names(entities):
+    return sorted((type(e).__name__, _id(e).name) for e in entities)
+
+
+def test_list_modules(project):
+    with module_loader.add_sys_path(str(project)):
+        modules = module_loader.list_modules(["proj", "proj.tasks"])
+    assert [m for m, _ in modules] == ["proj", "proj.tasks", "proj.tasks.t", "proj.workflows", "proj.workflows.w"]
+    assert modules[2][1] == str(project / "proj/tasks/t.py")
+
+
+def test_subtrees():
+    assert _subtrees(["a", "a.b", "a.b.c", "a.d", "x.y"], ["a", "x.y"]) == [["a"], ["a.b", "a.b.c"], ["a.d"], ["x.y"]]
+
+
+def test_serialize_modules(project, settings, tmp_path):
+    cache_dir = str(tmp_path / "cache")
+    entities = serialize(["proj"], settings, str(project), workers=2, cache_dir=cache_dir)
+    assert _names(entities) == [
+        ("LaunchPlan", "proj.workflows.w.wf"),
+        ("TaskSpec", "proj.tasks.t.t1"),
+        ("WorkflowSpec", "proj.workflows.w.wf"),
+    ]
+    # The task the workflow depends on comes first
+    assert [type(e).__name__ for e in entities] == ["TaskSpec", "WorkflowSpec", "LaunchPlan"]
+
+    # Nothing is loaded again while the files are unchanged
+    with mock.patch("flytekit.tools.parallel_serialize.ProcessPoolExecutor", side_effect=AssertionError):
+        assert serialize_modules(["proj"], settings, str(project), cache_dir=cache_dir) == entities
+
+    # The workflow module depends on the tasks module, so both are loaded again
+    (project / "proj/tasks/t.py").write_text(tasks_text.replace("def t1", "def t2").replace("t1", "t2"))
+    (project / "proj/workflows/w.py").write_text(workflow_text.replace("t1", "t2"))
+    entities = serialize_modules(["proj"], settings, str(project), cache_dir=cache_dir)
+    assert _names(entities) == [
+        ("LaunchPlan", "proj.workflows.w.wf"),
+        ("TaskSpec", "proj.tasks.t.t2"),
+        ("WorkflowSpec", "proj.workflows.w.wf"),
+    ]
+
+    # Other settings don't use the same entries
+    b = settings.new_builder()
+    b.version = "v2"
+    entities = serialize_modules(["proj"], b.build(), str(project), cache_dir=cache_dir)
+    assert {_id(e).version for e in entities} == {"v2"}
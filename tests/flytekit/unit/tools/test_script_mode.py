@@ -1,8 +1,9 @@
+import gzip
 import os
 import subprocess
 import sys
 
-from flytekit.tools.script_mode import compress_scripts, hash_file
+from flytekit.tools.script_mode import compress_scripts, gzip_file, hash_file
 
 MAIN_WORKFLOW = """
 from flytekit import task, workflow
@@ -98,3 +99,16 @@ def test_deterministic_hash(tmp_path):
     assert len(next(os.walk(test_dir))[1]) == 3
 
     compress_scripts(str(workflows_dir.parent), str(destination), "workflows.imperative_wf")
+
+
+def test_gzip_file(tmp_path):
+    source = tmp_path / "source"
+    for size in [0, 10, 1000, 1001, 4500]:
+        data = os.urandom(size // 2) + b"a" * (size - size // 2)
+        source.write_bytes(data)
+        gzip_file(source, tmp_path / "out1.gz", chunk_size=1000, max_workers=2)
+        gzip_file(source, tmp_path / "out2.gz", chunk_size=1000, max_workers=3)
+        # The chunks are compressed in parallel into a single deterministic stream
+        assert gzip.decompress((tmp_path / "out1.gz").read_bytes()) == data
+        assert (tmp_path / "out1.gz").read_bytes() == (tmp_path / "out2.gz").read_bytes()
+        subprocess.run(["gzip", "-t", str(tmp_path / "out1.gz")]).check_returncode()